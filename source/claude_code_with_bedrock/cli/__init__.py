@@ -3,81 +3,63 @@
 
 """Command-line interface for Claude Code with Bedrock."""
 
+from importlib import import_module
+
 from cleo.application import Application
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
 
-from .commands.builds import BuildsCommand
-from .commands.cleanup import CleanupCommand
-from .commands.context import (
-    ConfigExportCommand,
-    ConfigImportCommand,
-    ConfigValidateCommand,
-    ContextCurrentCommand,
-    ContextListCommand,
-    ContextShowCommand,
-    ContextUseCommand,
-)
-from .commands.deploy import DeployCommand
-from .commands.destroy import DestroyCommand
-from .commands.distribute import DistributeCommand
-from .commands.init import InitCommand
-from .commands.package import PackageCommand
-from .commands.quota import (
-    QuotaDeleteCommand,
-    QuotaExportCommand,
-    QuotaImportCommand,
-    QuotaListCommand,
-    QuotaSetDefaultCommand,
-    QuotaSetGroupCommand,
-    QuotaSetUserCommand,
-    QuotaShowCommand,
-    QuotaUnblockCommand,
-    QuotaUsageCommand,
-)
-from .commands.status import StatusCommand
-from .commands.test import TestCommand
+# Command name -> (module in .commands, class name). Modules are imported only when their command is
+# looked up, so running one command doesn't import every other command's dependencies (boto3, etc.)
+COMMANDS = {
+    "init": ("init", "InitCommand"),
+    "deploy": ("deploy", "DeployCommand"),
+    "status": ("status", "StatusCommand"),
+    "test": ("test", "TestCommand"),
+    "package": ("package", "PackageCommand"),
+    "builds": ("builds", "BuildsCommand"),
+    "distribute": ("distribute", "DistributeCommand"),
+    "destroy": ("destroy", "DestroyCommand"),
+    "cleanup": ("cleanup", "CleanupCommand"),
+    # "token": TokenCommand temporarily disabled - not implemented
+    # Context management commands
+    "context list": ("context", "ContextListCommand"),
+    "context current": ("context", "ContextCurrentCommand"),
+    "context use": ("context", "ContextUseCommand"),
+    "context show": ("context", "ContextShowCommand"),
+    # Config management commands
+    "config validate": ("context", "ConfigValidateCommand"),
+    "config export": ("context", "ConfigExportCommand"),
+    "config import": ("context", "ConfigImportCommand"),
+    # Quota management commands
+    "quota set-user": ("quota", "QuotaSetUserCommand"),
+    "quota set-group": ("quota", "QuotaSetGroupCommand"),
+    "quota set-default": ("quota", "QuotaSetDefaultCommand"),
+    "quota list": ("quota", "QuotaListCommand"),
+    "quota delete": ("quota", "QuotaDeleteCommand"),
+    "quota show": ("quota", "QuotaShowCommand"),
+    "quota usage": ("quota", "QuotaUsageCommand"),
+    "quota unblock": ("quota", "QuotaUnblockCommand"),
+    "quota export": ("quota", "QuotaExportCommand"),
+    "quota import": ("quota", "QuotaImportCommand"),
+}
 
-# TokenCommand temporarily disabled - not implemented
 
+def _command_factory(module_name: str, class_name: str):
+    """Build a factory that imports and instantiates a command on first use."""
 
-def create_application() -> Application:
-    """Create the CLI application."""
-    application = Application("claude-code-with-bedrock", "1.0.0")
+    def factory():
+        module = import_module(f".commands.{module_name}", __name__)
+        return getattr(module, class_name)()
 
-    # Add commands
-    application.add(InitCommand())
-    application.add(DeployCommand())
-    application.add(StatusCommand())
-    application.add(TestCommand())
-    application.add(PackageCommand())
-    application.add(BuildsCommand())
-    application.add(DistributeCommand())
-    application.add(DestroyCommand())
-    application.add(CleanupCommand())
-    # application.add(TokenCommand())  # Temporarily disabled
+    return factory
 
-    # Context management commands
-    application.add(ContextListCommand())
-    application.add(ContextCurrentCommand())
-    application.add(ContextUseCommand())
-    application.add(ContextShowCommand())
-
-    # Config management commands
-    application.add(ConfigValidateCommand())
-    application.add(ConfigExportCommand())
-    application.add(ConfigImportCommand())
-
-    # Quota management commands
-    application.add(QuotaSetUserCommand())
-    application.add(QuotaSetGroupCommand())
-    application.add(QuotaSetDefaultCommand())
-    application.add(QuotaListCommand())
-    application.add(QuotaDeleteCommand())
-    application.add(QuotaShowCommand())
-    application.add(QuotaUsageCommand())
-    application.add(QuotaUnblockCommand())
-    application.add(QuotaExportCommand())
-    application.add(QuotaImportCommand())
 
+def create_application() -> Application:
+    """Create the CLI application."""
+    application = Application("claude-code-with-bedrock", "1.0.0")
+    application.set_command_loader(
+        FactoryCommandLoader({name: _command_factory(*target) for name, target in COMMANDS.items()})
+    )
     return application
 
 
@@ -3,20 +3,24 @@
 
 """CLI commands for Claude Code with Bedrock."""
 
-from .builds import BuildsCommand
-from .deploy import DeployCommand
-from .destroy import DestroyCommand
-from .init import InitCommand
-from .package import PackageCommand
-from .status import StatusCommand
-from .test import TestCommand
+from importlib import import_module
 
-__all__ = [
-    "InitCommand",
-    "DeployCommand",
-    "StatusCommand",
-    "TestCommand",
-    "PackageCommand",
-    "BuildsCommand",
-    "DestroyCommand",
-]
+# Exported command -> defining module; resolved on first access so importing one command module
+# doesn't import the others
+_EXPORTS = {
+    "InitCommand": "init",
+    "DeployCommand": "deploy",
+    "StatusCommand": "status",
+    "TestCommand": "test",
+    "PackageCommand": "package",
+    "BuildsCommand": "builds",
+    "DestroyCommand": "destroy",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,10 +3,13 @@
 
 """Deploy command - Deploy AWS infrastructure using boto3."""
 
+import json
 import os
 import re
-import subprocess
 import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cached_property
 from pathlib import Path
 
 from cleo.commands.command import Command
@@ -14,10 +17,10 @@ from cleo.helpers import argument, option
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn
 from rich.table import Table
 
-from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
+from claude_code_with_bedrock.cli.utils.aws import get_account_id, get_stack_outputs
 from claude_code_with_bedrock.cli.utils.cf_exceptions import (
     CloudFormationError,
     ResourceConflictError,
@@ -25,6 +28,7 @@ from claude_code_with_bedrock.cli.utils.cf_exceptions import (
 )
 from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
 from claude_code_with_bedrock.config import Config
+from claude_code_with_bedrock.utils.url_validation import ensure_url_scheme
 
 
 class DeployCommand(Command):
@@ -47,9 +51,21 @@ class DeployCommand(Command):
         option("show-commands", description="Show AWS CLI commands instead of executing", flag=True),
     ]
 
+    # Informational output (stack parameters, routine checks) is only shown with -v/--verbose
+    verbose = False
+
+    # Seconds to wait for background post-deploy steps before reporting them as still running
+    POST_DEPLOY_TIMEOUT = 30
+    # Attempts for Lambda configuration updates that conflict with an in-progress function update
+    LAMBDA_UPDATE_ATTEMPTS = 3
+
+    _post_deploy_pool: ThreadPoolExecutor | None = None
+    _post_deploy_futures: list[Future] | None = None
+
     def handle(self) -> int:
         """Execute the deploy command."""
         console = Console()
+        self.verbose = self.io.is_verbose()
 
         # Welcome
         console.print(
@@ -239,15 +255,35 @@ class DeployCommand(Command):
         console.print("\n[bold]Deploying stacks...[/bold]\n")
 
         failed = False
-        for stack_type, description in stacks_to_deploy:
-            console.print(f"[bold]{description}[/bold]")
+        # Best-effort post-deploy steps run in the background so the next stack can start
+        self._post_deploy_pool = ThreadPoolExecutor(max_workers=2)
+        self._post_deploy_futures = []
+        try:
+            with Progress(
+                SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+            ) as progress:
+                # Allocate one task per stack up front; each deployment updates its own task in place
+                task_ids = {
+                    stack_type: progress.add_task(description, total=1, start=False, visible=False)
+                    for stack_type, description in stacks_to_deploy
+                }
 
-            result = self._deploy_stack(stack_type, profile, console, cf_manager)
-            if result != 0:
-                failed = True
-                console.print(f"[red]Failed to deploy {stack_type} stack[/red]")
-                break
-            console.print("")
+                for stack_type, description in stacks_to_deploy:
+                    console.print(f"[bold]{description}[/bold]")
+
+                    task_id = task_ids[stack_type]
+                    progress.start_task(task_id)
+                    progress.update(task_id, visible=True)
+                    result = self._deploy_stack(stack_type, profile, console, cf_manager, progress, task_id)
+                    progress.update(task_id, visible=False)
+                    if result != 0:
+                        failed = True
+                        console.print(f"[red]Failed to deploy {stack_type} stack[/red]")
+                        break
+                    console.print("")
+        finally:
+            # Release the pool even if a deployment raised
+            self._wait_for_post_deploy(console)
 
         if failed:
             console.print("\n[red]Deployment failed. Check the errors above.[/red]")
@@ -277,589 +313,552 @@ class DeployCommand(Command):
                     result.append({"ParameterKey": key, "ParameterValue": value})
         return result
 
-    def _deploy_stack(self, stack_type: str, profile, console: Console, cf_manager: CloudFormationManager) -> int:
-        """Deploy a CloudFormation stack using boto3."""
+    def _deploy_stack(
+        self,
+        stack_type: str,
+        profile,
+        console: Console,
+        cf_manager: CloudFormationManager,
+        progress: Progress,
+        task_id: TaskID,
+    ) -> int:
+        """Deploy a CloudFormation stack using boto3.
+
+        Progress for the stack is reported on ``task_id``, which the caller allocates up front.
+        """
         project_root = Path(__file__).parents[4]
 
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            # Common deployment function
-            def deploy_with_cf(
-                template_path, stack_name, params, capabilities=None, task_description="Deploying stack..."
-            ):
-                """Helper function to deploy a stack with CloudFormation manager."""
-                task = progress.add_task(task_description, total=None)
+        # Common deployment function
+        def deploy_with_cf(template_path, stack_name, params, capabilities=None, task_description="Deploying stack..."):
+            """Helper function to deploy a stack with CloudFormation manager."""
+            progress.update(task_id, description=task_description)
 
-                try:
-                    # Convert parameters to boto3 format
-                    boto3_params = self._convert_params_to_boto3(params) if params else None
-                    # Deploy stack
-                    result = cf_manager.deploy_stack(
-                        stack_name=stack_name,
-                        template_path=template_path,
-                        parameters=boto3_params,
-                        capabilities=capabilities or ["CAPABILITY_IAM"],
-                        on_event=lambda e: progress.update(
-                            task,
-                            description=f"{e.get('LogicalResourceId', 'Stack')} - {e.get('ResourceStatus', '')}"
+            try:
+                # Convert parameters to boto3 format
+                boto3_params = self._convert_params_to_boto3(params) if params else None
+                # Deploy stack
+                result = cf_manager.deploy_stack(
+                    stack_name=stack_name,
+                    template_path=template_path,
+                    parameters=boto3_params,
+                    capabilities=capabilities or ["CAPABILITY_IAM"],
+                    on_event=lambda e: progress.update(
+                        task_id,
+                        description=(
+                            f"{e.get('LogicalResourceId', 'Stack')} - {e.get('ResourceStatus', '')}"
                             if isinstance(e, dict)
-                            else str(e),
+                            else str(e)
                         ),
-                    )
-
-                    progress.update(task, completed=True)
+                    ),
+                )
 
-                    if result.success:
-                        console.print(f"[green]✓ {stack_type} stack deployed successfully[/green]")
-                        return 0
-                    else:
-                        console.print(f"[red]✗ Failed to deploy {stack_type} stack: {result.error}[/red]")
-                        return 1
+                progress.update(task_id, completed=1)
 
-                except ResourceConflictError as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[yellow]Resource conflict: {e.message}[/yellow]")
-                    if e.get_cleanup_command():
-                        console.print(f"Run: [cyan]{e.get_cleanup_command()}[/cyan]")
+                if result.success:
+                    console.print(f"[green]✓ {stack_type} stack deployed successfully[/green]")
+                    return 0
+                else:
+                    console.print(f"[red]✗ Failed to deploy {stack_type} stack: {result.error}[/red]")
                     return 1
 
-                except StackRollbackError as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[yellow]Stack rollback: {e.message}[/yellow]")
-                    console.print(f"Recovery: {e.recovery_action}")
-                    return 1
+            except ResourceConflictError as e:
+                progress.update(task_id, completed=1)
+                console.print(f"[yellow]Resource conflict: {e.message}[/yellow]")
+                if e.get_cleanup_command():
+                    console.print(f"Run: [cyan]{e.get_cleanup_command()}[/cyan]")
+                return 1
 
-                except CloudFormationError as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[red]CloudFormation error: {e.message}[/red]")
-                    return 1
+            except StackRollbackError as e:
+                progress.update(task_id, completed=1)
+                console.print(f"[yellow]Stack rollback: {e.message}[/yellow]")
+                console.print(f"Recovery: {e.recovery_action}")
+                return 1
 
-                except Exception as e:
-                    progress.update(task, completed=True)
-                    console.print(f"[red]Unexpected error: {str(e)}[/red]")
-                    return 1
+            except CloudFormationError as e:
+                progress.update(task_id, completed=1)
+                console.print(f"[red]CloudFormation error: {e.message}[/red]")
+                return 1
 
-            # Deploy based on stack type
-            if stack_type == "auth":
-                # Select template based on provider type
-                provider_type = profile.provider_type or "okta"
-                template_map = {
-                    "jumpcloud": "bedrock-auth-jumpcloud.yaml",
-                    "okta": "bedrock-auth-okta.yaml",
-                    "auth0": "bedrock-auth-auth0.yaml",
-                    "azure": "bedrock-auth-azure.yaml",
-                    "cognito": "bedrock-auth-cognito-pool.yaml",
-                }
+            except Exception as e:
+                progress.update(task_id, completed=1)
+                console.print(f"[red]Unexpected error: {str(e)}[/red]")
+                return 1
 
-                template_file = template_map.get(provider_type, "bedrock-auth-okta.yaml")
-                template = project_root / "deployment" / "infrastructure" / template_file
+        # Common package-then-deploy function for templates with local Lambda code
+        def package_and_deploy(
+            template_path, stack_name, s3_bucket, s3_prefix, params, label, task_description, on_success=None
+        ):
+            """Package local Lambda code to S3, deploy the packaged template, and clean up."""
+            progress.update(task_id, description=f"Packaging {label} Lambda functions...")
 
-                # Verify template exists
-                if not template.exists():
-                    console.print(f"[red]Error: Template not found: {template_file}[/red]")
-                    console.print(f"[yellow]Supported provider types: {', '.join(template_map.keys())}[/yellow]")
-                    return 1
+            # Zip and upload local Lambda code concurrently
+            try:
+                packaged_template = cf_manager.package_template(template_path, s3_bucket, s3_prefix)
+            except Exception as e:
+                console.print(f"[red]Failed to package template: {e}[/red]")
+                return 1
 
-                stack_name = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
+            progress.update(task_id, description=f"{label.capitalize()} Lambda functions packaged successfully")
 
-                # Build parameters
-                params = []
-                params.append(f"FederationType={profile.federation_type}")
+            # Write packaged template to a temp file for deployment
+            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+                f.write(packaged_template)
+                packaged_template_path = f.name
 
-                if provider_type == "okta":
-                    params.extend(
-                        [
-                            f"OktaDomain={profile.provider_domain}",
-                            f"OktaClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "jumpcloud":
-                    params.extend(
-                        [
-                            f"JumpCloudDomain={profile.provider_domain}",
-                            f"JumpCloudClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "auth0":
-                    params.extend(
-                        [
-                            f"Auth0Domain={profile.provider_domain}",
-                            f"Auth0ClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "azure":
-                    # Azure uses tenant ID (GUID) instead of full domain
-                    # Support multiple input formats:
-                    # - login.microsoftonline.com/{tenant-id}/v2.0
-                    # - login.microsoftonline.com/{tenant-id}
-                    # - {tenant-id} (just the GUID)
-                    # - https://login.microsoftonline.com/{tenant-id}/v2.0
-
-                    # Extract GUID using regex pattern matching
-                    guid_pattern = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
-                    match = re.search(guid_pattern, profile.provider_domain)
-
-                    if match:
-                        tenant_id = match.group(0)
-                    else:
-                        # If no GUID found, use the provider_domain as-is
-                        # (in case user provided just the GUID but in unexpected format)
-                        tenant_id = profile.provider_domain
+            try:
+                result = deploy_with_cf(packaged_template_path, stack_name, params, task_description=task_description)
 
-                    params.extend(
-                        [
-                            f"AzureTenantId={tenant_id}",
-                            f"AzureClientId={profile.client_id}",
-                        ]
-                    )
-                elif provider_type == "cognito":
-                    # Extract domain prefix from full domain
-                    # e.g., "us-east-1p8mdr8zxe" from "us-east-1p8mdr8zxe.auth.us-east-1.amazoncognito.com"
-                    cognito_domain = (
-                        profile.provider_domain.split(".")[0]
-                        if "." in profile.provider_domain
-                        else profile.provider_domain
-                    )
-                    params.extend(
-                        [
-                            f"CognitoUserPoolId={profile.cognito_user_pool_id}",
-                            f"CognitoUserPoolClientId={profile.client_id}",
-                            f"CognitoUserPoolDomain={cognito_domain}",
-                        ]
-                    )
+                if result == 0 and on_success:
+                    on_success()
+
+                return result
+
+            finally:
+                # Clean up temp file
+                try:
+                    os.unlink(packaged_template_path)
+                except Exception:
+                    pass
+
+        # Deploy based on stack type
+        if stack_type == "auth":
+            # Select template based on provider type
+            provider_type = profile.provider_type or "okta"
+            template_map = {
+                "jumpcloud": "bedrock-auth-jumpcloud.yaml",
+                "okta": "bedrock-auth-okta.yaml",
+                "auth0": "bedrock-auth-auth0.yaml",
+                "azure": "bedrock-auth-azure.yaml",
+                "cognito": "bedrock-auth-cognito-pool.yaml",
+            }
+
+            template_file = template_map.get(provider_type, "bedrock-auth-okta.yaml")
+            template = project_root / "deployment" / "infrastructure" / template_file
+
+            # Verify template exists
+            if not template.exists():
+                console.print(f"[red]Error: Template not found: {template_file}[/red]")
+                console.print(f"[yellow]Supported provider types: {', '.join(template_map.keys())}[/yellow]")
+                return 1
+
+            stack_name = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
 
+            # Build parameters
+            params = []
+            params.append(f"FederationType={profile.federation_type}")
+
+            if provider_type == "okta":
                 params.extend(
                     [
-                        f"IdentityPoolName={profile.identity_pool_name}",
-                        f"AllowedBedrockRegions={','.join(profile.allowed_bedrock_regions)}",
-                        f"EnableMonitoring={str(profile.monitoring_enabled).lower()}",
+                        f"OktaDomain={profile.provider_domain}",
+                        f"OktaClientId={profile.client_id}",
                     ]
                 )
-
-                # Pass distribution bucket ARN for auto-update S3 permissions
-                if profile.auto_update_enabled and profile.enable_distribution:
-                    try:
-                        dist_stack_name = profile.stack_names.get(
-                            "distribution", f"{profile.identity_pool_name}-distribution"
-                        )
-                        dist_outputs = get_stack_outputs(dist_stack_name, profile.aws_region)
-                        dist_bucket_arn = dist_outputs.get("DistributionBucketArn", "") if dist_outputs else ""
-                        if dist_bucket_arn:
-                            params.append(f"DistributionBucketArn={dist_bucket_arn}")
-                    except Exception:
-                        console.print(
-                            "[dim]Note: Distribution stack not yet deployed. "
-                            "Re-run 'ccwb deploy auth' after deploying distribution "
-                            "to enable auto-update S3 permissions.[/dim]"
-                        )
-
-                return deploy_with_cf(
-                    template,
-                    stack_name,
-                    params,
-                    ["CAPABILITY_NAMED_IAM"],
-                    task_description="Deploying authentication stack...",
+            elif provider_type == "jumpcloud":
+                params.extend(
+                    [
+                        f"JumpCloudDomain={profile.provider_domain}",
+                        f"JumpCloudClientId={profile.client_id}",
+                    ]
                 )
+            elif provider_type == "auth0":
+                params.extend(
+                    [
+                        f"Auth0Domain={profile.provider_domain}",
+                        f"Auth0ClientId={profile.client_id}",
+                    ]
+                )
+            elif provider_type == "azure":
+                # Azure uses tenant ID (GUID) instead of full domain
+                # Support multiple input formats:
+                # - login.microsoftonline.com/{tenant-id}/v2.0
+                # - login.microsoftonline.com/{tenant-id}
+                # - {tenant-id} (just the GUID)
+                # - https://login.microsoftonline.com/{tenant-id}/v2.0
+
+                # Extract GUID using regex pattern matching
+                guid_pattern = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+                match = re.search(guid_pattern, profile.provider_domain)
+
+                if match:
+                    tenant_id = match.group(0)
+                else:
+                    # If no GUID found, use the provider_domain as-is
+                    # (in case user provided just the GUID but in unexpected format)
+                    tenant_id = profile.provider_domain
 
-            elif stack_type == "distribution":
-                stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
-
-                # Select template based on distribution type
-                if profile.distribution_type == "landing-page":
-                    template = project_root / "deployment" / "infrastructure" / "landing-page-distribution.yaml"
-
-                    # Get VPC outputs from networking stack
-                    networking_stack_name = profile.stack_names.get(
-                        "networking", f"{profile.identity_pool_name}-networking"
-                    )
-                    networking_outputs = get_stack_outputs(networking_stack_name, profile.aws_region)
-
-                    if not networking_outputs:
-                        console.print(
-                            "[red]Error: Networking stack outputs not found. Deploy networking stack first.[/red]"
-                        )
-                        return 1
-
-                    vpc_id = networking_outputs.get("VpcId", "")
-                    # Networking stack only has public subnets (SubnetIds), use for both ALB and Lambda
-                    subnet_ids = networking_outputs.get("SubnetIds", "")
-
-                    if not vpc_id or not subnet_ids:
-                        console.print("[red]Error: Missing required VPC/subnet outputs from networking stack.[/red]")
-                        console.print("[yellow]Expected: VpcId, SubnetIds[/yellow]")
-                        console.print(f"[yellow]Got: {list(networking_outputs.keys())}[/yellow]")
-                        return 1
-
-                    # Use same subnets for both public (ALB) and private (Lambda)
-                    public_subnets = subnet_ids
-                    private_subnets = subnet_ids
-
-                    # Build parameters for landing page
-                    params = [
-                        f"IdentityPoolName={profile.identity_pool_name}",
-                        f"VpcId={vpc_id}",
-                        f"PublicSubnetIds={public_subnets}",
-                        f"PrivateSubnetIds={private_subnets}",
-                        f"IdPProvider={profile.distribution_idp_provider}",
+                params.extend(
+                    [
+                        f"AzureTenantId={tenant_id}",
+                        f"AzureClientId={profile.client_id}",
+                    ]
+                )
+            elif provider_type == "cognito":
+                # Extract domain prefix from full domain
+                # e.g., "us-east-1p8mdr8zxe" from "us-east-1p8mdr8zxe.auth.us-east-1.amazoncognito.com"
+                cognito_domain = (
+                    profile.provider_domain.split(".")[0] if "." in profile.provider_domain else profile.provider_domain
+                )
+                params.extend(
+                    [
+                        f"CognitoUserPoolId={profile.cognito_user_pool_id}",
+                        f"CognitoUserPoolClientId={profile.client_id}",
+                        f"CognitoUserPoolDomain={cognito_domain}",
                     ]
+                )
 
-                    # Add IdP-specific parameters
-                    if profile.distribution_idp_provider == "okta":
-                        params.extend(
-                            [
-                                f"OktaDomain={profile.distribution_idp_domain}",
-                                f"OktaClientId={profile.distribution_idp_client_id}",
-                                f"OktaClientSecretArn={profile.distribution_idp_client_secret_arn}",
-                            ]
-                        )
-                    elif profile.distribution_idp_provider == "azure":
-                        # Extract tenant ID from domain or use full domain
-                        params.extend(
-                            [
-                                f"AzureTenantId={profile.distribution_idp_domain}",
-                                f"AzureClientId={profile.distribution_idp_client_id}",
-                                f"AzureClientSecretArn={profile.distribution_idp_client_secret_arn}",
-                            ]
-                        )
-                    elif profile.distribution_idp_provider == "auth0":
-                        params.extend(
-                            [
-                                f"Auth0Domain={profile.distribution_idp_domain}",
-                                f"Auth0ClientId={profile.distribution_idp_client_id}",
-                                f"Auth0ClientSecretArn={profile.distribution_idp_client_secret_arn}",
-                            ]
-                        )
-                    elif profile.distribution_idp_provider == "jumpcloud":
-                        params.extend(
-                            [
-                                f"JumpCloudDomain={profile.distribution_idp_domain}",
-                                f"JumpCloudClientId={profile.distribution_idp_client_id}",
-                                f"JumpCloudClientSecretArn=arn:aws:secretsmanager:ap-southeast-2:270263697953:secret:claude-code-auth-distribution-idp-secret-obg0oz", #{profile.distribution_idp_client_secret_arn}",
-                            ]
-                        )
-                        print(f"params: {params}")
-                    elif profile.distribution_idp_provider == "cognito":
-                        # Split domain to get user pool ID and domain prefix
-                        params.extend(
-                            [
-                                f"CognitoUserPoolId={profile.cognito_user_pool_id or ''}",
-                                f"CognitoUserPoolDomain={profile.distribution_idp_domain}",
-                                f"CognitoClientId={profile.distribution_idp_client_id}",
-                                f"CognitoClientSecretArn={profile.distribution_idp_client_secret_arn}",
-                            ]
-                        )
-
-                    # Add optional custom domain parameters
-                    if profile.distribution_custom_domain:
-                        params.append(f"CustomDomainName={profile.distribution_custom_domain}")
-                    if profile.distribution_hosted_zone_id:
-                        params.append(f"HostedZoneId={profile.distribution_hosted_zone_id}")
-
-                    # Add deployment timestamp to force custom resource re-execution
-                    import datetime
-
-                    deployment_timestamp = datetime.datetime.utcnow().strftime("%Y%m%d%H%M%S")
-                    params.append(f"DeploymentTimestamp={deployment_timestamp}")
-
-                    result = deploy_with_cf(
-                        template,
-                        stack_name,
-                        params,
-                        ["CAPABILITY_NAMED_IAM"],
-                        task_description="Deploying landing page distribution stack...",
-                    )
+            params.extend(
+                [
+                    f"IdentityPoolName={profile.identity_pool_name}",
+                    f"AllowedBedrockRegions={','.join(profile.allowed_bedrock_regions)}",
+                    f"EnableMonitoring={str(profile.monitoring_enabled).lower()}",
+                ]
+            )
 
-                    # Display outputs for landing page
-                    if result == 0:
-                        outputs = get_stack_outputs(stack_name, profile.aws_region)
-                        console.print("\n[bold green]✓ Landing page deployed successfully![/bold green]")
-                        console.print(f"\n[bold]Distribution URL:[/bold] {outputs.get('DistributionURL', 'N/A')}")
-                        console.print("\n[bold yellow]⚠️  Configure your IdP web application:[/bold yellow]")
-                        console.print(f"   [cyan]Redirect URI:[/cyan] {outputs.get('IdPRedirectURI', 'N/A')}")
-                        console.print(
-                            "\n   Add this redirect URI to your IdP web application settings "
-                            "before users can authenticate."
-                        )
-
-                    return result
-
-                else:  # presigned-s3 or legacy
-                    template = project_root / "deployment" / "infrastructure" / "presigned-s3-distribution.yaml"
-                    params = [f"IdentityPoolName={profile.identity_pool_name}"]
-                    return deploy_with_cf(
-                        template,
-                        stack_name,
-                        params,
-                        ["CAPABILITY_NAMED_IAM"],
-                        task_description="Deploying presigned S3 distribution stack...",
+            # Pass distribution bucket ARN for auto-update S3 permissions
+            if profile.auto_update_enabled and profile.enable_distribution:
+                try:
+                    dist_stack_name = profile.stack_names.get(
+                        "distribution", f"{profile.identity_pool_name}-distribution"
+                    )
+                    dist_outputs = get_stack_outputs(dist_stack_name, profile.aws_region)
+                    dist_bucket_arn = dist_outputs.get("DistributionBucketArn", "") if dist_outputs else ""
+                    if dist_bucket_arn:
+                        params.append(f"DistributionBucketArn={dist_bucket_arn}")
+                except Exception:
+                    console.print(
+                        "[dim]Note: Distribution stack not yet deployed. "
+                        "Re-run 'ccwb deploy auth' after deploying distribution "
+                        "to enable auto-update S3 permissions.[/dim]"
                     )
 
-            elif stack_type == "networking":
-                template = project_root / "deployment" / "infrastructure" / "networking.yaml"
-                stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
-                vpc_config = profile.monitoring_config or {}
+            return deploy_with_cf(
+                template,
+                stack_name,
+                params,
+                ["CAPABILITY_NAMED_IAM"],
+                task_description="Deploying authentication stack...",
+            )
 
-                params = [
-                    f"VpcCidr={vpc_config.get('vpc_cidr', '10.0.0.0/16')}",
-                    f"PublicSubnet1Cidr={vpc_config.get('subnet1_cidr', '10.0.1.0/24')}",
-                    f"PublicSubnet2Cidr={vpc_config.get('subnet2_cidr', '10.0.2.0/24')}",
-                ]
-                return deploy_with_cf(
-                    template, stack_name, params, task_description="Deploying networking infrastructure..."
-                )
+        elif stack_type == "distribution":
+            stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
 
-            elif stack_type == "s3bucket":
-                template = project_root / "deployment" / "infrastructure" / "s3bucket.yaml"
-                stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-s3bucket")
-                params = []
-                return deploy_with_cf(template, stack_name, params, task_description="Deploying S3 Bucket...")
-            elif stack_type == "monitoring":
-                # Ensure ECS service linked role exists before deploying
-                self._ensure_ecs_service_linked_role(console)
-
-                template = project_root / "deployment" / "infrastructure" / "otel-collector.yaml"
-                stack_name = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
-                params = []
-                vpc_config = profile.monitoring_config or {}
+            # Select template based on distribution type
+            if profile.distribution_type == "landing-page":
+                template = project_root / "deployment" / "infrastructure" / "landing-page-distribution.yaml"
 
-                if not vpc_config.get("create_vpc", True):
-                    params.append(f"VpcId={vpc_config.get('vpc_id', '')}")
-                    subnet_ids = ",".join(vpc_config.get("subnet_ids", []))
-                    params.append(f"SubnetIds={subnet_ids}")
-                else:
-                    # Get VPC outputs from networking stack
-                    networking_stack_name = profile.stack_names.get(
-                        "networking", f"{profile.identity_pool_name}-networking"
-                    )
-                    networking_outputs = get_stack_outputs(networking_stack_name, profile.aws_region)
-
-                    if networking_outputs:
-                        vpc_id = networking_outputs.get("VpcId", "")
-                        subnet_ids = networking_outputs.get("SubnetIds", "")
-                        if vpc_id:
-                            params.append(f"VpcId={vpc_id}")
-                        if subnet_ids:
-                            params.append(f"SubnetIds={subnet_ids}")
-
-                # Add HTTPS domain parameters if configured
-                monitoring_config = getattr(profile, "monitoring_config", {})
-                if monitoring_config.get("custom_domain"):
-                    params.append(f"CustomDomainName={monitoring_config['custom_domain']}")
-                    params.append(f"HostedZoneId={monitoring_config['hosted_zone_id']}")
-
-                params.append(f"HoneycombApiKey=USE_PREVIOUS_VALUE")
-                console.print(f"[dim]Using parameters: {params}[/dim]")
-                return deploy_with_cf(
-                    template, stack_name, params, task_description="Deploying monitoring collector..."
+                # Get VPC outputs from networking stack
+                networking_stack_name = profile.stack_names.get(
+                    "networking", f"{profile.identity_pool_name}-networking"
                 )
+                networking_outputs = get_stack_outputs(networking_stack_name, profile.aws_region)
 
-            elif stack_type == "dashboard":
-                template = project_root / "deployment" / "infrastructure" / "claude-code-dashboard.yaml"
-                stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-
-                # Get S3 bucket from networking stack for packaging
-                s3_stack_name = profile.stack_names.get("s3", f"{profile.identity_pool_name}-s3bucket")
-                s3_outputs = get_stack_outputs(s3_stack_name, profile.aws_region)
-
-                if not s3_outputs or not s3_outputs.get("CfnArtifactsBucket"):
-                    console.print("[red]Error: S3 bucket for packaging not found[/red]")
+                if not networking_outputs:
                     console.print(
-                        "[yellow]The networking stack must be deployed first with the artifacts bucket.[/yellow]"
+                        "[red]Error: Networking stack outputs not found. Deploy networking stack first.[/red]"
                     )
-                    console.print("Run: [cyan]ccwb deploy networking[/cyan]")
                     return 1
 
-                s3_bucket = s3_outputs["CfnArtifactsBucket"]
-
-                # Package the template using AWS CLI (simple and reliable!)
-                task = progress.add_task("Packaging dashboard Lambda functions...", total=None)
+                vpc_id = networking_outputs.get("VpcId", "")
+                # Networking stack only has public subnets (SubnetIds), use for both ALB and Lambda
+                subnet_ids = networking_outputs.get("SubnetIds", "")
 
-                try:
-                    # Create temp file for packaged template
-                    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                        packaged_template_path = f.name
-
-                    # Run AWS CLI package command
-                    cmd = [
-                        "aws",
-                        "cloudformation",
-                        "package",
-                        "--template-file",
-                        str(template),
-                        "--s3-bucket",
-                        s3_bucket,
-                        "--s3-prefix",
-                        "claude-code/dashboard",
-                        "--output-template-file",
-                        packaged_template_path,
-                        "--region",
-                        profile.aws_region,
-                    ]
+                if not vpc_id or not subnet_ids:
+                    console.print("[red]Error: Missing required VPC/subnet outputs from networking stack.[/red]")
+                    console.print("[yellow]Expected: VpcId, SubnetIds[/yellow]")
+                    console.print(f"[yellow]Got: {list(networking_outputs.keys())}[/yellow]")
+                    return 1
 
-                    result = subprocess.run(cmd, capture_output=True, text=True)
+                # Use same subnets for both public (ALB) and private (Lambda)
+                public_subnets = subnet_ids
+                private_subnets = subnet_ids
 
-                    if result.returncode != 0:
-                        console.print(f"[red]Failed to package template: {result.stderr}[/red]")
-                        return 1
+                # Build parameters for landing page
+                params = [
+                    f"IdentityPoolName={profile.identity_pool_name}",
+                    f"VpcId={vpc_id}",
+                    f"PublicSubnetIds={public_subnets}",
+                    f"PrivateSubnetIds={private_subnets}",
+                    f"IdPProvider={profile.distribution_idp_provider}",
+                ]
 
-                    progress.update(
-                        task, description="Dashboard Lambda functions packaged successfully", completed=True
+                # Add IdP-specific parameters
+                if profile.distribution_idp_provider == "okta":
+                    params.extend(
+                        [
+                            f"OktaDomain={profile.distribution_idp_domain}",
+                            f"OktaClientId={profile.distribution_idp_client_id}",
+                            f"OktaClientSecretArn={profile.distribution_idp_client_secret_arn}",
+                        ]
                     )
-
-                    # Deploy the packaged template with MetricsRegion parameter
-                    params = [f"MetricsRegion={profile.aws_region}"]
-                    return deploy_with_cf(
-                        packaged_template_path, stack_name, params, task_description="Deploying monitoring dashboard..."
+                elif profile.distribution_idp_provider == "azure":
+                    # Extract tenant ID from domain or use full domain
+                    params.extend(
+                        [
+                            f"AzureTenantId={profile.distribution_idp_domain}",
+                            f"AzureClientId={profile.distribution_idp_client_id}",
+                            f"AzureClientSecretArn={profile.distribution_idp_client_secret_arn}",
+                        ]
+                    )
+                elif profile.distribution_idp_provider == "auth0":
+                    params.extend(
+                        [
+                            f"Auth0Domain={profile.distribution_idp_domain}",
+                            f"Auth0ClientId={profile.distribution_idp_client_id}",
+                            f"Auth0ClientSecretArn={profile.distribution_idp_client_secret_arn}",
+                        ]
+                    )
+                elif profile.distribution_idp_provider == "jumpcloud":
+                    params.extend(
+                        [
+                            f"JumpCloudDomain={profile.distribution_idp_domain}",
+                            f"JumpCloudClientId={profile.distribution_idp_client_id}",
+                            f"JumpCloudClientSecretArn=arn:aws:secretsmanager:ap-southeast-2:270263697953:secret:claude-code-auth-distribution-idp-secret-obg0oz", #{profile.distribution_idp_client_secret_arn}",
+                        ]
+                    )
+                    print(f"params: {params}")
+                elif profile.distribution_idp_provider == "cognito":
+                    # Split domain to get user pool ID and domain prefix
+                    params.extend(
+                        [
+                            f"CognitoUserPoolId={profile.cognito_user_pool_id or ''}",
+                            f"CognitoUserPoolDomain={profile.distribution_idp_domain}",
+                            f"CognitoClientId={profile.distribution_idp_client_id}",
+                            f"CognitoClientSecretArn={profile.distribution_idp_client_secret_arn}",
+                        ]
                     )
 
-                finally:
-                    # Clean up temp file
-                    if "packaged_template_path" in locals():
-                        try:
-                            os.unlink(packaged_template_path)
-                        except Exception:
-                            pass
-
-            elif stack_type == "analytics":
-                template = project_root / "deployment" / "infrastructure" / "analytics-pipeline.yaml"
-                stack_name = profile.stack_names.get("analytics", f"{profile.identity_pool_name}-analytics")
-                params = [
-                    f"MetricsLogGroup={profile.metrics_log_group}",
-                    f"DataRetentionDays={profile.data_retention_days}",
-                    f"FirehoseBufferInterval={profile.firehose_buffer_interval}",
-                    f"DebugMode={str(profile.analytics_debug_mode).lower()}",
-                ]
-                return deploy_with_cf(template, stack_name, params, task_description="Deploying analytics pipeline...")
+                # Add optional custom domain parameters
+                if profile.distribution_custom_domain:
+                    params.append(f"CustomDomainName={profile.distribution_custom_domain}")
+                if profile.distribution_hosted_zone_id:
+                    params.append(f"HostedZoneId={profile.distribution_hosted_zone_id}")
 
-            elif stack_type == "quota":
-                template = project_root / "deployment" / "infrastructure" / "quota-monitoring.yaml"
-                stack_name = profile.stack_names.get("quota", f"{profile.identity_pool_name}-quota")
+                # Add deployment timestamp to force custom resource re-execution
+                import datetime
 
-                # Get MetricsTable ARN from dashboard stack outputs
-                dashboard_stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
-                dashboard_outputs = get_stack_outputs(dashboard_stack_name, profile.aws_region)
+                deployment_timestamp = datetime.datetime.utcnow().strftime("%Y%m%d%H%M%S")
+                params.append(f"DeploymentTimestamp={deployment_timestamp}")
+
+                result = deploy_with_cf(
+                    template,
+                    stack_name,
+                    params,
+                    ["CAPABILITY_NAMED_IAM"],
+                    task_description="Deploying landing page distribution stack...",
+                )
 
-                if not dashboard_outputs or not dashboard_outputs.get("MetricsTableArn"):
+                # Display outputs for landing page
+                if result == 0:
+                    outputs = get_stack_outputs(stack_name, profile.aws_region)
+                    console.print("\n[bold green]✓ Landing page deployed successfully![/bold green]")
+                    console.print(f"\n[bold]Distribution URL:[/bold] {outputs.get('DistributionURL', 'N/A')}")
+                    console.print("\n[bold yellow]⚠️  Configure your IdP web application:[/bold yellow]")
+                    console.print(f"   [cyan]Redirect URI:[/cyan] {outputs.get('IdPRedirectURI', 'N/A')}")
                     console.print(
-                        f"[red]Could not get MetricsTable ARN from dashboard stack {dashboard_stack_name}[/red]"
+                        "\n   Add this redirect URI to your IdP web application settings "
+                        "before users can authenticate."
                     )
-                    console.print("[yellow]The dashboard stack must be deployed first.[/yellow]")
-                    console.print("Run: [cyan]ccwb deploy dashboard[/cyan]")
-                    return 1
 
-                # Get S3 bucket from s3bucket stack for packaging
-                s3_stack = profile.stack_names.get("s3", f"{profile.identity_pool_name}-s3bucket")
-                s3_outputs = get_stack_outputs(s3_stack, profile.aws_region)
+                return result
 
-                if not s3_outputs or not s3_outputs.get("CfnArtifactsBucket"):
-                    console.print(f"[red]Could not get S3 bucket from s3bucket stack {s3_stack}[/red]")
-                    console.print("[yellow]The s3bucket stack must be deployed first.[/yellow]")
-                    console.print("Run: [cyan]ccwb deploy s3bucket[/cyan]")
-                    return 1
-
-                s3_bucket = s3_outputs["CfnArtifactsBucket"]
+            else:  # presigned-s3 or legacy
+                template = project_root / "deployment" / "infrastructure" / "presigned-s3-distribution.yaml"
+                params = [f"IdentityPoolName={profile.identity_pool_name}"]
+                return deploy_with_cf(
+                    template,
+                    stack_name,
+                    params,
+                    ["CAPABILITY_NAMED_IAM"],
+                    task_description="Deploying presigned S3 distribution stack...",
+                )
 
-                # Build parameters
-                monthly_limit = getattr(profile, "monthly_token_limit", 225000000)
-                daily_limit = getattr(profile, "daily_token_limit", None)
-                daily_enforcement = getattr(profile, "daily_enforcement_mode", "alert")
-                monthly_enforcement = getattr(profile, "monthly_enforcement_mode", "block")
-                warning_80 = getattr(profile, "warning_threshold_80", int(monthly_limit * 0.8))
-                warning_90 = getattr(profile, "warning_threshold_90", int(monthly_limit * 0.9))
+        elif stack_type == "networking":
+            template = project_root / "deployment" / "infrastructure" / "networking.yaml"
+            stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-networking")
+            vpc_config = profile.monitoring_config or {}
+
+            params = [
+                f"VpcCidr={vpc_config.get('vpc_cidr', '10.0.0.0/16')}",
+                f"PublicSubnet1Cidr={vpc_config.get('subnet1_cidr', '10.0.1.0/24')}",
+                f"PublicSubnet2Cidr={vpc_config.get('subnet2_cidr', '10.0.2.0/24')}",
+            ]
+            return deploy_with_cf(
+                template, stack_name, params, task_description="Deploying networking infrastructure..."
+            )
 
-                metrics_aggregator_role = dashboard_outputs.get(
-                    "MetricsAggregatorRoleName", "claude-code-auth-dashboard-MetricsAggregatorRole-*"
+        elif stack_type == "s3bucket":
+            template = project_root / "deployment" / "infrastructure" / "s3bucket.yaml"
+            stack_name = profile.stack_names.get("networking", f"{profile.identity_pool_name}-s3bucket")
+            params = []
+            return deploy_with_cf(template, stack_name, params, task_description="Deploying S3 Bucket...")
+        elif stack_type == "monitoring":
+            # Ensure ECS service linked role exists before deploying
+            self._ensure_ecs_service_linked_role(console)
+
+            template = project_root / "deployment" / "infrastructure" / "otel-collector.yaml"
+            stack_name = profile.stack_names.get("monitoring", f"{profile.identity_pool_name}-otel-collector")
+            params = []
+            vpc_config = profile.monitoring_config or {}
+
+            if not vpc_config.get("create_vpc", True):
+                params.append(f"VpcId={vpc_config.get('vpc_id', '')}")
+                subnet_ids = ",".join(vpc_config.get("subnet_ids", []))
+                params.append(f"SubnetIds={subnet_ids}")
+            else:
+                # Get VPC outputs from networking stack
+                networking_stack_name = profile.stack_names.get(
+                    "networking", f"{profile.identity_pool_name}-networking"
                 )
+                networking_outputs = get_stack_outputs(networking_stack_name, profile.aws_region)
 
-                # Get OIDC configuration for JWT authentication
-                oidc_issuer_url = profile.provider_domain
-                # Ensure issuer URL has https:// prefix
-                if oidc_issuer_url and not oidc_issuer_url.startswith(("http://", "https://")):
-                    oidc_issuer_url = f"https://{oidc_issuer_url}"
-                # Auth0 tokens include trailing slash in iss claim, so authorizer must match
-                if profile.provider_type == "auth0" and oidc_issuer_url and not oidc_issuer_url.endswith("/"):
-                    oidc_issuer_url = f"{oidc_issuer_url}/"
-                oidc_client_id = profile.client_id
-
-                params = [
-                    f"MonthlyTokenLimit={monthly_limit}",
-                    f"MetricsTableArn={dashboard_outputs['MetricsTableArn']}",
-                    f"MetricsAggregatorRoleName={metrics_aggregator_role}",
-                    f"WarningThreshold80={warning_80}",
-                    f"WarningThreshold90={warning_90}",
-                    f"DailyTokenLimit={daily_limit or 0}",
-                    f"DailyEnforcementMode={daily_enforcement}",
-                    f"MonthlyEnforcementMode={monthly_enforcement}",
-                    f"OidcIssuerUrl={oidc_issuer_url}",
-                    f"OidcClientId={oidc_client_id}",
-                ]
+                if networking_outputs:
+                    vpc_id = networking_outputs.get("VpcId", "")
+                    subnet_ids = networking_outputs.get("SubnetIds", "")
+                    if vpc_id:
+                        params.append(f"VpcId={vpc_id}")
+                    if subnet_ids:
+                        params.append(f"SubnetIds={subnet_ids}")
+
+            # Add HTTPS domain parameters if configured
+            monitoring_config = getattr(profile, "monitoring_config", {})
+            if monitoring_config.get("custom_domain"):
+                params.append(f"CustomDomainName={monitoring_config['custom_domain']}")
+                params.append(f"HostedZoneId={monitoring_config['hosted_zone_id']}")
+
+            params.append(f"HoneycombApiKey=USE_PREVIOUS_VALUE")
+            if self.verbose:
+                console.print(f"[dim]Using parameters: {params}[/dim]")
+            return deploy_with_cf(template, stack_name, params, task_description="Deploying monitoring collector...")
 
-                # Package the template using AWS CLI
-                task = progress.add_task("Packaging quota monitoring Lambda functions...", total=None)
+        elif stack_type == "dashboard":
+            template = project_root / "deployment" / "infrastructure" / "claude-code-dashboard.yaml"
+            stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
 
-                try:
-                    # Create temp file for packaged template
-                    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                        packaged_template_path = f.name
-
-                    # Run AWS CLI package command
-                    cmd = [
-                        "aws",
-                        "cloudformation",
-                        "package",
-                        "--template-file",
-                        str(template),
-                        "--s3-bucket",
-                        s3_bucket,
-                        "--s3-prefix",
-                        "claude-code/quota",
-                        "--output-template-file",
-                        packaged_template_path,
-                        "--region",
-                        profile.aws_region,
-                    ]
+            # Get S3 bucket from networking stack for packaging
+            s3_stack_name = profile.stack_names.get("s3", f"{profile.identity_pool_name}-s3bucket")
+            s3_outputs = get_stack_outputs(s3_stack_name, profile.aws_region)
 
-                    result_pkg = subprocess.run(cmd, capture_output=True, text=True)
+            if not s3_outputs or not s3_outputs.get("CfnArtifactsBucket"):
+                console.print("[red]Error: S3 bucket for packaging not found[/red]")
+                console.print("[yellow]The networking stack must be deployed first with the artifacts bucket.[/yellow]")
+                console.print("Run: [cyan]ccwb deploy networking[/cyan]")
+                return 1
 
-                    if result_pkg.returncode != 0:
-                        console.print(f"[red]Failed to package template: {result_pkg.stderr}[/red]")
-                        return 1
+            s3_bucket = s3_outputs["CfnArtifactsBucket"]
+
+            # Deploy the packaged template with MetricsRegion parameter
+            params = [f"MetricsRegion={profile.aws_region}"]
+            return package_and_deploy(
+                template,
+                stack_name,
+                s3_bucket,
+                "claude-code/dashboard",
+                params,
+                "dashboard",
+                task_description="Deploying monitoring dashboard...",
+            )
 
-                    progress.update(
-                        task, description="Quota monitoring Lambda functions packaged successfully", completed=True
-                    )
+        elif stack_type == "analytics":
+            template = project_root / "deployment" / "infrastructure" / "analytics-pipeline.yaml"
+            stack_name = profile.stack_names.get("analytics", f"{profile.identity_pool_name}-analytics")
+            params = [
+                f"MetricsLogGroup={profile.metrics_log_group}",
+                f"DataRetentionDays={profile.data_retention_days}",
+                f"FirehoseBufferInterval={profile.firehose_buffer_interval}",
+                f"DebugMode={str(profile.analytics_debug_mode).lower()}",
+            ]
+            return deploy_with_cf(template, stack_name, params, task_description="Deploying analytics pipeline...")
+
+        elif stack_type == "quota":
+            template = project_root / "deployment" / "infrastructure" / "quota-monitoring.yaml"
+            stack_name = profile.stack_names.get("quota", f"{profile.identity_pool_name}-quota")
+
+            # Get MetricsTable ARN from dashboard stack outputs
+            dashboard_stack_name = profile.stack_names.get("dashboard", f"{profile.identity_pool_name}-dashboard")
+            dashboard_outputs = get_stack_outputs(dashboard_stack_name, profile.aws_region)
+
+            if not dashboard_outputs or not dashboard_outputs.get("MetricsTableArn"):
+                console.print(f"[red]Could not get MetricsTable ARN from dashboard stack {dashboard_stack_name}[/red]")
+                console.print("[yellow]The dashboard stack must be deployed first.[/yellow]")
+                console.print("Run: [cyan]ccwb deploy dashboard[/cyan]")
+                return 1
 
-                    # Deploy the packaged template
-                    result = deploy_with_cf(
-                        packaged_template_path, stack_name, params, task_description="Deploying quota monitoring..."
-                    )
+            # Get S3 bucket from s3bucket stack for packaging
+            s3_stack = profile.stack_names.get("s3", f"{profile.identity_pool_name}-s3bucket")
+            s3_outputs = get_stack_outputs(s3_stack, profile.aws_region)
 
-                    # Update metrics aggregator Lambda environment if successful
-                    if result == 0:
-                        self._update_metrics_aggregator_env(profile, stack_name, console)
+            if not s3_outputs or not s3_outputs.get("CfnArtifactsBucket"):
+                console.print(f"[red]Could not get S3 bucket from s3bucket stack {s3_stack}[/red]")
+                console.print("[yellow]The s3bucket stack must be deployed first.[/yellow]")
+                console.print("Run: [cyan]ccwb deploy s3bucket[/cyan]")
+                return 1
 
-                    return result
+            s3_bucket = s3_outputs["CfnArtifactsBucket"]
+
+            # Build parameters; Profile supplies the defaults, and unset thresholds follow the monthly limit
+            monthly_limit = profile.monthly_token_limit
+            daily_limit = profile.daily_token_limit
+            daily_enforcement = profile.daily_enforcement_mode
+            monthly_enforcement = profile.monthly_enforcement_mode
+            warning_80 = profile.warning_threshold_80
+            if warning_80 is None:
+                warning_80 = monthly_limit * 8 // 10
+            warning_90 = profile.warning_threshold_90
+            if warning_90 is None:
+                warning_90 = monthly_limit * 9 // 10
+
+            metrics_aggregator_role = dashboard_outputs.get(
+                "MetricsAggregatorRoleName", "claude-code-auth-dashboard-MetricsAggregatorRole-*"
+            )
 
-                finally:
-                    # Clean up temp file
-                    if "packaged_template_path" in locals():
-                        try:
-                            os.unlink(packaged_template_path)
-                        except Exception:
-                            pass
+            # Get OIDC configuration for JWT authentication
+            oidc_issuer_url = profile.provider_domain
+            # Ensure issuer URL has https:// prefix
+            oidc_issuer_url = ensure_url_scheme(oidc_issuer_url)
+            # Auth0 tokens include trailing slash in iss claim, so authorizer must match
+            if profile.provider_type == "auth0" and oidc_issuer_url and not oidc_issuer_url.endswith("/"):
+                oidc_issuer_url = f"{oidc_issuer_url}/"
+            oidc_client_id = profile.client_id
+
+            # Keep parameters as ordered (key, value) pairs and format them in one pass
+            quota_params = [
+                ("MonthlyTokenLimit", monthly_limit),
+                ("MetricsTableArn", dashboard_outputs["MetricsTableArn"]),
+                ("MetricsAggregatorRoleName", metrics_aggregator_role),
+                ("WarningThreshold80", warning_80),
+                ("WarningThreshold90", warning_90),
+                ("DailyTokenLimit", daily_limit or 0),
+                ("DailyEnforcementMode", daily_enforcement),
+                ("MonthlyEnforcementMode", monthly_enforcement),
+                ("OidcIssuerUrl", oidc_issuer_url),
+                ("OidcClientId", oidc_client_id),
+            ]
+            params = [f"{key}={value}" for key, value in quota_params]
+
+            # Update metrics aggregator Lambda environment once the quota stack is deployed
+            return package_and_deploy(
+                template,
+                stack_name,
+                s3_bucket,
+                "claude-code/quota",
+                params,
+                "quota monitoring",
+                task_description="Deploying quota monitoring...",
+                on_success=lambda: self._update_metrics_aggregator_env(profile, stack_name, console),
+            )
 
-            elif stack_type == "codebuild":
-                template = project_root / "deployment" / "infrastructure" / "codebuild-windows.yaml"
-                stack_name = profile.stack_names.get("codebuild", f"{profile.identity_pool_name}-codebuild")
-                params = [f"ProjectNamePrefix={profile.identity_pool_name}"]
-                return deploy_with_cf(
-                    template, stack_name, params, task_description="Deploying CodeBuild for Windows builds..."
-                )
+        elif stack_type == "codebuild":
+            template = project_root / "deployment" / "infrastructure" / "codebuild-windows.yaml"
+            stack_name = profile.stack_names.get("codebuild", f"{profile.identity_pool_name}-codebuild")
+            params = [f"ProjectNamePrefix={profile.identity_pool_name}"]
+            return deploy_with_cf(
+                template, stack_name, params, task_description="Deploying CodeBuild for Windows builds..."
+            )
 
-            else:
-                console.print(f"[red]Unknown stack type: {stack_type}[/red]")
-                return 1
+        else:
+            console.print(f"[red]Unknown stack type: {stack_type}[/red]")
+            return 1
 
     def _show_all_deployment_commands(self, stacks_to_deploy, profile, console):
         """Show AWS CLI commands that would be executed."""
@@ -942,10 +941,10 @@ class DeployCommand(Command):
                     console.print(f"• Policies Table: [cyan]{quota_outputs.get('PoliciesTableName', 'N/A')}[/cyan]")
 
                     # Show configured limits
-                    monthly_limit = getattr(profile, "monthly_token_limit", 225000000)
-                    monthly_mode = getattr(profile, "monthly_enforcement_mode", "block")
-                    daily_limit = getattr(profile, "daily_token_limit", None)
-                    daily_mode = getattr(profile, "daily_enforcement_mode", "alert")
+                    monthly_limit = profile.monthly_token_limit
+                    monthly_mode = profile.monthly_enforcement_mode
+                    daily_limit = profile.daily_token_limit
+                    daily_mode = profile.daily_enforcement_mode
 
                     console.print(f"• Monthly Limit: [cyan]{monthly_limit:,}[/cyan] tokens ({monthly_mode})")
                     if daily_limit:
@@ -960,8 +959,35 @@ class DeployCommand(Command):
                         profile.user_quota_metrics_table = quota_outputs["QuotaTableName"]
                     config.save_profile(profile)
 
+    def _run_post_deploy(self, func, *args) -> None:
+        """Run a best-effort post-deploy step in the background, or inline when no pool is active."""
+        if self._post_deploy_pool is None:
+            func(*args)
+            return
+        self._post_deploy_futures.append(self._post_deploy_pool.submit(func, *args))
+
+    def _wait_for_post_deploy(self, console: Console) -> None:
+        """Wait for background post-deploy steps and release the worker pool."""
+        if self._post_deploy_pool is None:
+            return
+
+        _done, not_done = wait(self._post_deploy_futures, timeout=self.POST_DEPLOY_TIMEOUT)
+        if not_done:
+            console.print(
+                f"[yellow]Warning: {len(not_done)} post-deploy step(s) still running after "
+                f"{self.POST_DEPLOY_TIMEOUT}s[/yellow]"
+            )
+
+        self._post_deploy_pool.shutdown(wait=False)
+        self._post_deploy_pool = None
+        self._post_deploy_futures = None
+
     def _update_metrics_aggregator_env(self, profile, quota_stack_name: str, console: Console) -> None:
-        """Update metrics aggregator Lambda environment variable to include quota table."""
+        """Update metrics aggregator Lambda environment variable to include quota table.
+
+        The stack outputs are read and the Lambda client is created on the calling thread, since boto3's
+        default session isn't safe to create clients from concurrently; only the update runs in the background.
+        """
         try:
             import boto3
 
@@ -971,40 +997,52 @@ class DeployCommand(Command):
                 console.print("[yellow]Warning: Could not get quota table name from stack outputs[/yellow]")
                 return
 
-            quota_table_name = quota_outputs["QuotaTableName"]
-
-            # Get the metrics aggregator function name
-            metrics_aggregator_name = "ClaudeCode-MetricsAggregator"
+            lambda_client = boto3.client("lambda", region_name=profile.aws_region)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Error updating metrics aggregator: {str(e)}[/yellow]")
+            return
 
-            console.print(f"[dim]Updating {metrics_aggregator_name} environment variables...[/dim]")
+        self._run_post_deploy(
+            self._apply_metrics_aggregator_env, lambda_client, profile, quota_outputs["QuotaTableName"], console
+        )
 
-            # Update the Lambda function environment variables
-            lambda_client = boto3.client("lambda", region_name=profile.aws_region)
+    def _apply_metrics_aggregator_env(self, lambda_client, profile, quota_table_name: str, console: Console) -> None:
+        """Set the metrics aggregator's environment, retrying while the function is still updating."""
+        # Get the metrics aggregator function name
+        metrics_aggregator_name = "ClaudeCode-MetricsAggregator"
 
-            try:
-                lambda_client.update_function_configuration(
-                    FunctionName=metrics_aggregator_name,
-                    Environment={
-                        "Variables": {
-                            "METRICS_LOG_GROUP": profile.metrics_log_group,
-                            "METRICS_REGION": profile.aws_region,
-                            "METRICS_TABLE": "ClaudeCodeMetrics",
-                            "QUOTA_TABLE": quota_table_name,
-                        }
-                    },
-                )
-                console.print("[green]✓ Updated metrics aggregator to enable quota tracking[/green]")
-            except Exception as e:
-                console.print(
-                    f"[yellow]Warning: Failed to update metrics aggregator environment variables: {str(e)}[/yellow]"
-                )
-                console.print(
-                    f"[dim]You may need to manually add QUOTA_TABLE={quota_table_name} "
-                    f"to the metrics aggregator Lambda[/dim]"
-                )
+        if self.verbose:
+            console.print(f"[dim]Updating {metrics_aggregator_name} environment variables...[/dim]")
 
+        try:
+            # The function may still be updating from the dashboard deploy; retry with backoff
+            for attempt in range(1, self.LAMBDA_UPDATE_ATTEMPTS + 1):
+                try:
+                    lambda_client.update_function_configuration(
+                        FunctionName=metrics_aggregator_name,
+                        Environment={
+                            "Variables": {
+                                "METRICS_LOG_GROUP": profile.metrics_log_group,
+                                "METRICS_REGION": profile.aws_region,
+                                "METRICS_TABLE": "ClaudeCodeMetrics",
+                                "QUOTA_TABLE": quota_table_name,
+                            }
+                        },
+                    )
+                    break
+                except lambda_client.exceptions.ResourceConflictException:
+                    if attempt == self.LAMBDA_UPDATE_ATTEMPTS:
+                        raise
+                    time.sleep(2**attempt)
+            console.print("[green]✓ Updated metrics aggregator to enable quota tracking[/green]")
         except Exception as e:
-            console.print(f"[yellow]Warning: Error updating metrics aggregator: {str(e)}[/yellow]")
+            console.print(
+                f"[yellow]Warning: Failed to update metrics aggregator environment variables: {str(e)}[/yellow]"
+            )
+            console.print(
+                f"[dim]You may need to manually add QUOTA_TABLE={quota_table_name} "
+                f"to the metrics aggregator Lambda[/dim]"
+            )
 
     def _check_orphaned_stacks(self, stacks_to_deploy, profile, cf_manager, console: Console) -> list:
         """Check for stacks that exist but are disabled in config.
@@ -1040,8 +1078,23 @@ class DeployCommand(Command):
 
         return orphaned
 
+    @cached_property
+    def _account_id(self) -> str | None:
+        """AWS account ID for the current credentials, resolved once per command."""
+        return get_account_id()
+
     def _ensure_ecs_service_linked_role(self, console: Console) -> None:
-        """Ensure ECS service linked role exists, create if needed."""
+        """Ensure ECS service linked role exists, create if needed.
+
+        The role is never removed once created, so a verified account is recorded in
+        ~/.ccwb/cache.json and later deploys skip the IAM lookup.
+        """
+        account_id = self._account_id
+        if account_id and _load_deploy_cache().get(account_id, {}).get("ecs_slr"):
+            if self.verbose:
+                console.print("[dim]✓ ECS service linked role exists[/dim]")
+            return
+
         try:
             import boto3
 
@@ -1050,7 +1103,8 @@ class DeployCommand(Command):
             # Check if role exists
             try:
                 iam_client.get_role(RoleName="AWSServiceRoleForECS")
-                console.print("[dim]✓ ECS service linked role exists[/dim]")
+                if self.verbose:
+                    console.print("[dim]✓ ECS service linked role exists[/dim]")
             except iam_client.exceptions.NoSuchEntityException:
                 # Role doesn't exist, create it
                 console.print("[yellow]Creating ECS service linked role...[/yellow]")
@@ -1064,7 +1118,38 @@ class DeployCommand(Command):
                     else:
                         raise
 
+            if account_id:
+                _mark_deploy_cache(account_id, "ecs_slr")
+
         except Exception as e:
             console.print(f"[yellow]Warning: Could not verify ECS service linked role: {str(e)}[/yellow]")
             console.print("[dim]If deployment fails, manually create the role with:[/dim]")
             console.print("[dim]aws iam create-service-linked-role --aws-service-name ecs.amazonaws.com[/dim]")
+
+
+def _deploy_cache_file() -> Path:
+    """Location of the per-account deploy cache (resolved lazily so tests can patch CONFIG_DIR)."""
+    return Config.CONFIG_DIR / "cache.json"
+
+
+def _load_deploy_cache() -> dict:
+    """Load the per-account deploy cache, treating a missing or corrupt file as empty."""
+    try:
+        with open(_deploy_cache_file()) as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _mark_deploy_cache(account_id: str, key: str) -> None:
+    """Record that a one-time account prerequisite has been verified."""
+    cache = _load_deploy_cache()
+    cache.setdefault(account_id, {})[key] = True
+    try:
+        cache_file = _deploy_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass  # Cache is an optimization only
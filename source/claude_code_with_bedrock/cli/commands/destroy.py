@@ -3,21 +3,122 @@
 
 """Destroy command - Remove deployed infrastructure."""
 
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
 from cleo.commands.command import Command
 from cleo.helpers import argument, option
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
 
-from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
 from claude_code_with_bedrock.config import Config
 
+# Rich and the CloudFormation manager (boto3) are imported inside handle() so that
+# `ccwb destroy --help` doesn't load them
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress, TaskID
+
+    from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
+
+# Stacks that must finish deleting before a stack can be deleted; independent stacks are deleted together
+STACK_DELETE_DEPENDENCIES = {
+    "analytics": [],
+    "dashboard": [],
+    "monitoring": [],
+    "s3bucket": [],
+    "networking": ["monitoring", "dashboard", "analytics"],
+    "auth": ["networking", "s3bucket"],
+}
+# Stacks that only exist when monitoring is enabled
+MONITORING_GATED = frozenset({"monitoring", "dashboard", "networking", "analytics", "s3bucket"})
+# Seconds to wait for each wave of deletions
+DELETE_TIMEOUT = 300
+
+
+def _delete_waves(stacks: list[str]) -> list[list[str]]:
+    """Group stacks into waves that can be deleted together, dependencies first."""
+    remaining = {stack: {dep for dep in STACK_DELETE_DEPENDENCIES.get(stack, []) if dep in stacks} for stack in stacks}
+    waves = []
+    while remaining:
+        wave = [stack for stack, deps in remaining.items() if not deps]
+        for stack in wave:
+            del remaining[stack]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+        waves.append(wave)
+    return waves
+
+
+def _render_bucket(resource: dict, region: str) -> list[str]:
+    bucket = resource["physical_id"]
+    return [
+        f"  • {bucket}",
+        f"    [cyan]aws s3 rm s3://{bucket} --recursive[/cyan]",
+        f"    [cyan]aws s3 rb s3://{bucket}[/cyan]",
+    ]
+
+
+def _render_log_group(resource: dict, region: str) -> list[str]:
+    log_group = resource["physical_id"]
+    return [
+        f"  • {log_group}",
+        f"    [cyan]aws logs delete-log-group --log-group-name {log_group} --region {region}[/cyan]",
+    ]
+
+
+def _render_table(resource: dict, region: str) -> list[str]:
+    table = resource["physical_id"]
+    return [f"  • {table}", f"    [cyan]aws dynamodb delete-table --table-name {table} --region {region}[/cyan]"]
+
+
+def _render_repository(resource: dict, region: str) -> list[str]:
+    repo = resource["physical_id"]
+    return [
+        f"  • {repo}",
+        f"    [cyan]aws ecr delete-repository --repository-name {repo} --force --region {region}[/cyan]",
+    ]
+
+
+def _render_other(resource: dict, region: str) -> list[str]:
+    return [
+        f"  • {resource['logical_id']} ({resource['resource_type']}): {resource['physical_id']}",
+        f"    Reason: {resource['status_reason']}",
+    ]
+
+
+# Resource types with dedicated cleanup instructions: type -> (section heading, renderer), in print order
+CLEANUP_SECTIONS = {
+    "AWS::S3::Bucket": ("S3 Buckets (must be emptied first):", _render_bucket),
+    "AWS::Logs::LogGroup": ("CloudWatch Log Groups:", _render_log_group),
+    "AWS::DynamoDB::Table": ("DynamoDB Tables:", _render_table),
+    "AWS::ECR::Repository": ("ECR Repositories (must delete images first):", _render_repository),
+}
+KNOWN_TYPES = frozenset(CLEANUP_SECTIONS)
+
+
+class _ProgressUpdater:
+    """Status callback for ``wait_for_deletes`` that relabels each stack's progress task."""
+
+    __slots__ = ("progress", "tasks")
+
+    def __init__(self, progress: "Progress", tasks: dict[str, "TaskID"]):
+        self.progress = progress
+        self.tasks = tasks
+
+    def __call__(self, stack_name: str, status: str) -> None:
+        self.progress.update(
+            self.tasks[stack_name], description="Deleting stack " + stack_name + " (" + status + ")..."
+        )
+
 
 class DestroyCommand(Command):
     name = "destroy"
     description = "Remove deployed AWS infrastructure"
 
+    # Stack name -> status for the region, fetched once at the start of handle()
+    _status_map: dict[str, str]
+
     arguments = [
         argument(
             "stack",
@@ -33,6 +134,11 @@ class DestroyCommand(Command):
 
     def handle(self) -> int:
         """Execute the destroy command."""
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from rich.prompt import Confirm
+
         console = Console()
 
         # Load configuration
@@ -74,6 +180,26 @@ class DestroyCommand(Command):
             # Destroy all stacks in reverse order
             stacks_to_destroy = ["analytics", "dashboard", "monitoring", "networking", "s3bucket", "auth"]
 
+        # Resolve CloudFormation stack names once for the preview and the deletion waves
+        stack_names = {
+            stack: profile.stack_names.get(stack, f"{profile.identity_pool_name}-{stack}")
+            for stack in stacks_to_destroy
+        }
+
+        from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
+
+        # One manager (and boto3 client) serves every call in this run, including the worker threads below
+        cf_manager = self._cf_manager = CloudFormationManager(region=profile.aws_region)
+        # One listing answers the existence check for every stack
+        self._status_map = cf_manager.list_stack_statuses()
+
+        # Only offer to destroy stacks that are actually deployed
+        stack_names = {stack: name for stack, name in stack_names.items() if name in self._status_map}
+        if not stack_names:
+            console.print("[green]Nothing to destroy - none of the stacks exist.[/green]")
+            return 0
+        stacks_to_destroy = list(stack_names)
+
         # Show what will be destroyed
         console.print(
             Panel.fit(
@@ -84,8 +210,7 @@ class DestroyCommand(Command):
             )
         )
 
-        for stack in stacks_to_destroy:
-            stack_name = profile.stack_names.get(stack, f"{profile.identity_pool_name}-{stack}")
+        for stack, stack_name in stack_names.items():
             console.print(f"• {stack.capitalize()} stack: [cyan]{stack_name}[/cyan]")
 
         console.print("\n[yellow]Note: Some resources may require manual cleanup:[/yellow]")
@@ -95,6 +220,10 @@ class DestroyCommand(Command):
 
         # Confirm destruction
         if not force:
+            # Without a terminal there is nobody to answer the prompt, so fail fast instead
+            if not (sys.stdin and sys.stdin.isatty()):
+                console.print("[red]Cannot confirm destruction non-interactively; use --force to confirm.[/red]")
+                return 1
             if not Confirm.ask("\n[bold red]Are you sure you want to destroy these resources?[/bold red]"):
                 console.print("\n[yellow]Destruction cancelled.[/yellow]")
                 return 0
@@ -104,94 +233,118 @@ class DestroyCommand(Command):
 
         all_failed_resources = []  # Collect failed resources from all stacks
         stacks_with_failures = []
+        # Stacks that did not delete cleanly, in deletion order -> failed resources (None until looked up)
+        failed_by_stack: dict[str, list[dict] | None] = {}
 
+        stacks_to_run = []
         for stack in stacks_to_destroy:
-            if stack == "monitoring" and not profile.monitoring_enabled:
-                continue
-            if stack == "dashboard" and not profile.monitoring_enabled:
+            if stack in MONITORING_GATED and not profile.monitoring_enabled:
                 continue
-            if stack == "networking" and not profile.monitoring_enabled:
-                continue
-            if stack == "analytics" and not profile.monitoring_enabled:
-                continue
-            if stack == "s3bucket" and not profile.monitoring_enabled:
-                continue
-
-            stack_name = profile.stack_names.get(stack, f"{profile.identity_pool_name}-{stack}")
-            console.print(f"Destroying {stack} stack: [cyan]{stack_name}[/cyan]")
+            stacks_to_run.append(stack)
 
-            result = self._delete_stack(stack_name, profile.aws_region, console)
-            if result != 0:
-                # Don't break - collect failed resources and continue
-                failed = self._get_failed_resources(stack_name, profile.aws_region)
-                if failed:
-                    all_failed_resources.extend(failed)
-                    stacks_with_failures.append(stack_name)
-                console.print(
-                    f"[yellow]⚠ {stack.capitalize()} stack has resources requiring manual cleanup[/yellow]\n"
-                )
-            else:
-                console.print(f"[green]✓ {stack.capitalize()} stack destroyed[/green]\n")
+        with Progress(
+            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+        ) as progress:
+            for wave in _delete_waves(stacks_to_run):
+                # Issue every delete in the wave up front, then poll them together
+                results = {}
+                in_flight = {}
+                for stack in wave:
+                    stack_name = stack_names[stack]
+                    console.print(f"Destroying {stack} stack: [cyan]{stack_name}[/cyan]")
+                    code, failed = self._delete_stack(stack_name, console, cf_manager)
+                    if code is None:
+                        in_flight[stack_name] = progress.add_task(f"Deleting stack {stack_name}...", total=None)
+                    results[stack] = (stack_name, code, failed)
+
+                if in_flight:
+                    final = cf_manager.wait_for_deletes(
+                        list(in_flight),
+                        on_status=_ProgressUpdater(progress, in_flight),
+                        timeout=DELETE_TIMEOUT,
+                    )
+                    for task_id in in_flight.values():
+                        progress.update(task_id, completed=True, visible=False)
+                    for stack, (stack_name, code, _failed) in results.items():
+                        if code is None:
+                            results[stack] = (
+                                stack_name,
+                                *self._deletion_result(stack_name, final[stack_name], console),
+                            )
+
+                for stack, (stack_name, code, failed) in results.items():
+                    if code != 0:
+                        # Don't stop - record the failure and continue
+                        failed_by_stack[stack_name] = failed
+                        console.print(
+                            f"[yellow]⚠ {stack.capitalize()} stack has resources requiring manual cleanup[/yellow]\n"
+                        )
+                    else:
+                        console.print(f"[green]✓ {stack.capitalize()} stack destroyed[/green]\n")
+
+        # Look up failed resources the deletion didn't already report; the lookups are independent,
+        # so run them concurrently
+        pending = [name for name, failed in failed_by_stack.items() if failed is None]
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {executor.submit(self._get_failed_resources, name, cf_manager): name for name in pending}
+                for future in as_completed(futures):
+                    failed_by_stack[futures[future]] = future.result()
+
+        for stack_name, failed in failed_by_stack.items():
+            if failed:
+                all_failed_resources.extend(failed)
+                stacks_with_failures.append(stack_name)
 
         # Show cleanup summary at the end
         self._show_cleanup_summary(all_failed_resources, stacks_with_failures, profile, console)
 
         return 0
 
-    def _delete_stack(self, stack_name: str, region: str, console: Console) -> int:
-        """Delete a CloudFormation stack using boto3.
+    def _delete_stack(
+        self, stack_name: str, console: "Console", cf_manager: "CloudFormationManager"
+    ) -> tuple[int | None, list[dict] | None]:
+        """Start deleting a CloudFormation stack without waiting for it.
 
         Returns:
-            0: Success (stack deleted or doesn't exist)
+            Tuple of (code, failed resources). The code is one of:
+            None: Deletion started; the caller waits for it with ``wait_for_deletes``
+            0: Success (stack doesn't exist)
             1: Partial success (DELETE_FAILED - some resources need manual cleanup)
             2: Actual error (permissions, network, etc.)
+            Failed resources are None when they still need to be looked up.
         """
-        cf_manager = CloudFormationManager(region=region)
-
         # Check if stack exists
-        status = cf_manager.get_stack_status(stack_name)
+        status = self._status_map.get(stack_name)
         if not status:
             console.print(f"[yellow]Stack {stack_name} not found or already deleted[/yellow]")
-            return 0
+            return 0, []
 
-        # If already in DELETE_FAILED, report it (don't retry)
+        # If already in DELETE_FAILED, report it (don't retry) along with what it left behind
         if status == "DELETE_FAILED":
             console.print(f"[yellow]Stack {stack_name} is in DELETE_FAILED state[/yellow]")
-            return 1  # Signal that manual cleanup is needed
+            return 1, self._get_failed_resources(stack_name, cf_manager)  # Signal that manual cleanup is needed
 
-        # Use progress indicator
-        with Progress(
-            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-        ) as progress:
-            task = progress.add_task(f"Deleting stack {stack_name}...", total=None)
-
-            # Delete the stack with event tracking
-            result = cf_manager.delete_stack(
-                stack_name=stack_name,
-                force=True,
-                on_event=lambda e: progress.update(
-                    task, description=f"Deleting {e.get('LogicalResourceId', stack_name)}..."
-                ),
-                timeout=300,
-            )
-
-            progress.update(task, completed=True)
-
-            if result.success:
-                return 0
-
-            # Check if it ended up in DELETE_FAILED (some resources retained)
-            new_status = cf_manager.get_stack_status(stack_name)
-            if new_status == "DELETE_FAILED":
-                return 1  # Not an error, just needs manual cleanup
-
-            # Actual error
+        result = cf_manager.initiate_delete(stack_name)
+        if not result.success:
             console.print(f"[red]Error deleting stack: {result.error}[/red]")
-            return 2
+            # The delete was rejected, so no resources were touched
+            return 2, []
+        return None, None
+
+    def _deletion_result(self, stack_name: str, status: str | None, console: "Console") -> tuple[int, None]:
+        """Map a stack's final status from ``wait_for_deletes`` to a ``_delete_stack`` result."""
+        if status == "DELETE_COMPLETE":
+            return 0, None
+        if status == "DELETE_FAILED":
+            return 1, None  # Not an error, just needs manual cleanup
 
-    def _get_failed_resources(self, stack_name: str, region: str) -> list[dict]:
+        # Actual error
+        console.print(f"[red]Error deleting stack: {stack_name} did not finish deleting (status: {status})[/red]")
+        return 2, None
+
+    def _get_failed_resources(self, stack_name: str, cf_manager: "CloudFormationManager") -> list[dict]:
         """Get list of resources that failed to delete from a stack."""
-        cf_manager = CloudFormationManager(region=region)
         return cf_manager.get_failed_resources(stack_name)
 
     def _show_cleanup_summary(
@@ -199,82 +352,45 @@ class DestroyCommand(Command):
         failed_resources: list[dict],
         stacks: list[str],
         profile,
-        console: Console,
+        console: "Console",
     ) -> None:
         """Show cleanup instructions for failed resources."""
         if not failed_resources and not stacks:
             console.print("\n[green]✓ All stacks destroyed successfully![/green]")
             return
 
-        console.print("\n[yellow]⚠ Manual cleanup required for the following resources:[/yellow]\n")
+        # Build the whole summary and print it in one call rather than one render per line
+        lines = ["\n[yellow]⚠ Manual cleanup required for the following resources:[/yellow]\n"]
 
-        # Group by resource type for organized output
-        by_type: dict[str, list[dict]] = {}
+        region = profile.aws_region
+
+        # Render every resource in one pass, grouped by type; sections are emitted in a fixed order below
+        rendered: defaultdict[str, list[str]] = defaultdict(list)
         for r in failed_resources:
             rtype = r["resource_type"]
-            if rtype not in by_type:
-                by_type[rtype] = []
-            by_type[rtype].append(r)
-
-        region = profile.aws_region
+            render = CLEANUP_SECTIONS[rtype][1] if rtype in CLEANUP_SECTIONS else _render_other
+            rendered[rtype].extend(render(r, region))
 
-        # S3 Buckets
-        if "AWS::S3::Bucket" in by_type:
-            console.print("[bold]S3 Buckets (must be emptied first):[/bold]")
-            for r in by_type["AWS::S3::Bucket"]:
-                bucket = r["physical_id"]
-                console.print(f"  • {bucket}")
-                console.print(f"    [cyan]aws s3 rm s3://{bucket} --recursive[/cyan]")
-                console.print(f"    [cyan]aws s3 rb s3://{bucket}[/cyan]")
-            console.print()
-
-        # CloudWatch Log Groups
-        if "AWS::Logs::LogGroup" in by_type:
-            console.print("[bold]CloudWatch Log Groups:[/bold]")
-            for r in by_type["AWS::Logs::LogGroup"]:
-                log_group = r["physical_id"]
-                console.print(f"  • {log_group}")
-                console.print(
-                    f"    [cyan]aws logs delete-log-group --log-group-name {log_group} --region {region}[/cyan]"
-                )
-            console.print()
-
-        # DynamoDB Tables
-        if "AWS::DynamoDB::Table" in by_type:
-            console.print("[bold]DynamoDB Tables:[/bold]")
-            for r in by_type["AWS::DynamoDB::Table"]:
-                table = r["physical_id"]
-                console.print(f"  • {table}")
-                console.print(f"    [cyan]aws dynamodb delete-table --table-name {table} --region {region}[/cyan]")
-            console.print()
-
-        # ECR Repositories
-        if "AWS::ECR::Repository" in by_type:
-            console.print("[bold]ECR Repositories (must delete images first):[/bold]")
-            for r in by_type["AWS::ECR::Repository"]:
-                repo = r["physical_id"]
-                console.print(f"  • {repo}")
-                console.print(
-                    f"    [cyan]aws ecr delete-repository --repository-name {repo} --force --region {region}[/cyan]"
-                )
-            console.print()
+        for rtype, (heading, _render) in CLEANUP_SECTIONS.items():
+            if rtype in rendered:
+                lines.append(f"[bold]{heading}[/bold]")
+                lines.extend(rendered[rtype])
+                lines.append("")
 
         # Other resources
-        known_types = ["AWS::S3::Bucket", "AWS::Logs::LogGroup", "AWS::DynamoDB::Table", "AWS::ECR::Repository"]
-        other_types = [t for t in by_type if t not in known_types]
+        other_types = [t for t in rendered if t not in KNOWN_TYPES]
         if other_types:
-            console.print("[bold]Other Resources:[/bold]")
+            lines.append("[bold]Other Resources:[/bold]")
             for rtype in other_types:
-                for r in by_type[rtype]:
-                    console.print(f"  • {r['logical_id']} ({rtype}): {r['physical_id']}")
-                    console.print(f"    Reason: {r['status_reason']}")
-            console.print()
+                lines.extend(rendered[rtype])
+            lines.append("")
 
         # Final instructions
         if stacks:
-            console.print("[yellow]After manual cleanup, delete the failed stacks:[/yellow]")
+            lines.append("[yellow]After manual cleanup, delete the failed stacks:[/yellow]")
             for stack in stacks:
-                console.print(f"  [cyan]aws cloudformation delete-stack --stack-name {stack} --region {region}[/cyan]")
-            console.print()
+                lines.append(f"  [cyan]aws cloudformation delete-stack --stack-name {stack} --region {region}[/cyan]")
+            lines.append("")
 
-        console.print("For more information, see: assets/docs/TROUBLESHOOTING.md")
+        lines.append("For more information, see: assets/docs/TROUBLESHOOTING.md")
+        console.print("\n".join(lines))
@@ -3,26 +3,242 @@
 
 """Distribute command - Share packages via secure presigned URLs or authenticated landing page."""
 
+import copy
 import hashlib
+import io
 import json
-import shutil
+import os
 import tempfile
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import boto3
-from boto3.s3.transfer import TransferConfig
-from botocore.exceptions import ClientError
 from cleo.commands.command import Command
 from cleo.helpers import option
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
 from claude_code_with_bedrock.cli.utils.aws import get_stack_outputs
 from claude_code_with_bedrock.config import Config
 
+# boto3 and rich.progress are imported where they are used so `ccwb distribute --help` doesn't load them
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
+
+# Multipart settings shared by every package upload; parts go up in parallel within each file
+S3_UPLOAD_CONCURRENCY = 10
+S3_TRANSFER_SETTINGS = {
+    "multipart_threshold": 8 * 1024 * 1024,
+    "multipart_chunksize": 8 * 1024 * 1024,
+    "max_concurrency": S3_UPLOAD_CONCURRENCY,
+    "max_io_queue": 100,
+    "use_threads": True,
+}
+# Large single-file uploads grow their parts so the upload takes about this many requests
+S3_TARGET_PARTS = 32
+# Adaptive retries for throttling and keepalive for long-lived connections, shared by every client
+CLIENT_SETTINGS = {
+    "retries": {"max_attempts": 10, "mode": "adaptive"},
+    "tcp_keepalive": True,
+}
+# S3 also needs enough pooled connections for every part thread
+S3_CLIENT_SETTINGS = {**CLIENT_SETTINGS, "max_pool_connections": S3_UPLOAD_CONCURRENCY * 2}
+# Guards client creation from the shared boto3 session
+_CLIENT_LOCK = threading.Lock()
+
+
+# Maximum keys S3 accepts in a single DeleteObjects request
+S3_DELETE_BATCH = 1000
+
+# Credential-process binary names that mark a build as containing each platform
+PLATFORM_BY_FILE = {
+    "credential-process-macos-arm64": "macos-arm64",
+    "credential-process-macos-intel": "macos-intel",
+    "credential-process-linux-x64": "linux-x64",
+    "credential-process-linux-arm64": "linux-arm64",
+    "credential-process-windows.exe": "windows",
+}
+
+# Files that sat directly in dist/ before builds were organised into profile/timestamp directories
+OLD_STRUCTURE_FILES = frozenset(PLATFORM_BY_FILE) | {"config.json", "install.sh"}
+
+# Builds are scanned concurrently when listing dist/; bounded since this is disk-bound
+SCAN_MAX_WORKERS = 8
+
+
+def _scan_build(path: Path) -> tuple[list[str], int]:
+    """Detect the platforms in a build directory and total its file sizes in one pass.
+
+    Returns:
+        The platforms present (in PLATFORM_BY_FILE order) and the size in bytes.
+    """
+    found = set()
+    total = 0
+    pending = [path]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total += entry.stat().st_size
+                            if directory == path and entry.name in PLATFORM_BY_FILE:
+                                found.add(entry.name)
+                    except OSError:
+                        # Removed or unreadable mid-scan; it won't be distributed either
+                        continue
+        except OSError:
+            continue
+    return [platform for name, platform in PLATFORM_BY_FILE.items() if name in found], total
+
+
+# Files copied from the build directory into the presigned-URL package, in archive order
+ARCHIVE_FILES = (
+    # Executables for each platform
+    "credential-process-macos-arm64",
+    "credential-process-macos-intel",
+    "credential-process-linux-x64",
+    "credential-process-linux-arm64",
+    "credential-process-windows.exe",
+    # OTEL helpers
+    "otel-helper-macos-arm64",
+    "otel-helper-macos-intel",
+    "otel-helper-linux-x64",
+    "otel-helper-linux-arm64",
+    "otel-helper-windows.exe",
+    # Installation scripts
+    "install.sh",
+    "install.bat",
+    # Configuration
+    "config.json",
+    "README.md",
+)
+
+# Package files worth deflating; compiled binaries barely shrink, so they are stored as-is
+COMPRESSIBLE_SUFFIXES = (".json", ".md", ".sh", ".bat")
+
+
+def _compress_type(arcname: str) -> int:
+    """ZIP compression method for a package file."""
+    import zipfile
+
+    return zipfile.ZIP_DEFLATED if arcname.endswith(COMPRESSIBLE_SUFFIXES) else zipfile.ZIP_STORED
+
+
+def _file_mtimes(path: Path) -> dict[str, float]:
+    """Modification time of each regular file directly in path, from a single directory listing."""
+    mtimes = {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                mtimes[entry.name] = entry.stat().st_mtime
+    return mtimes
+
+
+def _manifest_body(manifest: dict) -> bytes:
+    """Indented UTF-8 JSON for latest.json, serialised by orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(manifest, indent=2).encode("utf-8")
+    return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+
+
+# What to do about missing Windows binaries for the newest CodeBuild status
+WINDOWS_BUILD_ACTIONS = {"SUCCEEDED": "download", "IN_PROGRESS": "wait"}
+
+
+def _windows_build_action(
+    status: str | None, build_time: datetime | None, local_time: datetime | None = None
+) -> str | None:
+    """Decide what to do with a Windows CodeBuild probe result.
+
+    Args:
+        status: Status from _probe_windows_build.
+        build_time: When the newest successful build finished, if any.
+        local_time: Build time of the Windows binaries already in the package, if any.
+
+    Returns:
+        "download" to fetch the build's artifacts, "wait" when a build is still running, or None.
+    """
+    if local_time is not None:
+        # Local binaries are only replaced by a newer successful build
+        return "download" if build_time and build_time > local_time else None
+    return WINDOWS_BUILD_ACTIONS.get(status)
+
+
+def _platform_zip_key(platform: str, package_version: str) -> str:
+    """S3 key of a landing-page platform ZIP."""
+    return f"packages/{platform}/claude-code-bedrock-{package_version}-{platform}.zip"
+
+
+class ZipSourceCache:
+    """Source files shared by several platform ZIPs, read from disk once.
+
+    Every file lands in its platform ZIP and in all-platforms.zip, and config.json/README.md
+    in every ZIP, so the concurrent builds share one copy of each file's bytes and metadata.
+    The build directory is listed once up front, replacing per-file exists() probes.
+    """
+
+    def __init__(self, package_path: Path):
+        self.present = frozenset(entry.name for entry in os.scandir(package_path) if entry.is_file())
+        settings_dir = package_path / "claude-settings"
+        self.settings_files = (
+            [file for file in settings_dir.rglob("*") if file.is_file()] if settings_dir.is_dir() else []
+        )
+        self._entries = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def write(self, zipf, source_path: Path, arcname: str) -> None:
+        """Add source_path to zipf as arcname, reading it only on first use."""
+        import zipfile
+
+        with self._lock:
+            path_lock = self._locks.setdefault(source_path, threading.Lock())
+        with path_lock:
+            if source_path not in self._entries:
+                self._entries[source_path] = (zipfile.ZipInfo.from_file(source_path), source_path.read_bytes())
+        template, data = self._entries[source_path]
+
+        # writestr fills in sizes and offsets, so each archive gets its own ZipInfo
+        zinfo = zipfile.ZipInfo(arcname, template.date_time)
+        zinfo.external_attr = template.external_attr
+        zipf.writestr(zinfo, data, compress_type=_compress_type(arcname))
+
+
+class HashingWriter:
+    """Write-only file wrapper that hashes bytes as they are written.
+
+    Deliberately has no ``seek`` so ``zipfile`` writes in streaming mode and never
+    rewrites earlier bytes, keeping the digest identical to the file on disk.
+    """
+
+    def __init__(self, fh):
+        self.fh = fh
+        self.h = hashlib.sha256()
+
+    def write(self, b):
+        self.h.update(b)
+        return self.fh.write(b)
+
+    def tell(self):
+        return self.fh.tell()
+
+    def flush(self):
+        self.fh.flush()
+
+    def close(self):
+        self.fh.close()
+
 
 class S3UploadProgress:
     """Track S3 upload progress."""
@@ -34,6 +250,9 @@ class S3UploadProgress:
         self._progress_bar = progress_bar
         self._lock = threading.Lock()
         self._task_id = None
+        # Redrawing on every boto3 chunk costs more than the upload on fast links; batch into 256 KiB steps
+        self._threshold = 256 * 1024
+        self._pending = 0
 
     def set_task_id(self, task_id):
         """Set the progress bar task ID."""
@@ -43,6 +262,10 @@ class S3UploadProgress:
         """Called by boto3 during upload."""
         with self._lock:
             self._seen_so_far += bytes_amount
+            self._pending += bytes_amount
+            if self._pending < self._threshold and self._seen_so_far < self._size:
+                return
+            self._pending = 0
             if self._task_id is not None:
                 self._progress_bar.update(self._task_id, completed=self._seen_so_far)
 
@@ -75,23 +298,9 @@ class DistributeCommand(Command):
         if not dist_dir.exists():
             return False
 
-        # Look for files that would be in old structure (credential-process binaries)
-        old_files = [
-            "credential-process-macos-arm64",
-            "credential-process-macos-intel",
-            "credential-process-linux-x64",
-            "credential-process-linux-arm64",
-            "credential-process-windows.exe",
-            "config.json",
-            "install.sh",
-        ]
-
-        # If any of these files exist directly in dist/, it's old structure
-        for filename in old_files:
-            if (dist_dir / filename).exists():
-                return True
-
-        return False
+        # If any of the old-structure files sit directly in dist/, it's old structure
+        with os.scandir(dist_dir) as entries:
+            return any(entry.name in OLD_STRUCTURE_FILES for entry in entries)
 
     def _scan_distributions(self, dist_dir: Path) -> dict:
         """Scan dist/ for organized profile/timestamp builds."""
@@ -100,56 +309,40 @@ class DistributeCommand(Command):
         if not dist_dir.exists():
             return builds
 
-        # Iterate through profile directories
-        for profile_dir in sorted(dist_dir.iterdir()):
-            if not profile_dir.is_dir():
+        candidates = []
+
+        # Iterate through profile directories; DirEntry.is_dir() reuses the type from the listing
+        for profile_entry in sorted(os.scandir(dist_dir), key=lambda entry: entry.name):
+            if not profile_entry.is_dir():
                 continue
 
-            profile_name = profile_dir.name
+            profile_name = profile_entry.name
             builds[profile_name] = []
 
             # Iterate through timestamp directories
-            for timestamp_dir in sorted(profile_dir.iterdir(), reverse=True):  # Most recent first
-                if not timestamp_dir.is_dir():
-                    continue
-
-                # Detect platforms
-                platforms = self._detect_platforms(timestamp_dir)
-                if not platforms:
-                    continue
-
-                # Calculate size
-                size = sum(f.stat().st_size for f in timestamp_dir.rglob("*") if f.is_file())
-
-                builds[profile_name].append(
-                    {
-                        "timestamp": timestamp_dir.name,
-                        "path": timestamp_dir,
-                        "platforms": platforms,
-                        "size": size,
-                    }
-                )
+            timestamp_entries = sorted(os.scandir(profile_entry.path), key=lambda entry: entry.name, reverse=True)
+            for timestamp_entry in timestamp_entries:  # Most recent first
+                if timestamp_entry.is_dir():
+                    candidates.append((profile_name, Path(timestamp_entry.path)))
+
+        # Detect platforms and calculate size for every build at once, one directory walk each
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(candidates))) as executor:
+                scans = executor.map(_scan_build, [timestamp_dir for _, timestamp_dir in candidates])
+                for (profile_name, timestamp_dir), (platforms, size) in zip(candidates, scans, strict=True):
+                    if not platforms:
+                        continue
+                    builds[profile_name].append(
+                        {
+                            "timestamp": timestamp_dir.name,
+                            "path": timestamp_dir,
+                            "platforms": platforms,
+                            "size": size,
+                        }
+                    )
 
         return builds
 
-    def _detect_platforms(self, build_dir: Path) -> list:
-        """Detect which platforms are available in a build."""
-        platforms = []
-
-        platform_files = {
-            "macos-arm64": "credential-process-macos-arm64",
-            "macos-intel": "credential-process-macos-intel",
-            "linux-x64": "credential-process-linux-x64",
-            "linux-arm64": "credential-process-linux-arm64",
-            "windows": "credential-process-windows.exe",
-        }
-
-        for platform, filename in platform_files.items():
-            if (build_dir / filename).exists():
-                platforms.append(platform)
-
-        return platforms
-
     def _format_size(self, bytes_size: int) -> str:
         """Format bytes to human readable size."""
         for unit in ["B", "KB", "MB", "GB"]:
@@ -174,19 +367,17 @@ class DistributeCommand(Command):
 
             console.print(f"\n[bold]Profile: {profile_name}[/bold]")
 
-            for build in profile_builds:
+            for position, build in enumerate(profile_builds):
                 timestamp = build["timestamp"]
                 platforms_str = ", ".join(build["platforms"])
                 size_str = self._format_size(build["size"])
+                latest_suffix = " (Latest)" if position == 0 else ""
 
-                label = f"  [{idx}] {timestamp}"
-                if build == profile_builds[0]:
-                    label += " (Latest)"
-                console.print(label)
+                console.print(f"  [{idx}] {timestamp}{latest_suffix}")
                 console.print(f"      Platforms: {platforms_str}")
                 console.print(f"      Size: {size_str}")
 
-                choice_text = f"{profile_name} - {timestamp}" + (" (Latest)" if build == profile_builds[0] else "")
+                choice_text = f"{profile_name} - {timestamp}{latest_suffix}"
                 choices.append(choice_text)
                 build_map[choice_text] = build["path"]
                 idx += 1
@@ -320,7 +511,7 @@ class DistributeCommand(Command):
         if profile.enable_distribution:
             dist_stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
             try:
-                dist_outputs = get_stack_outputs(dist_stack_name, profile.aws_region)
+                dist_outputs = self._distribution_outputs(dist_stack_name, profile.aws_region)
                 if not dist_outputs:
                     console.print("[red]Distribution stack not deployed.[/red]")
                     console.print("Deploy the distribution stack first:")
@@ -354,8 +545,10 @@ class DistributeCommand(Command):
 
     def _get_latest_url(self, profile, console: Console) -> int:
         """Retrieve the latest distribution URL from Parameter Store."""
+        from botocore.exceptions import ClientError
+
         try:
-            ssm = boto3.client("ssm", region_name=profile.aws_region)
+            ssm = self._client("ssm", profile.aws_region)
 
             # Get parameter
             response = ssm.get_parameter(
@@ -365,18 +558,18 @@ class DistributeCommand(Command):
             # Parse the stored data
             data = json.loads(response["Parameter"]["Value"])
 
-            # Check if URL is still valid
+            # Check if URL is still valid. Older entries stored naive local time, which
+            # timestamp() also interprets as local, so both forms compare correctly
             expires = datetime.fromisoformat(data["expires"])
-            now = datetime.now()
 
-            if expires < now:
+            if expires.timestamp() < time.time():
                 console.print("[red]Latest distribution URL has expired.[/red]")
                 console.print("Generate a new one with: poetry run ccwb distribute")
                 return 1
 
             # Display information
             console.print("\n[bold]Latest Distribution URL[/bold]")
-            console.print(f"Expires: {expires.strftime('%Y-%m-%d %H:%M:%S')}")
+            console.print(f"Expires: {expires.astimezone().strftime('%Y-%m-%d %H:%M:%S')}")
             console.print(f"Package: {data.get('filename', 'Unknown')}")
             console.print(f"SHA256: {data.get('checksum', 'Unknown')}")
             console.print(f"\n[cyan]{data['url']}[/cyan]")
@@ -422,9 +615,8 @@ class DistributeCommand(Command):
 
     def _upload_landing_page_packages(self, profile, console: Console, package_path: Path) -> int:
         """Upload platform-specific packages to S3 for the landing page."""
-        import zipfile
-
-        import boto3
+        from botocore.exceptions import ClientError
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
         # Validate package directory
         if not package_path.exists():
@@ -432,10 +624,18 @@ class DistributeCommand(Command):
             console.print("Run 'poetry run ccwb package' first to build packages.")
             return 1
 
+        # Without Windows binaries, ask CodeBuild about recent builds while the stack outputs are fetched
+        windows_exe = package_path / "credential-process-windows.exe"
+        windows_probe = None
+        if not windows_exe.exists():
+            probe_executor = ThreadPoolExecutor(max_workers=1)
+            windows_probe = probe_executor.submit(self._probe_windows_build, profile)
+            probe_executor.shutdown(wait=False)
+
         # Get S3 bucket from distribution stack outputs
         dist_stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
         try:
-            stack_outputs = get_stack_outputs(dist_stack_name, profile.aws_region)
+            stack_outputs = self._distribution_outputs(dist_stack_name, profile.aws_region)
             bucket_name = stack_outputs.get("DistributionBucket")
             landing_url = stack_outputs.get("DistributionURL")
             if not bucket_name:
@@ -448,39 +648,24 @@ class DistributeCommand(Command):
 
         # Check for Windows binaries and auto-download if needed
         console.print("\n[bold]Checking for Windows binaries...[/bold]")
-        windows_exe = package_path / "credential-process-windows.exe"
-        if not windows_exe.exists():
+        if windows_probe is not None:
             # Check if Windows build is completed and download it
             try:
-                project_name = f"{profile.identity_pool_name}-windows-build"
-                codebuild = boto3.client("codebuild", region_name=profile.aws_region)
-
-                # List recent builds
-                response = codebuild.list_builds_for_project(projectName=project_name, sortOrder="DESCENDING")
-
-                if response.get("ids"):
-                    # Get details of recent builds
-                    build_ids = response["ids"][:5]  # Check last 5 builds
-                    builds_response = codebuild.batch_get_builds(ids=build_ids)
-
-                    for build in builds_response.get("builds", []):
-                        if build["buildStatus"] == "SUCCEEDED":
-                            # Found a successful build, download it
-                            build_time = build.get("endTime", build.get("startTime"))
-                            console.print(
-                                f"  [cyan]Found completed Windows build from "
-                                f"{build_time.strftime('%Y-%m-%d %H:%M')}[/cyan]"
-                            )
-                            console.print("  [cyan]Downloading Windows artifacts...[/cyan]")
+                status, build_time = windows_probe.result()
+                action = _windows_build_action(status, build_time)
+                if action == "download":
+                    # Found a successful build, download it
+                    console.print(
+                        f"  [cyan]Found completed Windows build from {build_time.strftime('%Y-%m-%d %H:%M')}[/cyan]"
+                    )
+                    console.print("  [cyan]Downloading Windows artifacts...[/cyan]")
 
-                            if self._download_windows_artifacts(profile, package_path, console):
-                                console.print("  [green]✓ Downloaded Windows artifacts[/green]")
-                            else:
-                                console.print("  [yellow]⚠️  Failed to download Windows artifacts[/yellow]")
-                            break
-                        elif build["buildStatus"] == "IN_PROGRESS":
-                            console.print("  [yellow]⚠️  Windows build in progress[/yellow]")
-                            break
+                    if self._download_windows_artifacts(profile, package_path, console):
+                        console.print("  [green]✓ Downloaded Windows artifacts[/green]")
+                    else:
+                        console.print("  [yellow]⚠️  Failed to download Windows artifacts[/yellow]")
+                elif action == "wait":
+                    console.print("  [yellow]⚠️  Windows build in progress[/yellow]")
             except Exception as e:
                 console.print(f"  [dim]Could not check Windows build status: {e}[/dim]")
         else:
@@ -518,6 +703,9 @@ class DistributeCommand(Command):
             ],
         }
 
+        # List the build directory once; platform detection and every ZIP build share it
+        sources = ZipSourceCache(package_path)
+
         # Determine which platforms are available
         available_platforms = {}
         for platform, files in platform_files.items():
@@ -526,7 +714,7 @@ class DistributeCommand(Command):
             for source_file, _ in files:
                 # Check if this is an executable (contains these strings, not just ends with them)
                 if source_file.endswith(".exe") or "credential-process" in source_file or "otel-helper" in source_file:
-                    if (package_path / source_file).exists():
+                    if source_file in sources.present:
                         has_platform = True
                         break
 
@@ -547,9 +735,6 @@ class DistributeCommand(Command):
         all_files = list(set(all_files))
         available_platforms["all-platforms"] = all_files
 
-        # Create temp directory for package ZIPs
-        temp_dir = Path(tempfile.mkdtemp())
-
         # Extract profile name and timestamp from package_path
         # Path format: dist/3p-claude-code/2025-11-11-144312
         profile_name = package_path.parent.name
@@ -573,29 +758,60 @@ class DistributeCommand(Command):
             package_version = "1.0.0"
 
         # Clean up old packages in S3 to prevent stale platform packages from appearing
-        s3 = boto3.client("s3", region_name=profile.aws_region)
+        s3 = self._client("s3", profile.aws_region)
         console.print("\n[dim]Cleaning up old packages from S3...[/dim]")
 
-        # Delete all existing packages for each platform (versioned and legacy)
+        # Delete all existing packages for each platform (versioned and legacy), except the ones this
+        # run would upload again; those are overwritten, or kept as-is when they are already current
         platforms_to_clean = ["windows", "linux", "mac", "all-platforms"]
+        current_keys = {_platform_zip_key(platform, package_version) for platform in available_platforms}
+        # Legacy latest.zip is deleted unconditionally; S3 ignores keys that don't exist
+        stale_keys = [f"packages/{platform}/latest.zip" for platform in platforms_to_clean]
         for platform in platforms_to_clean:
             try:
-                # Clean up legacy latest.zip
-                s3.delete_object(Bucket=bucket_name, Key=f"packages/{platform}/latest.zip")
-                # Clean up any existing versioned files
+                # Collect any existing versioned files
                 response = s3.list_objects_v2(
                     Bucket=bucket_name,
                     Prefix=f"packages/{platform}/claude-code-bedrock-",
                 )
-                if "Contents" in response:
-                    for obj in response["Contents"]:
-                        s3.delete_object(Bucket=bucket_name, Key=obj["Key"])
+                stale_keys.extend(obj["Key"] for obj in response.get("Contents", []) if obj["Key"] not in current_keys)
             except ClientError:
-                # Ignore errors if file doesn't exist
+                # Ignore errors if the prefix can't be listed
+                pass
+        # One multi-object delete per S3_DELETE_BATCH keys instead of a request per object
+        for start in range(0, len(stale_keys), S3_DELETE_BATCH):
+            batch = stale_keys[start : start + S3_DELETE_BATCH]
+            try:
+                s3.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except ClientError:
+                # Stale packages are harmless; the new upload still proceeds
                 pass
 
         # Create and upload each platform package
         uploaded_count = 0
+        metadata = {
+            "profile": profile_name,
+            "timestamp": build_timestamp,
+            "release_date": release_date,
+            "release_datetime": release_datetime,
+            "version": package_version,
+        }
+
+        # Size and SHA256 of each uploaded platform ZIP
+        zip_info = {}
+
+        def build_and_upload(platform: str, files: list) -> tuple[int, str, bool]:
+            buffer, size_bytes, digest = self._build_platform_zip(platform, files, package_path, sources)
+            s3_key = _platform_zip_key(platform, package_version)
+            if self._platform_zip_is_current(s3, bucket_name, s3_key, build_timestamp, digest):
+                return size_bytes, digest, False
+            self._upload_platform_zip(
+                s3, bucket_name, platform, buffer, package_version, {**metadata, "sha256": digest}
+            )
+            return size_bytes, digest, True
 
         with Progress(
             SpinnerColumn(),
@@ -606,50 +822,24 @@ class DistributeCommand(Command):
         ) as progress:
             task = progress.add_task("Uploading packages to S3...", total=len(available_platforms))
 
-            for platform, files in available_platforms.items():
-                # Create platform-specific ZIP
-                zip_path = temp_dir / f"{platform}.zip"
-
-                with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                    # Create claude-code-package directory in the ZIP
-                    for source_file, archive_name in files:
-                        source_path = package_path / source_file
-                        if source_path.exists():
-                            zipf.write(source_path, f"claude-code-package/{archive_name}")
-
-                    # Include claude-settings if it exists
-                    settings_dir = package_path / "claude-settings"
-                    if settings_dir.exists() and settings_dir.is_dir():
-                        for file in settings_dir.rglob("*"):
-                            if file.is_file():
-                                rel_path = file.relative_to(package_path)
-                                zipf.write(file, f"claude-code-package/{rel_path}")
-
-                # Upload to S3 with versioned filename
-                versioned_filename = f"claude-code-bedrock-{package_version}-{platform}.zip"
-                s3_key = f"packages/{platform}/{versioned_filename}"
-                try:
-                    s3.upload_file(
-                        str(zip_path),
-                        bucket_name,
-                        s3_key,
-                        ExtraArgs={
-                            "ContentDisposition": f'attachment; filename="{versioned_filename}"',
-                            "ContentType": "application/zip",
-                            "Metadata": {
-                                "profile": profile_name,
-                                "timestamp": build_timestamp,
-                                "release_date": release_date,
-                                "release_datetime": release_datetime,
-                                "version": package_version,
-                            },
-                        },
-                    )
+            # Zipping one platform overlaps with uploading another; the S3 client is shared across threads.
+            # Threads are enough here: binaries are stored, and zlib releases the GIL while deflating the rest.
+            with ThreadPoolExecutor(max_workers=len(available_platforms)) as executor:
+                futures = {
+                    executor.submit(build_and_upload, platform, files): platform
+                    for platform, files in available_platforms.items()
+                }
+                for future in as_completed(futures):
+                    platform = futures[future]
+                    try:
+                        size_bytes, digest, uploaded = future.result()
+                    except ClientError as e:
+                        console.print(f"[red]Failed to upload {platform} package: {e}[/red]")
+                        continue
+                    zip_info[platform] = size_bytes, digest
                     uploaded_count += 1
-                    progress.update(task, advance=1, description=f"Uploaded {platform} package")
-                except ClientError as e:
-                    console.print(f"[red]Failed to upload {platform} package: {e}[/red]")
-                    continue
+                    status = "Uploaded" if uploaded else "Unchanged, skipped"
+                    progress.update(task, advance=1, description=f"{status} {platform} package")
 
         # Upload latest.json manifest AFTER all platform zips are uploaded
         # This ensures clients never see a version that doesn't have all binaries available
@@ -676,10 +866,8 @@ class DistributeCommand(Command):
                     else:
                         platform_group = "windows"
 
-                    zip_path = temp_dir / f"{platform_group}.zip"
-                    if zip_path.exists():
-                        file_size = zip_path.stat().st_size
-                        file_checksum = self._calculate_checksum(zip_path)
+                    if platform_group in zip_info:
+                        file_size, file_checksum = zip_info[platform_group]
                         binaries[arch_key] = {
                             "s3_key": s3_key,
                             "sha256": file_checksum,
@@ -692,11 +880,10 @@ class DistributeCommand(Command):
                     "binaries": binaries,
                 }
 
-                manifest_json = json.dumps(manifest, indent=2)
                 s3.put_object(
                     Bucket=bucket_name,
                     Key="packages/latest.json",
-                    Body=manifest_json.encode("utf-8"),
+                    Body=_manifest_body(manifest),
                     ContentType="application/json",
                 )
                 console.print(f"[green]✓ Uploaded latest.json manifest (version {package_version})[/green]")
@@ -705,9 +892,6 @@ class DistributeCommand(Command):
             except Exception as e:
                 console.print(f"[yellow]Warning: Failed to upload latest.json manifest: {e}[/yellow]")
 
-        # Clean up temp directory
-        shutil.rmtree(temp_dir)
-
         # Show success message
         if uploaded_count > 0:
             console.print(f"\n[bold green]✓ Successfully uploaded {uploaded_count} platform packages![/bold green]")
@@ -723,11 +907,111 @@ class DistributeCommand(Command):
             console.print("[red]Failed to upload any packages.[/red]")
             return 1
 
+    def _build_platform_zip(
+        self, platform: str, files: list, package_path: Path, sources: ZipSourceCache | None = None
+    ) -> tuple[io.BytesIO, int, str]:
+        """Create the landing-page ZIP for one platform in memory.
+
+        Packages are tens of MB, so building them in memory skips writing and re-reading a temp file.
+
+        Args:
+            sources: Cache shared with the other platform builds so common files are read once.
+
+        Returns:
+            The ZIP buffer rewound to the start, its size in bytes and its SHA256 hex digest.
+        """
+        import zipfile
+
+        if sources is None:
+            sources = ZipSourceCache(package_path)
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
+            # Create claude-code-package directory in the ZIP
+            for source_file, archive_name in files:
+                if source_file in sources.present:
+                    sources.write(zipf, package_path / source_file, f"claude-code-package/{archive_name}")
+
+            # Include claude-settings if it exists
+            for file in sources.settings_files:
+                rel_path = file.relative_to(package_path)
+                sources.write(zipf, file, f"claude-code-package/{rel_path}")
+
+        digest = hashlib.sha256(buffer.getbuffer()).hexdigest()
+        size_bytes = buffer.tell()
+        buffer.seek(0)
+        return buffer, size_bytes, digest
+
+    def _platform_zip_is_current(self, s3, bucket_name: str, s3_key: str, build_timestamp: str, digest: str) -> bool:
+        """Whether S3 already holds this exact platform ZIP from this build."""
+        from botocore.exceptions import ClientError
+
+        try:
+            head = s3.head_object(Bucket=bucket_name, Key=s3_key)
+        except ClientError:
+            # Missing, or not readable; upload it
+            return False
+        stored = head.get("Metadata", {})
+        # The digest catches builds edited in place since the last upload
+        return stored.get("timestamp") == build_timestamp and stored.get("sha256") == digest
+
+    def _published_distribution(self, profile) -> dict | None:
+        """The distribution currently recorded in Parameter Store, or None if there isn't a readable one."""
+        try:
+            ssm = self._client("ssm", profile.aws_region)
+            response = ssm.get_parameter(
+                Name=f"/claude-code/{profile.identity_pool_name}/distribution/latest", WithDecryption=True
+            )
+            return json.loads(response["Parameter"]["Value"])
+        except Exception:
+            # Best effort only; without it the package is simply uploaded again
+            return None
+
+    def _warm_s3_connection(self, s3, bucket_name: str) -> None:
+        """Make one cheap request so credentials and a pooled connection are ready for the upload."""
+        try:
+            s3.head_bucket(Bucket=bucket_name)
+        except Exception:
+            # Only a warm-up; the upload itself reports any real problem
+            pass
+
+    def _package_is_published(self, s3, bucket_name: str, published: dict | None, checksum: str) -> bool:
+        """Whether the published distribution is this exact archive and its object is still in S3."""
+        from botocore.exceptions import ClientError
+
+        if not published or published.get("checksum") != checksum or not published.get("package_key"):
+            return False
+        try:
+            head = s3.head_object(Bucket=bucket_name, Key=published["package_key"])
+        except ClientError:
+            # Expired by a lifecycle rule or deleted by hand; upload it again
+            return False
+        return head.get("Metadata", {}).get("checksum") == checksum
+
+    def _upload_platform_zip(
+        self, s3, bucket_name: str, platform: str, buffer: io.BytesIO, package_version: str, metadata: dict
+    ) -> None:
+        """Upload one platform ZIP to S3 under its versioned filename."""
+        s3_key = _platform_zip_key(platform, package_version)
+        versioned_filename = s3_key.rsplit("/", 1)[1]
+        s3.upload_fileobj(
+            buffer,
+            bucket_name,
+            s3_key,
+            ExtraArgs={
+                "ContentDisposition": f'attachment; filename="{versioned_filename}"',
+                "ContentType": "application/zip",
+                "Metadata": metadata,
+            },
+            Config=self._transfer_config,
+        )
+
     def _create_distribution(self, profile, console: Console, package_path: Path) -> int:
         """Create a new distribution package and generate presigned URL."""
         import json
 
-        import boto3
+        from botocore.exceptions import ClientError
+        from rich.progress import BarColumn, DownloadColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
         # Validate package directory
         if not package_path.exists():
@@ -735,68 +1019,53 @@ class DistributeCommand(Command):
             console.print("Run 'poetry run ccwb package' first to build packages.")
             return 1
 
+        # Ask CodeBuild about recent Windows builds in the background while the local files are checked
+        probe_executor = ThreadPoolExecutor(max_workers=1)
+        windows_probe = probe_executor.submit(self._probe_windows_build, profile)
+        probe_executor.shutdown(wait=False)
+
         # Check what's in the package directory
         console.print("\n[bold]Package contents:[/bold]")
         found_platforms = []
 
+        # One directory read answers every executable, installer and config check below
+        mtimes = _file_mtimes(package_path)
+
         # Check for macOS executables
-        macos_arm = package_path / "credential-process-macos-arm64"
-        macos_intel = package_path / "credential-process-macos-intel"
-        if macos_arm.exists():
-            mod_time = datetime.fromtimestamp(macos_arm.stat().st_mtime)
+        if "credential-process-macos-arm64" in mtimes:
+            mod_time = datetime.fromtimestamp(mtimes["credential-process-macos-arm64"])
             console.print(f"  ✓ macOS ARM64 executable (built: {mod_time.strftime('%Y-%m-%d %H:%M')})")
             found_platforms.append("macos-arm64")
-        if macos_intel.exists():
-            mod_time = datetime.fromtimestamp(macos_intel.stat().st_mtime)
+        if "credential-process-macos-intel" in mtimes:
+            mod_time = datetime.fromtimestamp(mtimes["credential-process-macos-intel"])
             console.print(f"  ✓ macOS Intel executable (built: {mod_time.strftime('%Y-%m-%d %H:%M')})")
             found_platforms.append("macos-intel")
 
         # Check for Windows executables
         windows_exe = package_path / "credential-process-windows.exe"
         windows_exe_time = None
-        if windows_exe.exists():
-            from datetime import timezone
-
-            windows_exe_time = datetime.fromtimestamp(windows_exe.stat().st_mtime, tz=timezone.utc)
+        if windows_exe.name in mtimes:
+            windows_exe_time = datetime.fromtimestamp(mtimes[windows_exe.name], tz=timezone.utc)
             console.print(f"  ✓ Windows executable (built: {windows_exe_time.strftime('%Y-%m-%d %H:%M')})")
             found_platforms.append("windows")
 
             # Check if there are newer Windows builds available and download them
             try:
-                # Get CodeBuild project name from profile
-                project_name = f"{profile.identity_pool_name}-windows-build"
-                codebuild = boto3.client("codebuild", region_name=profile.aws_region)
-
-                # List recent builds
-                response = codebuild.list_builds_for_project(projectName=project_name, sortOrder="DESCENDING")
-
-                if response.get("ids"):
-                    # Get details of recent successful builds
-                    build_ids = response["ids"][:3]  # Check last 3 builds
-                    builds_response = codebuild.batch_get_builds(ids=build_ids)
-
-                    for build in builds_response.get("builds", []):
-                        if build["buildStatus"] == "SUCCEEDED":
-                            build_time = build.get("endTime", build.get("startTime"))
-                            if build_time and build_time > windows_exe_time:
-                                console.print(
-                                    f"    [yellow]⚠️  Newer Windows build available "
-                                    f"(completed {build_time.strftime('%Y-%m-%d %H:%M')})[/yellow]"
-                                )
-
-                                # Automatically download the newer build
-                                console.print("    [cyan]Downloading newer Windows artifacts...[/cyan]")
-                                if self._download_windows_artifacts(profile, package_path, console):
-                                    console.print("    [green]✓ Downloaded newer Windows artifacts[/green]")
-                                    # Update the timestamp
-                                    windows_exe_time = datetime.fromtimestamp(
-                                        windows_exe.stat().st_mtime, tz=timezone.utc
-                                    )
-                                else:
-                                    console.print(
-                                        "    [yellow]Failed to download newer artifacts, using existing[/yellow]"
-                                    )
-                            break
+                status, build_time = windows_probe.result()
+                if _windows_build_action(status, build_time, windows_exe_time) == "download":
+                    console.print(
+                        f"    [yellow]⚠️  Newer Windows build available "
+                        f"(completed {build_time.strftime('%Y-%m-%d %H:%M')})[/yellow]"
+                    )
+
+                    # Automatically download the newer build
+                    console.print("    [cyan]Downloading newer Windows artifacts...[/cyan]")
+                    if self._download_windows_artifacts(profile, package_path, console):
+                        console.print("    [green]✓ Downloaded newer Windows artifacts[/green]")
+                        # Update the timestamp
+                        windows_exe_time = datetime.fromtimestamp(windows_exe.stat().st_mtime, tz=timezone.utc)
+                    else:
+                        console.print("    [yellow]Failed to download newer artifacts, using existing[/yellow]")
             except Exception:
                 pass  # Silently ignore if we can't check
         else:
@@ -805,37 +1074,24 @@ class DistributeCommand(Command):
 
             # First check for any completed builds
             try:
-                project_name = f"{profile.identity_pool_name}-windows-build"
-                codebuild = boto3.client("codebuild", region_name=profile.aws_region)
-
-                # List recent builds
-                response = codebuild.list_builds_for_project(projectName=project_name, sortOrder="DESCENDING")
-
-                if response.get("ids"):
-                    # Get details of recent builds
-                    build_ids = response["ids"][:5]  # Check last 5 builds
-                    builds_response = codebuild.batch_get_builds(ids=build_ids)
-
-                    for build in builds_response.get("builds", []):
-                        if build["buildStatus"] == "SUCCEEDED":
-                            # Found a successful build, download it
-                            build_time = build.get("endTime", build.get("startTime"))
-                            console.print(
-                                f"  ⚠️  Windows executable [yellow](found completed build from "
-                                f"{build_time.strftime('%Y-%m-%d %H:%M')})[/yellow]"
-                            )
-                            console.print("    [cyan]Downloading Windows artifacts...[/cyan]")
+                status, build_time = windows_probe.result()
+                action = _windows_build_action(status, build_time)
+                if action == "download":
+                    # Found a successful build, download it
+                    console.print(
+                        f"  ⚠️  Windows executable [yellow](found completed build from "
+                        f"{build_time.strftime('%Y-%m-%d %H:%M')})[/yellow]"
+                    )
+                    console.print("    [cyan]Downloading Windows artifacts...[/cyan]")
 
-                            if self._download_windows_artifacts(profile, package_path, console):
-                                console.print("    [green]✓ Downloaded Windows artifacts[/green]")
-                                found_platforms.append("windows")
-                                windows_downloaded = True
-                            else:
-                                console.print("    [yellow]Failed to download Windows artifacts[/yellow]")
-                            break
-                        elif build["buildStatus"] == "IN_PROGRESS":
-                            console.print("  ⚠️  Windows executable [yellow](build in progress)[/yellow]")
-                            break
+                    if self._download_windows_artifacts(profile, package_path, console):
+                        console.print("    [green]✓ Downloaded Windows artifacts[/green]")
+                        found_platforms.append("windows")
+                        windows_downloaded = True
+                    else:
+                        console.print("    [yellow]Failed to download Windows artifacts[/yellow]")
+                elif action == "wait":
+                    console.print("  ⚠️  Windows executable [yellow](build in progress)[/yellow]")
             except Exception:
                 pass  # Continue to check for build info file
 
@@ -848,7 +1104,7 @@ class DistributeCommand(Command):
 
                     # Check build status
                     try:
-                        codebuild = boto3.client("codebuild", region_name=profile.aws_region)
+                        codebuild = self._client("codebuild", profile.aws_region)
                         response = codebuild.batch_get_builds(ids=[build_info["build_id"]])
                         if response.get("builds"):
                             build = response["builds"][0]
@@ -870,33 +1126,36 @@ class DistributeCommand(Command):
                 elif not windows_downloaded:
                     console.print("  ✗ Windows executable [red](not built)[/red]")
 
+        # The Windows checks above may have downloaded artifacts into the build directory
+        mtimes = _file_mtimes(package_path)
+
         # Check for Linux executables
-        linux_x64 = package_path / "credential-process-linux-x64"
-        linux_arm64 = package_path / "credential-process-linux-arm64"
-        linux_generic = package_path / "credential-process-linux"  # Native Linux build
+        linux_x64 = mtimes.get("credential-process-linux-x64")
+        linux_arm64 = mtimes.get("credential-process-linux-arm64")
+        linux_generic = mtimes.get("credential-process-linux")  # Native Linux build
 
-        if linux_x64.exists():
-            mod_time = datetime.fromtimestamp(linux_x64.stat().st_mtime)
+        if linux_x64 is not None:
+            mod_time = datetime.fromtimestamp(linux_x64)
             found_platforms.append("linux-x64")
             console.print(f"  ✓ Linux x64 executable (built: {mod_time.strftime('%Y-%m-%d %H:%M')})")
 
-        if linux_arm64.exists():
-            mod_time = datetime.fromtimestamp(linux_arm64.stat().st_mtime)
+        if linux_arm64 is not None:
+            mod_time = datetime.fromtimestamp(linux_arm64)
             found_platforms.append("linux-arm64")
             console.print(f"  ✓ Linux ARM64 executable (built: {mod_time.strftime('%Y-%m-%d %H:%M')})")
 
-        if linux_generic.exists() and not linux_x64.exists() and not linux_arm64.exists():
+        if linux_generic is not None and linux_x64 is None and linux_arm64 is None:
             # Show generic Linux build if no architecture-specific versions exist
-            mod_time = datetime.fromtimestamp(linux_generic.stat().st_mtime)
+            mod_time = datetime.fromtimestamp(linux_generic)
             console.print(f"  ✓ Linux executable (built: {mod_time.strftime('%Y-%m-%d %H:%M')})")
             found_platforms.append("linux")
 
         # Check for installers and config
-        if (package_path / "install.sh").exists():
+        if "install.sh" in mtimes:
             console.print("  ✓ Unix installer script")
-        if (package_path / "install.bat").exists():
+        if "install.bat" in mtimes:
             console.print("  ✓ Windows installer script")
-        if (package_path / "config.json").exists():
+        if "config.json" in mtimes:
             console.print("  ✓ Configuration file")
 
         # Warn if missing critical platforms
@@ -932,25 +1191,15 @@ class DistributeCommand(Command):
         with Progress(
             SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
         ) as progress:
-            # Create archive
             task = progress.add_task("Creating distribution archive...", total=None)
-            archive_path = self._create_archive(package_path)
-
-            # Calculate checksum
-            progress.update(task, description="Calculating checksum...")
-            checksum = self._calculate_checksum(archive_path)
-
-            # Prepare filename
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            filename = f"claude-code-package-{timestamp}.zip"
 
             # Only do S3 operations if distribution is enabled
             if profile.enable_distribution:
-                # Get S3 bucket from distribution stack outputs
+                # Get S3 bucket from distribution stack outputs, before spending time on the archive
                 progress.update(task, description="Getting S3 bucket information...")
                 dist_stack_name = profile.stack_names.get("distribution", f"{profile.identity_pool_name}-distribution")
                 try:
-                    stack_outputs = get_stack_outputs(dist_stack_name, profile.aws_region)
+                    stack_outputs = self._distribution_outputs(dist_stack_name, profile.aws_region)
                     bucket_name = stack_outputs.get("DistributionBucket")
                     if not bucket_name:
                         console.print("[red]S3 bucket not found in distribution stack outputs.[/red]")
@@ -960,94 +1209,109 @@ class DistributeCommand(Command):
                     console.print("Deploy the distribution stack first: poetry run ccwb deploy distribution")
                     return 1
 
-                # Upload to S3 with progress tracking
-                progress.update(task, description="Preparing upload...")
-                package_key = f"packages/{timestamp}/{filename}"
-
-                # Get file size for progress tracking
-                file_size = archive_path.stat().st_size
+                # While the archive is built, read the current distribution so an unchanged package can
+                # reuse the object already in S3, and open the S3 connection so the upload's first request
+                # doesn't also wait on credential resolution and the TLS handshake
+                s3 = self._client("s3", profile.aws_region)
+                background = ThreadPoolExecutor(max_workers=2)
+                published_lookup = background.submit(self._published_distribution, profile)
+                background.submit(self._warm_s3_connection, s3, bucket_name)
+                background.shutdown(wait=False)
 
-                # Configure multipart upload for better performance
-                config = TransferConfig(
-                    multipart_threshold=1024 * 25,  # 25MB
-                    max_concurrency=10,
-                    multipart_chunksize=1024 * 25,
-                    use_threads=True,
-                )
+            # Create archive
+            progress.update(task, description="Creating distribution archive...")
+            # Reuses the last archive when the build is unchanged; otherwise the checksum is
+            # computed while the archive is written, so it is never read back
+            archive_path, checksum = self._cached_archive(package_path)
+            # Sized once here for the upload progress, part size and summary
+            file_size = archive_path.stat().st_size
 
-                # Create S3 client
-                s3 = boto3.client("s3", region_name=profile.aws_region)
+            # Prepare filename
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            filename = f"claude-code-package-{timestamp}.zip"
 
-                # Close the spinner progress and create a new one with upload progress
-                progress.stop()
+            if profile.enable_distribution:
+                # Upload to S3 with progress tracking
+                progress.update(task, description="Preparing upload...")
+                package_key = f"packages/{timestamp}/{filename}"
 
-                # Create progress bar for upload
-                with Progress(
-                    TextColumn("[bold blue]Uploading to S3"),
-                    BarColumn(),
-                    "[progress.percentage]{task.percentage:>3.1f}%",
-                    "•",
-                    DownloadColumn(),
-                    "•",
-                    TimeRemainingColumn(),
-                    console=console,
-                ) as upload_progress:
-                    upload_task = upload_progress.add_task("upload", total=file_size)
-
-                    # Create callback
-                    callback = S3UploadProgress(filename, file_size, upload_progress)
-                    callback.set_task_id(upload_task)
+                published = published_lookup.result()
+                if self._package_is_published(s3, bucket_name, published, checksum):
+                    # Same archive as the current distribution; sign a fresh URL for the existing object
+                    progress.update(task, description="Package unchanged, reusing uploaded archive...")
+                    package_key = published["package_key"]
+                    filename = published.get("filename", filename)
+                else:
+                    # Close the spinner progress and create a new one with upload progress
+                    progress.stop()
+
+                    # Create progress bar for upload
+                    with Progress(
+                        TextColumn("[bold blue]Uploading to S3"),
+                        BarColumn(),
+                        "[progress.percentage]{task.percentage:>3.1f}%",
+                        "•",
+                        DownloadColumn(),
+                        "•",
+                        TimeRemainingColumn(),
+                        console=console,
+                    ) as upload_progress:
+                        upload_task = upload_progress.add_task("upload", total=file_size)
+
+                        # Create callback
+                        callback = S3UploadProgress(filename, file_size, upload_progress)
+                        callback.set_task_id(upload_task)
+
+                        try:
+                            s3.upload_file(
+                                str(archive_path),
+                                bucket_name,
+                                package_key,
+                                ExtraArgs={
+                                    "Metadata": {
+                                        "checksum": checksum,
+                                        "created": datetime.now().isoformat(),
+                                        "profile": profile.name,
+                                    }
+                                },
+                                Config=self._transfer_config_for(file_size),
+                                Callback=callback,
+                            )
+                        except ClientError as e:
+                            console.print(f"[red]Failed to upload package: {e}[/red]")
+                            return 1
 
+                    # Restart the spinner progress for remaining tasks
+                    progress = Progress(
+                        SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+                    )
+                    progress.start()
+                    task = progress.add_task("Processing...", total=None)
+
+                # Generate presigned URL
+                progress.update(task, description="Generating presigned URL...")
+                allowed_ips = self.option("allowed-ips")
+
+                if allowed_ips:
+                    # Generate URL with IP restrictions
+                    url = self._generate_restricted_url(s3, bucket_name, package_key, allowed_ips, expires_hours)
+                else:
+                    # Generate standard presigned URL
                     try:
-                        s3.upload_file(
-                            str(archive_path),
-                            bucket_name,
-                            package_key,
-                            ExtraArgs={
-                                "Metadata": {
-                                    "checksum": checksum,
-                                    "created": datetime.now().isoformat(),
-                                    "profile": profile.name,
-                                }
-                            },
-                            Config=config,
-                            Callback=callback,
-                        )
+                        url = self._presign(s3, bucket_name, package_key, expires_hours * 3600)
                     except ClientError as e:
-                        console.print(f"[red]Failed to upload package: {e}[/red]")
+                        console.print(f"[red]Failed to generate URL: {e}[/red]")
                         return 1
 
-                # Restart the spinner progress for remaining tasks
-                progress = Progress(
-                    SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
-                )
-                progress.start()
-                task = progress.add_task("Processing...", total=None)
-
-            # Generate presigned URL
-            progress.update(task, description="Generating presigned URL...")
-            allowed_ips = self.option("allowed-ips")
+                # Store in Parameter Store in the background; only later `ccwb distribute --get-latest` runs read
+                # it, so the URL is printed while the write is in flight and any failure is reported after
+                progress.update(task, description="Storing in Parameter Store...")
+                expiration = datetime.now(timezone.utc) + timedelta(hours=expires_hours)
 
-            if allowed_ips:
-                # Generate URL with IP restrictions
-                url = self._generate_restricted_url(s3, bucket_name, package_key, allowed_ips, expires_hours)
-            else:
-                # Generate standard presigned URL
-                try:
-                    url = s3.generate_presigned_url(
-                        "get_object", Params={"Bucket": bucket_name, "Key": package_key}, ExpiresIn=expires_hours * 3600
-                    )
-                except ClientError as e:
-                    console.print(f"[red]Failed to generate URL: {e}[/red]")
-                    return 1
-
-            # Store in Parameter Store
-            progress.update(task, description="Storing in Parameter Store...")
-            expiration = datetime.now() + timedelta(hours=expires_hours)
-
-            ssm = boto3.client("ssm", region_name=profile.aws_region)
-            try:
-                ssm.put_parameter(
+                ssm = self._client("ssm", profile.aws_region)
+                ssm_executor = ThreadPoolExecutor(max_workers=1)
+                ssm_write = ssm_executor.submit(
+                    ssm.put_parameter,
                     Name=f"/claude-code/{profile.identity_pool_name}/distribution/latest",
                     Value=json.dumps(
                         {
@@ -1063,11 +1327,7 @@ class DistributeCommand(Command):
                     Overwrite=True,
                     Description="Latest Claude Code package distribution URL",
                 )
-            except ClientError as e:
-                console.print(f"[yellow]Warning: Failed to store in Parameter Store: {e}[/yellow]")
-
-                # Get file size before cleanup
-                file_size = archive_path.stat().st_size if archive_path.exists() else 0
+                ssm_executor.shutdown(wait=False)
             else:
                 # Distribution not enabled - save locally
                 progress.update(task, description="Saving package locally...")
@@ -1075,15 +1335,16 @@ class DistributeCommand(Command):
                 local_dir.mkdir(exist_ok=True)
                 local_path = local_dir / filename
 
-                import shutil
-
-                shutil.copy2(archive_path, local_path)
+                # Hard-link the cached archive so saving it moves no data; copy only when the
+                # cache is on another filesystem or the filesystem has no hard links
+                try:
+                    os.link(archive_path, local_path)
+                except OSError:
+                    import shutil
 
-                # Get file size
-                file_size = archive_path.stat().st_size if archive_path.exists() else 0
+                    shutil.copy2(archive_path, local_path)
 
-            # Clean up temp file
-            archive_path.unlink()
+            # The archive stays in the local cache for the next run on this build
 
             # Stop progress if it's still running
             if "progress" in locals() and hasattr(progress, "stop"):
@@ -1107,7 +1368,7 @@ class DistributeCommand(Command):
             console.print("\n[bold]Package Details:[/bold]")
             console.print(f"  Filename: {filename}")
             console.print(f"  SHA256: {checksum}")
-            console.print(f"  Expires: {expiration.strftime('%Y-%m-%d %H:%M:%S')}")
+            console.print(f"  Expires: {expiration.astimezone().strftime('%Y-%m-%d %H:%M:%S')}")
             console.print(f"  Size: {self._format_size(file_size)}")
 
             # Show QR code if requested
@@ -1155,76 +1416,216 @@ class DistributeCommand(Command):
             console.print("  2. Enable distribution when prompted")
             console.print("  3. Run: poetry run ccwb deploy distribution")
 
+        if profile.enable_distribution:
+            try:
+                ssm_write.result()
+            except ClientError as e:
+                console.print(f"[yellow]Warning: Failed to store in Parameter Store: {e}[/yellow]")
+
         return 0
 
-    def _create_archive(self, package_path: Path) -> Path:
-        """Create a zip archive of the package directory."""
+    def _probe_windows_build(self, profile) -> tuple[str | None, datetime | None]:
+        """Look up the project's recent Windows CodeBuild runs in one list and one batch call.
+
+        Returns:
+            The status of the newest build that succeeded or is still running (None if neither),
+            and when the newest successful build finished (None if there is none).
+        """
+        project_name = f"{profile.identity_pool_name}-windows-build"
+        codebuild = self._client("codebuild", profile.aws_region)
+
+        response = codebuild.list_builds_for_project(projectName=project_name, sortOrder="DESCENDING")
+        build_ids = response.get("ids", [])[:5]  # Check last 5 builds
+        if not build_ids:
+            return None, None
+
+        status = None
+        for build in codebuild.batch_get_builds(ids=build_ids).get("builds", []):
+            if build["buildStatus"] == "SUCCEEDED":
+                return status or "SUCCEEDED", build.get("endTime", build.get("startTime"))
+            if build["buildStatus"] == "IN_PROGRESS" and status is None:
+                status = "IN_PROGRESS"
+        return status, None
+
+    def _create_archive(
+        self, package_path: Path, archive_path: Path | None = None, sources: ZipSourceCache | None = None
+    ) -> tuple[Path, str]:
+        """Create a zip archive of the package directory.
+
+        Args:
+            package_path: Build directory to package.
+            archive_path: Where to write the archive; defaults to a new temp directory.
+            sources: Existing listing of package_path, if the caller already has one.
+
+        Returns:
+            The archive path and its SHA256 checksum.
+        """
         import zipfile
 
-        # Create temp directory for archive
-        temp_dir = Path(tempfile.mkdtemp())
-        archive_path = temp_dir / "claude-code-package.zip"
-
-        # Create a clean package directory with only necessary files
-        package_temp_dir = temp_dir / "claude-code-package"
-        package_temp_dir.mkdir(exist_ok=True)
-
-        # Files to include in the package
-        required_files = [
-            # Executables for each platform
-            "credential-process-macos-arm64",
-            "credential-process-macos-intel",
-            "credential-process-linux-x64",
-            "credential-process-linux-arm64",
-            "credential-process-windows.exe",
-            # OTEL helpers
-            "otel-helper-macos-arm64",
-            "otel-helper-macos-intel",
-            "otel-helper-linux-x64",
-            "otel-helper-linux-arm64",
-            "otel-helper-windows.exe",
-            # Installation scripts
-            "install.sh",
-            "install.bat",
-            # Configuration
-            "config.json",
-            "README.md",
-        ]
-
-        # Also include claude-settings directory if it exists
-        settings_dir = package_path / "claude-settings"
-        if settings_dir.exists() and settings_dir.is_dir():
-            shutil.copytree(settings_dir, package_temp_dir / "claude-settings")
-
-        # Copy only the required files
-        for filename in required_files:
-            source_file = package_path / filename
-            if source_file.exists():
-                shutil.copy2(source_file, package_temp_dir / filename)
-
-        # Create zip archive with contents at root level
-        # When extracted, it will create claude-code-package/ with files directly inside
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            # Add all files from the package directory
-            for file in package_temp_dir.rglob("*"):
-                if file.is_file():
-                    # Get relative path from package_temp_dir (not temp_dir) to avoid nested directories
-                    # This creates paths like "config.json", "install.sh" instead of "claude-code-package/config.json"
-                    arcname = f"claude-code-package/{file.relative_to(package_temp_dir)}"
-                    zf.write(file, arcname)
-
-        # Clean up temp package directory
-        shutil.rmtree(package_temp_dir)
-
-        return archive_path
-
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA256 checksum of a file."""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        if archive_path is None:
+            # Create temp directory for archive
+            temp_dir = Path(tempfile.mkdtemp())
+            archive_path = temp_dir / "claude-code-package.zip"
+
+        # Same build directory listing as the landing page ZIPs, including claude-settings if it exists.
+        # Files are streamed with zf.write rather than sources.write, which would hold every binary in memory.
+        if sources is None:
+            sources = ZipSourceCache(package_path)
+
+        # Create zip archive straight from the build directory, with contents under claude-code-package/
+        # Binaries are stored rather than deflated, which is where nearly all of the zip time went
+        with open(archive_path, "wb") as fh:
+            writer = HashingWriter(fh)
+            with zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as zf:
+                for filename in ARCHIVE_FILES:
+                    if filename in sources.present:
+                        arcname = f"claude-code-package/{filename}"
+                        zf.write(package_path / filename, arcname, compress_type=_compress_type(arcname))
+                for file in sources.settings_files:
+                    arcname = f"claude-code-package/{file.relative_to(package_path)}"
+                    zf.write(file, arcname, compress_type=_compress_type(arcname))
+
+        # Read only after the ZipFile has closed, once the central directory is written too
+        return archive_path, writer.h.hexdigest()
+
+    def _archive_fingerprint(self, package_path: Path, sources: ZipSourceCache) -> str:
+        """Cache key for the archive: the name, size and mtime of every file that goes into it."""
+        names = [name for name in ARCHIVE_FILES if name in sources.present]
+        names += sorted(str(file.relative_to(package_path)) for file in sources.settings_files)
+        # blake2b only keys the cache; the published checksum is still SHA256
+        fingerprint = hashlib.blake2b(digest_size=16)
+        for name in names:
+            stat = os.stat(package_path / name)
+            fingerprint.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        return fingerprint.hexdigest()
+
+    def _cached_archive(self, package_path: Path) -> tuple[Path, str]:
+        """Archive and SHA256 for package_path, rebuilt only when a packaged file has changed.
+
+        The most recent archive is kept under ~/.claude-code so re-running distribute on the same
+        build (for a new expiry or IP list) skips zipping and hashing entirely.
+        """
+        sources = ZipSourceCache(package_path)
+        fingerprint = self._archive_fingerprint(package_path, sources)
+        cache_file = Path.home() / ".claude-code" / "distcache.json"
+
+        try:
+            cache = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            cache = {}
+
+        entry = cache.get(fingerprint)
+        if entry and Path(entry["archive"]).is_file():
+            return Path(entry["archive"]), entry["checksum"]
+
+        archive_dir = cache_file.parent / "dist-cache"
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_path, checksum = self._create_archive(package_path, archive_dir / f"{fingerprint}.zip", sources)
+
+        # Only the newest archive is kept; older ones belong to builds that have since changed
+        for old in cache.values():
+            if old.get("archive") != str(archive_path):
+                Path(old["archive"]).unlink(missing_ok=True)
+        entry = {"archive": str(archive_path), "checksum": checksum, "created": datetime.now().isoformat()}
+        cache_file.write_text(json.dumps({fingerprint: entry}, indent=2))
+        return archive_path, checksum
+
+    def _distribution_outputs(self, stack_name: str, region: str) -> dict[str, str]:
+        """Distribution stack outputs, fetched once per command run."""
+        # Cache only real outputs; an empty result means the lookup failed and is worth retrying
+        cached = getattr(self, "_dist_outputs", None)
+        if not cached:
+            cached = self._dist_outputs = get_stack_outputs(stack_name, region)
+        return cached
+
+    @cached_property
+    def _transfer_config(self) -> "TransferConfig":
+        """Upload config, handing transfers to the CRT client when a recent awscrt is installed."""
+        from boto3.s3.transfer import TransferConfig
+
+        try:
+            from boto3.s3.transfer import has_minimum_crt_version
+        except ImportError:
+            # boto3 predates CRT transfer support
+            return TransferConfig(**S3_TRANSFER_SETTINGS)
+        if not has_minimum_crt_version((0, 19, 18)):
+            return TransferConfig(**S3_TRANSFER_SETTINGS)
+        return TransferConfig(**S3_TRANSFER_SETTINGS, preferred_transfer_client="crt")
+
+    def _transfer_config_for(self, file_size: int) -> "TransferConfig":
+        """Upload config for one file, with parts scaled up for files over S3_TARGET_PARTS minimum-size parts."""
+        chunksize = max(S3_TRANSFER_SETTINGS["multipart_chunksize"], file_size // S3_TARGET_PARTS)
+        if chunksize == S3_TRANSFER_SETTINGS["multipart_chunksize"]:
+            return self._transfer_config
+        config = copy.copy(self._transfer_config)
+        config.multipart_chunksize = chunksize
+        return config
+
+    @cached_property
+    def _s3_client_config(self) -> "BotoConfig":
+        """Client config for package uploads, sized for the multipart part threads."""
+        from botocore.config import Config as BotoConfig
+
+        return BotoConfig(**S3_CLIENT_SETTINGS)
+
+    @cached_property
+    def _client_config(self) -> "BotoConfig":
+        """Client config for CodeBuild, SSM and the other control-plane calls."""
+        from botocore.config import Config as BotoConfig
+
+        return BotoConfig(**CLIENT_SETTINGS)
+
+    @cached_property
+    def _session(self):
+        """boto3 session shared by every client this command creates, so credentials resolve once."""
+        import boto3
+
+        return boto3.Session()
+
+    @cached_property
+    def _clients(self) -> dict:
+        """Clients created so far, keyed by service name and region."""
+        return {}
+
+    def _client(self, service_name: str, region: str):
+        """Client for service_name from the shared session, created once per region.
+
+        S3 clients get the upload-tuned config; the others share the retry and keepalive settings.
+        """
+        key = (service_name, region)
+        # Background probes create clients too, and boto3 sessions aren't safe to create clients from concurrently
+        with _CLIENT_LOCK:
+            if key not in self._clients:
+                config = self._s3_client_config if service_name == "s3" else self._client_config
+                self._clients[key] = self._session.client(service_name, region_name=region, config=config)
+            return self._clients[key]
+
+    @cached_property
+    def _frozen_credentials(self):
+        """AWS credentials for signing URLs locally, resolved once per command."""
+        credentials = self._session.get_credentials()
+        return credentials.get_frozen_credentials() if credentials else None
+
+    def _presign(self, s3_client, bucket: str, key: str, expires: int) -> str:
+        """Generate a presigned GET URL, using libpresign when installed and usable."""
+        credentials = self._frozen_credentials
+        # libpresign signs without a session token, so temporary credentials always go through boto3
+        if credentials and not credentials.token:
+            try:
+                import libpresign
+
+                return libpresign.get(
+                    access_key_id=credentials.access_key,
+                    secret_access_key=credentials.secret_key,
+                    region=s3_client.meta.region_name,
+                    bucket=bucket,
+                    key=key,
+                    expires=expires,
+                )
+            except (ImportError, ValueError):
+                pass
+
+        return s3_client.generate_presigned_url("get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expires)
 
     def _generate_restricted_url(self, s3_client, bucket: str, key: str, allowed_ips: str, expires_hours: int) -> str:
         """Generate a presigned URL with IP restrictions."""
@@ -1236,9 +1637,7 @@ class DistributeCommand(Command):
         # Generate presigned POST (which supports policies)
         # Note: For GET with IP restrictions, we'd need to use CloudFront
         # For now, we'll generate a standard URL with a warning
-        url = s3_client.generate_presigned_url(
-            "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=expires_hours * 3600
-        )
+        url = self._presign(s3_client, bucket, key, expires_hours * 3600)
 
         # Log the requested IP restriction for audit
         Console().print("[yellow]Note: IP restriction requested but requires CloudFront for enforcement.[/yellow]")
@@ -1311,21 +1710,20 @@ class DistributeCommand(Command):
                 return False
 
             # Download from S3
-            s3 = boto3.client("s3", region_name=profile.aws_region)
-            zip_path = package_path / "windows-binaries.zip"
+            s3 = self._client("s3", profile.aws_region)
 
             # CodeBuild stores artifacts at root of bucket
             artifact_key = "windows-binaries.zip"
 
             try:
-                s3.download_file(bucket_name, artifact_key, str(zip_path))
+                # The artifact is a few binaries, so extract straight from memory rather than a temp file
+                buffer = io.BytesIO()
+                s3.download_fileobj(bucket_name, artifact_key, buffer, Config=self._transfer_config)
 
                 # Extract binaries
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                with zipfile.ZipFile(buffer, "r") as zip_ref:
                     zip_ref.extractall(package_path)
 
-                # Clean up
-                zip_path.unlink()
                 return True
 
             except ClientError as e:
@@ -6,31 +6,99 @@
 import json
 import re
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import boto3
-import questionary
 from cleo.commands.command import Command
 from cleo.helpers import option
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from claude_code_with_bedrock.cli.utils.aws import (
-    check_bedrock_access,
-    get_account_id,
-    get_current_region,
-    get_subnets,
-    get_vpcs,
-)
+
 from claude_code_with_bedrock.cli.utils.progress import WizardProgress
 from claude_code_with_bedrock.cli.utils.validators import (
     validate_oidc_provider_domain,
 )
 from claude_code_with_bedrock.config import Config, Profile
 
+# boto3, questionary, Rich and the AWS helpers are imported where they are used so that
+# `ccwb init --help` doesn't load them
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Validators run on every keystroke, so their patterns are compiled once up front
+_POOL_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_USER_POOL_ID_RE = re.compile(r"^[\w-]+_[0-9a-zA-Z]+$")
+_COGNITO_REGION_RE = re.compile(r"\.auth(?:-fips)?\.([^.]+)\.amazoncognito\.com")
+_AWS_REGION_RE = re.compile(r"\.([a-z]{2}-(?:gov-)?[a-z]+-\d+)\.")
+
+# Regions offered for the infrastructure deployment
+_COMMON_REGIONS = (
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "us-gov-west-1",
+    "us-gov-east-1",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-west-3",
+    "eu-central-1",
+    "ap-northeast-1",
+    "ap-northeast-2",
+    "ap-southeast-1",
+    "ap-southeast-2",
+    "ap-south-1",
+    "ca-central-1",
+    "sa-east-1",
+)
+_COMMON_REGIONS_SET = frozenset(_COMMON_REGIONS)
+
+# Panel text shown at the start and end of a new-profile run
+_WELCOME_PANEL_TEXT = (
+    "[bold cyan]Welcome to Claude Code with Bedrock Setup![/bold cyan]\n\n"
+    "This wizard will help you deploy Claude Code using Amazon Bedrock with:\n"
+    "  • Secure authentication via your identity provider\n"
+    "  • Usage monitoring and dashboards"
+)
+_SUCCESS_PANEL_TEMPLATE = (
+    "[bold green]✓ Profile '{profile_name}' created successfully![/bold green]\n\n"
+    "Your configuration has been saved.\n\n"
+    "Next steps:\n"
+    "1. Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]\n"
+    "2. Create package: [cyan]poetry run ccwb package[/cyan]\n"
+    "3. Test authentication: [cyan]poetry run ccwb test[/cyan]\n"
+    "4. View profile: [cyan]poetry run ccwb context show {profile_name}[/cyan]"
+)
+# Printed after a profile is updated
+_NEXT_STEPS = (
+    "\nNext steps:\n"
+    "• Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]\n"
+    "• Create package: [cyan]poetry run ccwb package[/cyan]\n"
+    "• Test authentication: [cyan]poetry run ccwb test[/cyan]"
+)
+
+# Known IdP domains and the provider type each one implies
+_PROVIDER_SUFFIXES = (
+    ("okta.com", "okta"),
+    ("jumpcloud.com", "jumpcloud"),
+    ("auth0.com", "auth0"),
+    ("microsoftonline.com", "azure"),
+    ("windows.net", "azure"),
+    ("amazoncognito.com", "cognito"),
+)
+# Other IdP vendors whose domains can't be a Cognito custom domain, so there is no need to ask.
+# Generic words like "login" or "sso" are left out because Cognito custom domains use them too.
+_NON_COGNITO_KEYWORDS = (
+    "okta",
+    "auth0",
+    "jumpcloud",
+    "microsoftonline",
+    "onelogin",
+    "pingidentity",
+    "pingone",
+    "google",
+)
+
 
 def validate_identity_pool_name(value: str) -> bool | str:
     """Validate identity pool name format.
@@ -41,7 +109,7 @@ def validate_identity_pool_name(value: str) -> bool | str:
     Returns:
         True if valid, error message if invalid
     """
-    if value and re.match(r"^[a-zA-Z0-9_-]+$", value):
+    if value and _POOL_NAME_RE.match(value):
         return True
     return "Invalid pool name (alphanumeric, underscore, hyphen only)"
 
@@ -55,11 +123,104 @@ def validate_cognito_user_pool_id(value: str) -> bool | str:
     Returns:
         True if valid, error message if invalid
     """
-    if re.match(r"^[\w-]+_[0-9a-zA-Z]+$", value):
+    if _USER_POOL_ID_RE.match(value):
         return True
     return "Invalid User Pool ID format"
 
 
+def validate_provider_domain(value: str) -> bool | str:
+    """Validate OIDC provider domain format.
+
+    Args:
+        value: The provider domain to validate
+
+    Returns:
+        True if valid, error message if invalid
+    """
+    if validate_oidc_provider_domain(value):
+        return True
+    return "Invalid provider domain format (e.g., company.okta.com)"
+
+
+def validate_client_id(value: str) -> bool | str:
+    """Validate OIDC client ID length.
+
+    Args:
+        value: The client ID to validate
+
+    Returns:
+        True if valid, error message if invalid
+    """
+    if len(value) >= 10:
+        return True
+    return "Client ID must be at least 10 characters"
+
+
+def validate_custom_domain(value: str) -> bool | str:
+    """Validate a custom domain name has at least two labels.
+
+    Args:
+        value: The domain name to validate
+
+    Returns:
+        True if valid, error message if invalid
+    """
+    if "." in value:
+        return True
+    return "Enter a domain name (e.g., telemetry.company.com)"
+
+
+def validate_monthly_limit(value: str) -> bool | str:
+    """Validate the monthly token limit is a positive whole number of millions.
+
+    Args:
+        value: The limit in millions to validate
+
+    Returns:
+        True if valid, error message if invalid
+    """
+    if value.isdigit() and int(value) > 0:
+        return True
+    return "Monthly limit must be a whole number greater than 0"
+
+
+def parse_provider_domain(value: str) -> tuple[str, str]:
+    """Split an entered OIDC provider domain into the stored domain and its hostname.
+
+    Args:
+        value: Provider domain as entered, with or without a scheme
+
+    Returns:
+        Tuple of (domain without scheme or trailing slash, lowercased hostname)
+    """
+    from urllib.parse import urlparse
+
+    # Handle both full URLs and domain-only inputs
+    parsed = urlparse(value if "://" in value else f"https://{value}")
+    return parsed.netloc + parsed.path.rstrip("/"), parsed.hostname or ""
+
+
+def detect_provider_type(hostname: str) -> str | None:
+    """Detect the OIDC provider type from a hostname.
+
+    Matches the exact domain or a subdomain of it; the leading dot keeps
+    look-alikes such as ``evilokta.com`` from matching.
+
+    Args:
+        hostname: Lowercased provider hostname
+
+    Returns:
+        Provider type, or None if the hostname isn't a known provider
+    """
+    for suffix, provider_type in _PROVIDER_SUFFIXES:
+        if hostname == suffix or hostname.endswith("." + suffix):
+            return provider_type
+    if hostname.startswith("cognito-idp.") and ".amazonaws.com" in hostname:
+        # cognito-idp.{region}.amazonaws.com format (commercial and GovCloud)
+        return "cognito"
+    return None
+
+
 class InitCommand(Command):
     name = "init"
     description = "Interactive setup wizard for first-time deployment"
@@ -76,6 +237,8 @@ class InitCommand(Command):
 
     def handle(self) -> int:
         """Execute the init command."""
+        from rich.console import Console
+
         console = Console()
         progress = WizardProgress("init")
 
@@ -88,9 +251,16 @@ class InitCommand(Command):
         except Exception as e:
             console.print(f"\n[red]Error: {e}[/red]")
             return 1
+        finally:
+            # Don't hold the wizard open for lookups it never got round to using
+            executor = self.__dict__.pop("_executor", None)
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
 
-    def _handle_with_progress(self, console: Console, progress: WizardProgress) -> int:
+    def _handle_with_progress(self, console: "Console", progress: WizardProgress) -> int:
         """Handle the command with progress tracking."""
+        import questionary
+        from rich.panel import Panel
 
         # Step 1: Select or create profile
         profile_name, is_new_profile, user_action = self._select_or_create_profile(console)
@@ -104,18 +274,7 @@ class InitCommand(Command):
 
         # If user explicitly chose "Update existing profile", skip the second prompt
         if existing_config and user_action == "update":
-            config = self._gather_configuration(progress, existing_config)
-            if not config:
-                return 1
-            if not self._review_configuration(config):
-                return 1
-            self._save_configuration(config, profile_name)
-            console.print(f"\n[green]✓ Profile '{profile_name}' updated successfully![/green]")
-            console.print("\nNext steps:")
-            console.print("• Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]")
-            console.print("• Create package: [cyan]poetry run ccwb package[/cyan]")
-            console.print("• Test authentication: [cyan]poetry run ccwb test[/cyan]")
-            return 0
+            return self._run_update_flow(progress, existing_config, profile_name, console)
 
         # Otherwise, show the configuration summary and ask what to do
         if existing_config:
@@ -145,18 +304,7 @@ class InitCommand(Command):
                 self._review_configuration(existing_config)
                 return 0
             elif action == "Update configuration":
-                config = self._gather_configuration(progress, existing_config)
-                if not config:
-                    return 1
-                if not self._review_configuration(config):
-                    return 1
-                self._save_configuration(config, profile_name)
-                console.print(f"\n[green]✓ Profile '{profile_name}' updated successfully![/green]")
-                console.print("\nNext steps:")
-                console.print("• Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]")
-                console.print("• Create package: [cyan]poetry run ccwb package[/cyan]")
-                console.print("• Test authentication: [cyan]poetry run ccwb test[/cyan]")
-                return 0
+                return self._run_update_flow(progress, existing_config, profile_name, console)
             elif action == "Start fresh":
                 confirm = questionary.confirm(
                     "This will replace your existing configuration. Continue?", default=False
@@ -181,15 +329,7 @@ class InitCommand(Command):
                 progress.clear()
 
         # Welcome message
-        welcome = Panel.fit(
-            "[bold cyan]Welcome to Claude Code with Bedrock Setup![/bold cyan]\n\n"
-            "This wizard will help you deploy Claude Code using Amazon Bedrock with:\n"
-            "  • Secure authentication via your identity provider\n"
-            "  • Usage monitoring and dashboards",
-            border_style="cyan",
-            padding=(1, 2),
-        )
-        console.print(welcome)
+        console.print(Panel.fit(_WELCOME_PANEL_TEXT, border_style="cyan", padding=(1, 2)))
 
         # Prerequisites check
         if not self._check_prerequisites():
@@ -209,35 +349,59 @@ class InitCommand(Command):
 
         # Success message
         success_panel = Panel.fit(
-            f"[bold green]✓ Profile '{profile_name}' created successfully![/bold green]\n\n"
-            "Your configuration has been saved.\n\n"
-            "Next steps:\n"
-            "1. Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]\n"
-            "2. Create package: [cyan]poetry run ccwb package[/cyan]\n"
-            "3. Test authentication: [cyan]poetry run ccwb test[/cyan]\n"
-            f"4. View profile: [cyan]poetry run ccwb context show {profile_name}[/cyan]",
-            border_style="green",
-            padding=(1, 2),
+            _SUCCESS_PANEL_TEMPLATE.format(profile_name=profile_name), border_style="green", padding=(1, 2)
         )
         console.print("\n", success_panel)
 
         return 0
 
+    def _run_update_flow(
+        self, progress: WizardProgress, existing_config: dict[str, Any], profile_name: str, console: "Console"
+    ) -> int:
+        """Re-run the wizard over an existing profile and save the result.
+
+        Returns:
+            Exit code
+        """
+        config = self._gather_configuration(progress, existing_config)
+        if not config or not self._review_configuration(config):
+            return 1
+        self._save_configuration(config, profile_name)
+        self._print_update_success(console, profile_name)
+        return 0
+
+    def _print_update_success(self, console: "Console", profile_name: str) -> None:
+        """Print the confirmation and next steps after a profile update."""
+        console.print(f"\n[green]✓ Profile '{profile_name}' updated successfully![/green]\n{_NEXT_STEPS}")
+
     def _check_prerequisites(self) -> bool:
         """Check system prerequisites."""
+        from rich.console import Console
+
+        from claude_code_with_bedrock.cli.utils.aws import check_bedrock_access, get_current_region
+
         console = Console()
 
         console.print("[bold cyan]Prerequisites Check:[/bold cyan]")
 
-        # Required checks
-        checks = {
-            "AWS CLI installed": self._check_aws_cli(),
-            "AWS credentials configured": self._check_aws_credentials(),
-            "Python 3.10+ available": self._check_python_version(),
-        }
+        # `aws --version` starts a whole Python interpreter, so it runs in the background while the
+        # boto3 checks run here; boto3's default session isn't safe to create clients from concurrently
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            aws_cli = executor.submit(self._check_aws_cli)
+
+            aws_credentials = self._check_aws_credentials()
+            region = get_current_region()
+            # Bedrock access is optional (deployment user may not have direct Bedrock permissions)
+            bedrock_access = check_bedrock_access(region) if region else False
+
+            # Required checks
+            checks = {
+                "AWS CLI installed": aws_cli.result(),
+                "AWS credentials configured": aws_credentials,
+                "Python 3.10+ available": self._check_python_version(),
+            }
 
         # Check current region
-        region = get_current_region()
         if region:
             checks[f"Current region: {region}"] = True
 
@@ -250,9 +414,7 @@ class InitCommand(Command):
                 console.print(f"  [red]✗[/red] {check}")
                 all_passed = False
 
-        # Bedrock access is optional (deployment user may not have direct Bedrock permissions)
         if region:
-            bedrock_access = check_bedrock_access(region)
             if bedrock_access:
                 console.print(f"  [green]✓[/green] Bedrock access enabled in {region}")
             else:
@@ -269,6 +431,11 @@ class InitCommand(Command):
 
     def _gather_configuration(self, progress: WizardProgress, existing_config: dict[str, Any] = None) -> dict[str, Any]:
         """Gather configuration from user."""
+        import questionary
+        from rich.console import Console
+
+        from claude_code_with_bedrock.cli.utils.aws import get_current_region
+
         console = Console()
         # Use existing config as base if provided, otherwise use saved progress
         if existing_config:
@@ -292,7 +459,7 @@ class InitCommand(Command):
             skip_bedrock = last_step in ["bedrock_complete"]
 
         # Pre-load region from saved config so it's available even if the AWS step is skipped
-        region = config.get("aws", {}).get("region", get_current_region())
+        region = config.get("aws", {}).get("region") or get_current_region()
 
         # OIDC Provider Configuration
         if not skip_okta:
@@ -301,8 +468,7 @@ class InitCommand(Command):
 
             provider_domain = questionary.text(
                 "Enter your OIDC provider domain:",
-                validate=lambda x: validate_oidc_provider_domain(x)
-                or "Invalid provider domain format (e.g., company.okta.com)",
+                validate=validate_provider_domain,
                 instruction=(
                     "(e.g., company.okta.com, company.auth0.com, "
                     "oauth.id.jumpcloud.com, "
@@ -316,57 +482,27 @@ class InitCommand(Command):
             if not provider_domain:
                 return None
 
-            # Strip https:// or http:// if provided
-            provider_domain = provider_domain.replace("https://", "").replace("http://", "").strip("/")
+            # Strip https:// or http:// if provided, parsing once for both the domain and the hostname
+            provider_domain, hostname = parse_provider_domain(provider_domain)
 
             # Auto-detect provider type
             provider_type = None
             cognito_user_pool_id = None
 
-            # Secure provider detection using proper URL parsing
-            from urllib.parse import urlparse
-
-            # Handle both full URLs and domain-only inputs
-            url_to_parse = (
-                provider_domain if provider_domain.startswith(("http://", "https://")) else f"https://{provider_domain}"
-            )
-
-            try:
-                parsed = urlparse(url_to_parse)
-                hostname = parsed.hostname
-
-                if hostname:
-                    hostname_lower = hostname.lower()
-
-                    # Check for exact domain match or subdomain match
-                    # Using endswith with leading dot prevents bypass attacks
-                    if hostname_lower.endswith(".okta.com") or hostname_lower == "okta.com":
-                        provider_type = "okta"
-                    elif hostname_lower.endswith(".jumpcloud.com") or hostname_lower == "jumpcloud.com":
-                        provider_type = "jumpcloud"
-                    elif hostname_lower.endswith(".auth0.com") or hostname_lower == "auth0.com":
-                        provider_type = "auth0"
-                    elif hostname_lower.endswith(".microsoftonline.com") or hostname_lower == "microsoftonline.com":
-                        provider_type = "azure"
-                    elif hostname_lower.endswith(".windows.net") or hostname_lower == "windows.net":
-                        provider_type = "azure"
-                    elif hostname_lower.endswith(".amazoncognito.com") or hostname_lower == "amazoncognito.com":
-                        provider_type = "cognito"
-                    elif hostname_lower.startswith("cognito-idp.") and ".amazonaws.com" in hostname_lower:
-                        # Handle cognito-idp.{region}.amazonaws.com format (commercial and GovCloud)
-                        provider_type = "cognito"
-                    elif questionary.confirm("Is this a custom domain for AWS Cognito User Pool?", default=False).ask():
+            if hostname:
+                provider_type = detect_provider_type(hostname)
+                if provider_type is None and not any(keyword in hostname for keyword in _NON_COGNITO_KEYWORDS):
+                    is_cognito = questionary.confirm(
+                        "Is this a custom domain for AWS Cognito User Pool?", default=False
+                    ).ask()
+                    if is_cognito:
                         provider_type = "cognito"
-            except Exception:
-                pass  # Continue to manual selection if parsing fails
 
             # For Cognito, we must ask for the User Pool ID
             # Cannot reliably extract from domain due to case sensitivity
             if provider_type == "cognito":
                 # Try to detect region from domain (handles both .auth. and .auth-fips.)
-                region_match = re.search(r"\.auth(?:-fips)?\.([^.]+)\.amazoncognito\.com", provider_domain)
-                if not region_match:
-                    region_match = re.search(r"\.([a-z]{2}-(?:gov-)?[a-z]+-\d+)\.", provider_domain)
+                region_match = _COGNITO_REGION_RE.search(provider_domain) or _AWS_REGION_RE.search(provider_domain)
 
                 # Auto-correct domain for GovCloud regions (must use auth-fips instead of auth)
                 if region_match:
@@ -396,7 +532,7 @@ class InitCommand(Command):
 
             client_id = questionary.text(
                 "Enter your OIDC Client ID:",
-                validate=lambda x: bool(x and len(x) >= 10) or "Client ID must be at least 10 characters",
+                validate=validate_client_id,
                 default=config.get("okta", {}).get("client_id", ""),
             ).ask()
 
@@ -462,67 +598,44 @@ class InitCommand(Command):
             console.print("\n[bold blue]Step 2: AWS Infrastructure Configuration[/bold blue]")
             console.print("─" * 40)
 
-            current_region = get_current_region()
-
-            # Get list of common AWS regions
-            common_regions = [
-                "us-east-1",
-                "us-east-2",
-                "us-west-1",
-                "us-west-2",
-                "us-gov-west-1",
-                "us-gov-east-1",
-                "eu-west-1",
-                "eu-west-2",
-                "eu-west-3",
-                "eu-central-1",
-                "ap-northeast-1",
-                "ap-northeast-2",
-                "ap-southeast-1",
-                "ap-southeast-2",
-                "ap-south-1",
-                "ca-central-1",
-                "sa-east-1",
-            ]
-
-            # Check for saved region
-            saved_region = config.get("aws", {}).get("region", current_region)
+            # Check for saved region (pre-loaded above, falling back to the current region)
+            saved_region = region
 
             region = questionary.select(
                 "Select AWS Region for infrastructure deployment (Cognito, IAM, monitoring):",
-                choices=common_regions,
-                default=saved_region if saved_region in common_regions else "us-east-1",
+                choices=list(_COMMON_REGIONS),
+                default=saved_region if saved_region in _COMMON_REGIONS_SET else "us-east-1",
                 instruction="(This is where your authentication and monitoring resources will be created)",
             ).ask()
 
             if not region:
                 return None
 
+            # Preserve existing AWS settings, only update region/identity_pool_name/stacks
+            aws_config = config.setdefault("aws", {})
+
             # For Direct STS, we use a stack name instead of Identity Pool Name
             # But we keep the same field for backward compatibility
             federation_type = config.get("federation_type", "cognito")
             if federation_type == "direct":
                 stack_base_name = questionary.text(
                     "Stack base name (for CloudFormation):",
-                    default=config.get("aws", {}).get("identity_pool_name", "claude-code-auth"),
+                    default=aws_config.get("identity_pool_name", "claude-code-auth"),
                     validate=validate_identity_pool_name,
                 ).ask()
             else:
                 stack_base_name = questionary.text(
                     "Identity Pool Name:",
-                    default=config.get("aws", {}).get("identity_pool_name", "claude-code-auth"),
+                    default=aws_config.get("identity_pool_name", "claude-code-auth"),
                     validate=validate_identity_pool_name,
                 ).ask()
 
             if not stack_base_name:
                 return None
 
-            # Preserve existing AWS settings, only update region/identity_pool_name/stacks
-            if "aws" not in config:
-                config["aws"] = {}
-            config["aws"]["region"] = region
-            config["aws"]["identity_pool_name"] = stack_base_name  # Keep same field name for compatibility
-            config["aws"]["stacks"] = {
+            aws_config["region"] = region
+            aws_config["identity_pool_name"] = stack_base_name  # Keep same field name for compatibility
+            aws_config["stacks"] = {
                 "auth": f"{stack_base_name}-stack",
                 "monitoring": f"{stack_base_name}-monitoring",
                 "dashboard": f"{stack_base_name}-dashboard",
@@ -551,11 +664,12 @@ class InitCommand(Command):
 
             # If monitoring is enabled, configure VPC
             if enable_monitoring:
+                # The VPC and hosted zone listings run while the user answers the prompts before them
+                self._prefetch_monitoring_lookups(region)
+
                 # Pass existing vpc_config if available
                 existing_vpc_config = config.get("monitoring", {}).get("vpc_config")
-                vpc_config = self._configure_vpc(
-                    config.get("aws", {}).get("region", get_current_region()), existing_vpc_config
-                )
+                vpc_config = self._configure_vpc(region, existing_vpc_config)
                 if not vpc_config:
                     return None
                 config["monitoring"]["vpc_config"] = vpc_config
@@ -576,34 +690,28 @@ class InitCommand(Command):
                 if enable_https:
                     custom_domain = questionary.text(
                         "Enter custom domain name (e.g., telemetry.company.com):",
-                        validate=lambda x: len(x) > 0 and "." in x,
+                        validate=validate_custom_domain,
                         default=existing_custom_domain if existing_custom_domain else "",
                     ).ask()
 
                     # Get Route53 hosted zones
                     hosted_zones = self._get_hosted_zones()
                     if hosted_zones:
-                        zone_choices = [
-                            f"{zone['Name'].rstrip('.')} ({zone['Id'].split('/')[-1]})" for zone in hosted_zones
-                        ]
-
-                        # Pre-select existing zone if available
-                        default_zone = None
-                        if existing_zone_id:
-                            for choice in zone_choices:
-                                if existing_zone_id in choice:
-                                    default_zone = choice
-                                    break
-
-                        selected_zone = questionary.select(
+                        # Choices carry the zone ID as their value, so the selection needs no parsing
+                        zone_choices = []
+                        for zone in hosted_zones:
+                            zone_id = zone["Id"].split("/")[-1]
+                            title = f"{zone['Name'].rstrip('.')} ({zone_id})"
+                            zone_choices.append(questionary.Choice(title, value=zone_id))
+
+                        # Pre-select existing zone if it is still in the account
+                        zone_ids = {choice.value for choice in zone_choices}
+                        zone_id = questionary.select(
                             "Select Route53 hosted zone for the domain:",
                             choices=zone_choices,
-                            default=default_zone if default_zone else zone_choices[0],
+                            default=existing_zone_id if existing_zone_id in zone_ids else None,
                         ).ask()
 
-                        # Extract zone ID
-                        zone_id = selected_zone.split("(")[-1].rstrip(")")
-
                         config["monitoring"]["custom_domain"] = custom_domain
                         config["monitoring"]["hosted_zone_id"] = zone_id
                         console.print(f"[green]✓[/green] HTTPS will be enabled with domain: {custom_domain}")
@@ -637,15 +745,13 @@ class InitCommand(Command):
                 console.print("when users approach or exceed their quotas.")
                 console.print("[dim]Features: per-user/group limits, SNS alerts, access blocking[/dim]")
                 console.print("[dim]Note: Quota monitoring requires the monitoring stack (enabled above)[/dim]")
+                # Preserve existing quota settings, only update enabled flag
+                quota_config = config.setdefault("quota", {})
                 enable_quota_monitoring = questionary.confirm(
                     "Enable quota monitoring?",
-                    default=config.get("quota", {}).get("enabled", True),
+                    default=quota_config.get("enabled", True),
                 ).ask()
-
-                # Preserve existing quota settings, only update enabled flag
-                if "quota" not in config:
-                    config["quota"] = {}
-                config["quota"]["enabled"] = enable_quota_monitoring
+                quota_config["enabled"] = enable_quota_monitoring
 
                 if enable_quota_monitoring:
                     console.print("\n[yellow]Configure quota limits and thresholds[/yellow]")
@@ -654,17 +760,18 @@ class InitCommand(Command):
                     console.print("\n[bold]Monthly Limit[/bold]")
                     monthly_limit_millions = questionary.text(
                         "Monthly token limit per user (in millions):",
-                        default=str(config.get("quota", {}).get("monthly_limit_millions", 225)),
-                        validate=lambda x: x.isdigit() and int(x) > 0,
+                        default=str(quota_config.get("monthly_limit_millions", 225)),
+                        validate=validate_monthly_limit,
                     ).ask()
 
-                    monthly_limit = int(monthly_limit_millions) * 1000000
-                    warning_80 = int(monthly_limit * 0.8)
-                    warning_90 = int(monthly_limit * 0.9)
+                    # Integer arithmetic keeps the thresholds exact whatever the limit
+                    monthly_limit = int(monthly_limit_millions) * 1_000_000
+                    warning_80 = monthly_limit * 4 // 5
+                    warning_90 = monthly_limit * 9 // 10
 
-                    config["quota"]["monthly_limit"] = monthly_limit
-                    config["quota"]["warning_threshold_80"] = warning_80
-                    config["quota"]["warning_threshold_90"] = warning_90
+                    quota_config["monthly_limit"] = monthly_limit
+                    quota_config["warning_threshold_80"] = warning_80
+                    quota_config["warning_threshold_90"] = warning_90
 
                     console.print(f"  → Monthly limit: {monthly_limit:,} tokens")
                     console.print(f"  → Warning at 80%: {warning_80:,} tokens")
@@ -685,7 +792,7 @@ class InitCommand(Command):
 
                     burst_buffer = questionary.text(
                         "Burst buffer percentage (5-25%):",
-                        default=str(config.get("quota", {}).get("burst_buffer_percent", 10)),
+                        default=str(quota_config.get("burst_buffer_percent", 10)),
                         validate=lambda x: x.isdigit() and 5 <= int(x) <= 25,
                     ).ask()
 
@@ -703,8 +810,8 @@ class InitCommand(Command):
 
                     daily_limit = int(custom_daily) if custom_daily else calculated_daily
 
-                    config["quota"]["daily_limit"] = daily_limit
-                    config["quota"]["burst_buffer_percent"] = burst_percent
+                    quota_config["daily_limit"] = daily_limit
+                    quota_config["burst_buffer_percent"] = burst_percent
 
                     if custom_daily:
                         console.print(f"  → Using custom daily limit: {daily_limit:,} tokens")
@@ -721,7 +828,7 @@ class InitCommand(Command):
                             questionary.Choice("alert (warn only)", value="alert"),
                             questionary.Choice("block (deny access)", value="block"),
                         ],
-                        default=config.get("quota", {}).get("daily_enforcement_mode", "alert"),
+                        default=quota_config.get("daily_enforcement_mode", "alert"),
                     ).ask()
 
                     monthly_enforcement = questionary.select(
@@ -730,11 +837,11 @@ class InitCommand(Command):
                             questionary.Choice("alert (warn only)", value="alert"),
                             questionary.Choice("block (deny access)", value="block"),
                         ],
-                        default=config.get("quota", {}).get("monthly_enforcement_mode", "block"),
+                        default=quota_config.get("monthly_enforcement_mode", "block"),
                     ).ask()
 
-                    config["quota"]["daily_enforcement_mode"] = daily_enforcement
-                    config["quota"]["monthly_enforcement_mode"] = monthly_enforcement
+                    quota_config["daily_enforcement_mode"] = daily_enforcement
+                    quota_config["monthly_enforcement_mode"] = monthly_enforcement
 
                     # Quota re-check interval
                     console.print("\n[bold]Quota Re-Check Interval[/bold]")
@@ -745,10 +852,10 @@ class InitCommand(Command):
 
                     check_interval = questionary.text(
                         "Quota check interval (minutes):",
-                        default=str(config.get("quota", {}).get("check_interval", 30)),
+                        default=str(quota_config.get("check_interval", 30)),
                         validate=lambda x: x.isdigit() and int(x) >= 0,
                     ).ask()
-                    config["quota"]["check_interval"] = int(check_interval)
+                    quota_config["check_interval"] = int(check_interval)
 
                     console.print("\n[green]✓[/green] Quota monitoring configured:")
                     console.print(f"  • Monthly: {monthly_limit:,} tokens ({monthly_enforcement})")
@@ -786,8 +893,11 @@ class InitCommand(Command):
             questionary.Choice("Disabled", value=None),
         ]
 
+        # Preserve existing distribution settings, only update enabled/type
+        distribution_config = config.setdefault("distribution", {})
+
         # Get saved value or default to None
-        saved_dist_type = config.get("distribution", {}).get("type")
+        saved_dist_type = distribution_config.get("type")
         default_choice = saved_dist_type if saved_dist_type else None
 
         distribution_type = questionary.select(
@@ -796,23 +906,20 @@ class InitCommand(Command):
             default=default_choice,
         ).ask()
 
-        # Preserve existing distribution settings, only update enabled/type
-        if "distribution" not in config:
-            config["distribution"] = {}
-        config["distribution"]["enabled"] = distribution_type is not None
-        config["distribution"]["type"] = distribution_type
+        distribution_config["enabled"] = distribution_type is not None
+        distribution_config["type"] = distribution_type
 
         # Auto-update configuration (only when distribution is enabled)
         if distribution_type is not None:
-            saved_auto_update = config.get("distribution", {}).get("auto_update_enabled", True)
+            saved_auto_update = distribution_config.get("auto_update_enabled", True)
             auto_update_enabled = questionary.confirm(
                 "Enable auto-update for distributed packages?",
                 default=saved_auto_update,
             ).ask()
-            config["distribution"]["auto_update_enabled"] = auto_update_enabled
+            distribution_config["auto_update_enabled"] = auto_update_enabled
 
             if auto_update_enabled:
-                saved_interval = config.get("distribution", {}).get("auto_update_interval_hours", 24)
+                saved_interval = distribution_config.get("auto_update_interval_hours", 24)
                 interval_choices = [
                     questionary.Choice("Every 6 hours", value=6),
                     questionary.Choice("Every 12 hours", value=12),
@@ -825,16 +932,19 @@ class InitCommand(Command):
                     choices=interval_choices,
                     default=saved_interval,
                 ).ask()
-                config["distribution"]["auto_update_interval_hours"] = auto_update_interval
+                distribution_config["auto_update_interval_hours"] = auto_update_interval
             else:
-                config["distribution"]["auto_update_interval_hours"] = 24
+                distribution_config["auto_update_interval_hours"] = 24
         else:
-            config["distribution"]["auto_update_enabled"] = False
-            config["distribution"]["auto_update_interval_hours"] = 24
+            distribution_config["auto_update_enabled"] = False
+            distribution_config["auto_update_interval_hours"] = 24
 
         # If landing-page selected, prompt for additional configuration
 
         if distribution_type == "landing-page":
+            # The account ID and hosted zones are needed after the IdP prompts, so fetch them meanwhile
+            self._prefetch_landing_page_lookups()
+
             console.print("\n[bold]Landing Page Configuration[/bold]")
             console.print("Configure IdP authentication for the distribution landing page")
 
@@ -850,7 +960,7 @@ class InitCommand(Command):
             idp_provider = questionary.select(
                 "Identity provider for web authentication:",
                 choices=idp_choices,
-                default=config.get("distribution", {}).get("idp_provider", "okta"),
+                default=distribution_config.get("idp_provider", "okta"),
             ).ask()
 
             # Auto-detection for Cognito User Pool
@@ -871,8 +981,9 @@ class InitCommand(Command):
                     console.print(f"[green]✓[/green] Found Cognito stack: {cognito_stack_info['stack_name']}")
 
                     # Validate it has distribution support
+                    # Detection already fetched the outputs, so validate those rather than describing the stack again
                     is_valid, message = validate_cognito_stack_for_distribution(
-                        cognito_stack_info["stack_name"], region
+                        cognito_stack_info["stack_name"], region, cognito_stack_info["outputs"]
                     )
 
                     if is_valid:
@@ -900,7 +1011,7 @@ class InitCommand(Command):
                             secret_arn = outputs["DistributionWebClientSecretArn"]
 
                             # Store in config immediately
-                            config.setdefault("distribution", {}).update(
+                            distribution_config.update(
                                 {
                                     "idp_provider": "cognito",
                                     "idp_domain": idp_domain,
@@ -931,13 +1042,13 @@ class InitCommand(Command):
                 # IdP domain
                 idp_domain = questionary.text(
                     "IdP domain (e.g., company.okta.com for Okta, company.auth0.com for Auth0, oauth.id.jumpcloud.com for JumpCloud):",
-                    default=config.get("distribution", {}).get("idp_domain") or "",
+                    default=distribution_config.get("idp_domain") or "",
                 ).ask()
 
                 # Web app client ID
                 idp_client_id = questionary.text(
                     "Web application client ID (separate from CLI native app):",
-                    default=config.get("distribution", {}).get("idp_client_id") or "",
+                    default=distribution_config.get("idp_client_id") or "",
                 ).ask()
 
                 # Web app client secret
@@ -946,12 +1057,12 @@ class InitCommand(Command):
                 ).ask()
 
             # Store secret in AWS Secrets Manager (only if not auto-configured)
-            import boto3
-
             if not cognito_auto_configured:
+                import boto3
+
                 try:
                     secrets_client = boto3.client("secretsmanager", region_name=region)
-                    account_id = boto3.client("sts").get_caller_identity()["Account"]
+                    account_id = self._get_account_id()
 
                     secret_name = f"{config['aws']['identity_pool_name']}-distribution-idp-secret"
 
@@ -993,7 +1104,7 @@ class InitCommand(Command):
 
             custom_domain = questionary.text(
                 "Custom domain (e.g., downloads.company.com):",
-                default=config.get("distribution", {}).get("custom_domain") or "",
+                default=distribution_config.get("custom_domain") or "",
                 validate=lambda text: bool(text and len(text.strip()) > 0)
                 or "Custom domain is required for authenticated landing page",
             ).ask()
@@ -1004,15 +1115,13 @@ class InitCommand(Command):
 
             hosted_zone_id = None
             try:
-                route53_client = boto3.client("route53")
-                zones_response = route53_client.list_hosted_zones()
-                hosted_zones = zones_response.get("HostedZones", [])
+                hosted_zones = self._list_hosted_zones()
 
                 if hosted_zones:
                     console.print(f"Found {len(hosted_zones)} hosted zone(s)")
 
                     # Get existing hosted zone if configured
-                    existing_zone_id = config.get("distribution", {}).get("hosted_zone_id")
+                    existing_zone_id = distribution_config.get("hosted_zone_id")
 
                     # Create zone choices
                     zone_choices = [
@@ -1023,18 +1132,12 @@ class InitCommand(Command):
                     ]
                     zone_choices.append(questionary.Choice("Skip (no Route53 managed domain)", value=None))
 
-                    # Find the default choice based on existing zone
-                    default_choice = None
-                    if existing_zone_id:
-                        for choice in zone_choices:
-                            if choice.value == existing_zone_id:
-                                default_choice = choice
-                                break
-
+                    # Pre-select existing zone if it is still in the account
+                    zone_ids = {zone["Id"].split("/")[-1] for zone in hosted_zones}
                     hosted_zone_id = questionary.select(
                         "Select Route53 hosted zone:",
                         choices=zone_choices,
-                        default=default_choice if default_choice else zone_choices[0],
+                        default=existing_zone_id if existing_zone_id in zone_ids else None,
                     ).ask()
                 else:
                     console.print("[yellow]No Route53 hosted zones found in this account[/yellow]")
@@ -1046,7 +1149,7 @@ class InitCommand(Command):
                 hosted_zone_id = None
 
             # Save landing page configuration
-            config["distribution"].update(
+            distribution_config.update(
                 {
                     "idp_provider": idp_provider,
                     "idp_domain": idp_domain,
@@ -1070,6 +1173,7 @@ class InitCommand(Command):
             # Import centralized model configuration
             from claude_code_with_bedrock.models import (
                 CLAUDE_MODELS,
+                MODEL_ID_TO_KEY,
                 get_available_profiles_for_model,
                 get_destination_regions_for_model_profile,
                 get_model_id_for_profile,
@@ -1077,18 +1181,10 @@ class InitCommand(Command):
                 get_source_regions_for_model_profile,
             )
 
+            aws_config = config.setdefault("aws", {})
+
             # Check for saved model
-            saved_model = config.get("aws", {}).get("selected_model")
-            saved_model_key = None
-            if saved_model:
-                # Find the key for the saved model by checking all model IDs
-                for key, model_info in CLAUDE_MODELS.items():
-                    for _profile_key, profile_config in model_info["profiles"].items():
-                        if profile_config["model_id"] == saved_model:
-                            saved_model_key = key
-                            break
-                    if saved_model_key:
-                        break
+            saved_model_key = MODEL_ID_TO_KEY.get(aws_config.get("selected_model"))
 
             # Step 1: Select Claude model
             model_choices = []
@@ -1129,7 +1225,7 @@ class InitCommand(Command):
             available_profiles = get_available_profiles_for_model(selected_model_key)
 
             # Check for saved profile
-            saved_profile = config.get("aws", {}).get("cross_region_profile")
+            saved_profile = aws_config.get("cross_region_profile")
             if saved_profile not in available_profiles:
                 saved_profile = available_profiles[0]  # Default to first available
 
@@ -1159,8 +1255,8 @@ class InitCommand(Command):
 
             # Get the correct model ID for the selected profile
             model_id = get_model_id_for_profile(selected_model_key, selected_profile)
-            config["aws"]["selected_model"] = model_id
-            config["aws"]["cross_region_profile"] = selected_profile
+            aws_config["selected_model"] = model_id
+            aws_config["cross_region_profile"] = selected_profile
 
             # Get destination regions for the model/profile combination
             destination_regions = get_destination_regions_for_model_profile(selected_model_key, selected_profile)
@@ -1173,7 +1269,7 @@ class InitCommand(Command):
                 )
                 raise ValueError("No destination regions configured for model/profile combination")
 
-            config["aws"]["allowed_bedrock_regions"] = destination_regions
+            aws_config["allowed_bedrock_regions"] = destination_regions
 
             # Step 3: Select source region for the selected model/profile combination
             profile_name = selected_profile.upper() if selected_profile != "us" else "US"
@@ -1183,7 +1279,7 @@ class InitCommand(Command):
             available_source_regions = get_source_regions_for_model_profile(selected_model_key, selected_profile)
 
             # Check for saved source region
-            saved_source_region = config.get("aws", {}).get("selected_source_region")
+            saved_source_region = aws_config.get("selected_source_region")
             if saved_source_region not in available_source_regions:
                 saved_source_region = available_source_regions[0] if available_source_regions else None
 
@@ -1212,14 +1308,14 @@ class InitCommand(Command):
                 if selected_source_region is None:  # User cancelled
                     return None
 
-                config["aws"]["selected_source_region"] = selected_source_region
+                aws_config["selected_source_region"] = selected_source_region
                 console.print(f"[green]✓[/green] Source region: {selected_source_region}")
             else:
                 # No source regions available - use default fallback
                 console.print(
                     "[yellow]No source regions configured for this model. Using default region logic.[/yellow]"
                 )
-                config["aws"]["selected_source_region"] = None
+                aws_config["selected_source_region"] = None
 
             # Get model-specific description for confirmation
             profile_description = get_profile_description(selected_model_key, selected_profile)
@@ -1236,6 +1332,10 @@ class InitCommand(Command):
 
     def _review_configuration(self, config: dict[str, Any]) -> bool:
         """Review configuration with user."""
+        from rich import box
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
 
         console.print("\n[bold blue]Step 4: Review Configuration[/bold blue]")
@@ -1318,7 +1418,10 @@ class InitCommand(Command):
         table.add_row("Bedrock Regions", profile_display.get(cross_region_profile, cross_region_profile))
 
         # Show AWS account ID
-        account_id = get_account_id()
+        try:
+            account_id = self._get_account_id()
+        except Exception:
+            account_id = None
         if account_id:
             table.add_row("AWS Account", account_id)
         else:
@@ -1376,6 +1479,9 @@ class InitCommand(Command):
         Returns:
             Exit code
         """
+        from rich.console import Console
+        from rich.panel import Panel
+
         console = Console()
 
         # Save configuration first
@@ -1476,8 +1582,14 @@ class InitCommand(Command):
         """
         config = Config.load()
 
-        # Build monitoring_config with all monitoring settings
+        # Look each section up once rather than once per field
+        aws = config_data["aws"]
         monitoring_dict = config_data.get("monitoring", {})
+        monitoring_enabled = monitoring_dict.get("enabled")
+        distribution = config_data.get("distribution", {})
+        quota = config_data.get("quota", {})
+
+        # Build monitoring_config with all monitoring settings
         monitoring_config = {}
         if monitoring_dict.get("vpc_config"):
             monitoring_config["vpc_config"] = monitoring_dict["vpc_config"]
@@ -1491,53 +1603,46 @@ class InitCommand(Command):
             provider_domain=config_data["okta"]["domain"],
             client_id=config_data["okta"]["client_id"],
             credential_storage=config_data.get("credential_storage", "session"),
-            aws_region=config_data["aws"]["region"],
-            identity_pool_name=config_data["aws"]["identity_pool_name"],
-            stack_names=config_data["aws"]["stacks"],
+            aws_region=aws["region"],
+            identity_pool_name=aws["identity_pool_name"],
+            stack_names=aws["stacks"],
             monitoring_enabled=config_data["monitoring"]["enabled"],
             monitoring_config=monitoring_config,
-            analytics_enabled=(
-                config_data.get("analytics", {}).get("enabled", True)
-                if config_data.get("monitoring", {}).get("enabled")
-                else False
-            ),
-            allowed_bedrock_regions=config_data["aws"]["allowed_bedrock_regions"],
-            cross_region_profile=config_data["aws"].get("cross_region_profile", "us"),
-            selected_model=config_data["aws"].get("selected_model"),
-            selected_source_region=config_data["aws"].get("selected_source_region"),
+            analytics_enabled=config_data.get("analytics", {}).get("enabled", True) if monitoring_enabled else False,
+            allowed_bedrock_regions=aws["allowed_bedrock_regions"],
+            cross_region_profile=aws.get("cross_region_profile", "us"),
+            selected_model=aws.get("selected_model"),
+            selected_source_region=aws.get("selected_source_region"),
             provider_type=config_data.get("provider_type"),
             cognito_user_pool_id=config_data.get("cognito_user_pool_id"),
             federation_type=config_data.get("federation_type", "cognito"),
             max_session_duration=config_data.get("max_session_duration", 28800),
             enable_codebuild=config_data.get("codebuild", {}).get("enabled", False),
-            enable_distribution=config_data.get("distribution", {}).get("enabled", False),
-            distribution_type=config_data.get("distribution", {}).get("type"),
-            distribution_idp_provider=config_data.get("distribution", {}).get("idp_provider"),
-            distribution_idp_domain=config_data.get("distribution", {}).get("idp_domain"),
-            distribution_idp_client_id=config_data.get("distribution", {}).get("idp_client_id"),
-            distribution_idp_client_secret_arn=config_data.get("distribution", {}).get("idp_client_secret_arn"),
-            distribution_custom_domain=config_data.get("distribution", {}).get("custom_domain"),
-            distribution_hosted_zone_id=config_data.get("distribution", {}).get("hosted_zone_id"),
-            auto_update_enabled=config_data.get("distribution", {}).get("auto_update_enabled", False),
-            auto_update_interval_hours=config_data.get("distribution", {}).get("auto_update_interval_hours", 24),
-            quota_monitoring_enabled=(
-                config_data.get("quota", {}).get("enabled", False)
-                if config_data.get("monitoring", {}).get("enabled")
-                else False
-            ),
-            monthly_token_limit=config_data.get("quota", {}).get("monthly_limit", 300000000),
-            warning_threshold_80=config_data.get("quota", {}).get("warning_threshold_80", 240000000),
-            warning_threshold_90=config_data.get("quota", {}).get("warning_threshold_90", 270000000),
-            daily_token_limit=config_data.get("quota", {}).get("daily_limit"),
-            burst_buffer_percent=config_data.get("quota", {}).get("burst_buffer_percent", 10),
-            daily_enforcement_mode=config_data.get("quota", {}).get("daily_enforcement_mode", "alert"),
-            monthly_enforcement_mode=config_data.get("quota", {}).get("monthly_enforcement_mode", "block"),
-            quota_check_interval=config_data.get("quota", {}).get("check_interval", 30),
+            enable_distribution=distribution.get("enabled", False),
+            distribution_type=distribution.get("type"),
+            distribution_idp_provider=distribution.get("idp_provider"),
+            distribution_idp_domain=distribution.get("idp_domain"),
+            distribution_idp_client_id=distribution.get("idp_client_id"),
+            distribution_idp_client_secret_arn=distribution.get("idp_client_secret_arn"),
+            distribution_custom_domain=distribution.get("custom_domain"),
+            distribution_hosted_zone_id=distribution.get("hosted_zone_id"),
+            auto_update_enabled=distribution.get("auto_update_enabled", False),
+            auto_update_interval_hours=distribution.get("auto_update_interval_hours", 24),
+            quota_monitoring_enabled=quota.get("enabled", False) if monitoring_enabled else False,
+            monthly_token_limit=quota.get("monthly_limit", 300000000),
+            warning_threshold_80=quota.get("warning_threshold_80", 240000000),
+            warning_threshold_90=quota.get("warning_threshold_90", 270000000),
+            daily_token_limit=quota.get("daily_limit"),
+            burst_buffer_percent=quota.get("burst_buffer_percent", 10),
+            daily_enforcement_mode=quota.get("daily_enforcement_mode", "alert"),
+            monthly_enforcement_mode=quota.get("monthly_enforcement_mode", "block"),
+            quota_check_interval=quota.get("check_interval", 30),
         )
 
+        # Set as active profile when creating/updating. Setting it before the profile is written
+        # keeps add_profile from saving the global config itself, so it is written once below.
+        config.active_profile = profile_name
         config.add_profile(profile)
-        # Set as active profile when creating/updating
-        config.set_active_profile(profile_name)
         config.save()
 
     def _check_aws_cli(self) -> bool:
@@ -1552,8 +1657,11 @@ class InitCommand(Command):
 
     def _check_aws_credentials(self) -> bool:
         """Check if AWS credentials are configured."""
+        import boto3
+
         try:
-            boto3.client("sts").get_caller_identity()
+            # Keep the account ID; the landing page and review steps need it later
+            self._account_id = boto3.client("sts").get_caller_identity()["Account"]
             return True
         except Exception:
             return False
@@ -1645,6 +1753,8 @@ class InitCommand(Command):
 
     def _deploy_stack(self, stack_name: str, template_file: Path, params_file: Path, region: str) -> bool:
         """Deploy a CloudFormation stack."""
+        from rich.console import Console
+
         try:
             console = Console()
 
@@ -1741,6 +1851,8 @@ class InitCommand(Command):
             auth_stack = profile.stack_names.get("auth", f"{profile.identity_pool_name}-stack")
 
             # Only check stack if we have AWS credentials
+            from rich.console import Console
+
             console = Console()
             stacks_found = False
             try:
@@ -1847,6 +1959,8 @@ class InitCommand(Command):
 
     def _show_existing_deployment(self, config: dict[str, Any]) -> None:
         """Show summary of existing deployment."""
+        from rich.console import Console
+
         console = Console()
 
         console.print(f"• OIDC Provider: [cyan]{config['okta']['domain']}[/cyan]")
@@ -1943,16 +2057,121 @@ class InitCommand(Command):
     def _get_hosted_zones(self) -> list[dict[str, Any]]:
         """Get available Route53 hosted zones."""
         try:
-            import boto3
-
-            client = boto3.client("route53")
-            response = client.list_hosted_zones()
-            return response.get("HostedZones", [])
+            return self._list_hosted_zones()
         except Exception:
             return []
 
+    def _list_hosted_zones(self) -> list[dict[str, Any]]:
+        """List Route53 hosted zones once per wizard run; errors propagate and aren't cached."""
+        cached = getattr(self, "_hosted_zones", None)
+        if cached is None:
+            pending = self._prefetches.pop("hosted_zones", None)
+            if pending is not None:
+                response = pending.result()
+            else:
+                import boto3
+
+                response = boto3.client("route53").list_hosted_zones()
+            cached = self._hosted_zones = response.get("HostedZones", [])
+        return cached
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Background workers for AWS lookups; shut down when the command finishes."""
+        return ThreadPoolExecutor(max_workers=2)
+
+    @cached_property
+    def _prefetches(self) -> dict[Any, Future]:
+        """In-flight background lookups, keyed like the caches they will fill."""
+        return {}
+
+    def _prefetch_monitoring_lookups(self, region: str) -> None:
+        """Start listing VPCs and hosted zones in the background.
+
+        The clients are created here because boto3's default session isn't safe to create clients
+        from concurrently; only the API calls run on the executor.
+        """
+        import boto3
+
+        from claude_code_with_bedrock.cli.utils.aws import get_vpcs
+
+        try:
+            ec2 = boto3.client("ec2", region_name=region)
+            route53 = boto3.client("route53")
+        except Exception:
+            # The lookups run, and report their errors, when they're needed
+            return
+
+        if not self._ec2_lookups.get((region, None)) and (region, None) not in self._prefetches:
+            self._prefetches[(region, None)] = self._executor.submit(get_vpcs, region, ec2)
+        self._prefetch_hosted_zones(route53)
+
+    def _prefetch_landing_page_lookups(self) -> None:
+        """Start looking up the caller's account and the hosted zones in the background.
+
+        As in _prefetch_monitoring_lookups, the clients are created here and only the calls are submitted.
+        """
+        import boto3
+
+        try:
+            sts = boto3.client("sts")
+            route53 = boto3.client("route53")
+        except Exception:
+            return
+
+        if getattr(self, "_account_id", None) is None and "caller_identity" not in self._prefetches:
+            self._prefetches["caller_identity"] = self._executor.submit(sts.get_caller_identity)
+        self._prefetch_hosted_zones(route53)
+
+    def _prefetch_hosted_zones(self, route53: Any) -> None:
+        """Submit the Route53 listing unless it has already been made or started."""
+        if getattr(self, "_hosted_zones", None) is None and "hosted_zones" not in self._prefetches:
+            self._prefetches["hosted_zones"] = self._executor.submit(route53.list_hosted_zones)
+
+    def _get_account_id(self) -> str:
+        """Get the caller's AWS account ID once per wizard run; errors propagate and aren't cached."""
+        cached = getattr(self, "_account_id", None)
+        if cached is None:
+            pending = self._prefetches.pop("caller_identity", None)
+            if pending is not None:
+                response = pending.result()
+            else:
+                import boto3
+
+                response = boto3.client("sts").get_caller_identity()
+            cached = self._account_id = response["Account"]
+        return cached
+
+    @cached_property
+    def _ec2_lookups(self) -> dict[tuple[str, str | None], list[dict[str, Any]]]:
+        """VPC and subnet listings already made this run, keyed by (region, vpc_id or None for VPCs)."""
+        return {}
+
+    def _get_vpcs(self, region: str) -> list[dict[str, Any]]:
+        """Get VPCs in the region, listed once per wizard run."""
+        from claude_code_with_bedrock.cli.utils.aws import get_vpcs
+
+        # Cache only real results; an empty list may mean the lookup failed and is worth retrying
+        vpcs = self._ec2_lookups.get((region, None))
+        if not vpcs:
+            pending = self._prefetches.pop((region, None), None)
+            vpcs = self._ec2_lookups[(region, None)] = pending.result() if pending else get_vpcs(region)
+        return vpcs
+
+    def _get_subnets(self, region: str, vpc_id: str) -> list[dict[str, Any]]:
+        """Get subnets in the VPC, listed once per wizard run."""
+        from claude_code_with_bedrock.cli.utils.aws import get_subnets
+
+        subnets = self._ec2_lookups.get((region, vpc_id))
+        if not subnets:
+            subnets = self._ec2_lookups[(region, vpc_id)] = get_subnets(region, vpc_id)
+        return subnets
+
     def _configure_vpc(self, region: str, existing_vpc_config: dict[str, Any] = None) -> dict[str, Any]:
         """Configure VPC for monitoring stack."""
+        import questionary
+        from rich.console import Console
+
         console = Console()
 
         console.print("\n[bold]VPC Configuration for Monitoring[/bold]")
@@ -2011,7 +2230,7 @@ class InitCommand(Command):
 
         # Check for existing VPCs
         console.print("\n[yellow]Searching for existing VPCs...[/yellow]")
-        vpcs = get_vpcs(region)
+        vpcs = self._get_vpcs(region)
 
         if vpcs:
             # Found existing VPCs
@@ -2037,7 +2256,7 @@ class InitCommand(Command):
 
                 # Get subnets
                 console.print("\n[yellow]Searching for subnets...[/yellow]")
-                subnets = get_subnets(region, vpc_choice)
+                subnets = self._get_subnets(region, vpc_choice)
 
                 if len(subnets) < 2:
                     console.print("[red]Error: ALB requires at least 2 subnets in different availability zones[/red]")
@@ -2103,7 +2322,7 @@ class InitCommand(Command):
 
                 return {"create_vpc": False, "vpc_id": vpc_id, "subnet_ids": subnet_ids}
 
-    def _prompt_for_profile_name(self, console: Console) -> str | None:
+    def _prompt_for_profile_name(self, console: "Console") -> str | None:
         """Prompt user for a profile name with validation.
 
         Args:
@@ -2112,6 +2331,8 @@ class InitCommand(Command):
         Returns:
             Profile name if valid, None if cancelled
         """
+        import questionary
+
         console.print("\n[bold cyan]Profile Name[/bold cyan]")
         console.print("Choose a descriptive name for this deployment profile.")
         console.print("[dim]Suggested format: {project}-{environment}-{region}[/dim]")
@@ -2145,7 +2366,7 @@ class InitCommand(Command):
 
             return profile_name
 
-    def _select_or_create_profile(self, console: Console) -> tuple[str, bool, str]:
+    def _select_or_create_profile(self, console: "Console") -> tuple[str, bool, str]:
         """Interactive profile selection or creation.
 
         Args:
@@ -2154,6 +2375,8 @@ class InitCommand(Command):
         Returns:
             Tuple of (profile_name, is_new_profile, action) where action is "create", "update", or "switch"
         """
+        import questionary
+
         config = Config.load()
         existing_profiles = config.list_profiles()
 
@@ -2236,8 +2459,10 @@ class InitCommand(Command):
 
             # Switch active profile
             config.set_active_profile(profile_name)
-            console.print(f"\n[green]✓ Switched to profile:[/green] {profile_name}")
-            console.print("\nNext steps:")
-            console.print("• Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]")
-            console.print("• View profile details: [cyan]poetry run ccwb context show[/cyan]")
+            console.print(
+                f"\n[green]✓ Switched to profile:[/green] {profile_name}\n"
+                "\nNext steps:\n"
+                "• Deploy infrastructure: [cyan]poetry run ccwb deploy[/cyan]\n"
+                "• View profile details: [cyan]poetry run ccwb context show[/cyan]"
+            )
             return (None, False, "switch")
@@ -3,14 +3,21 @@
 
 """AWS utilities for CLI commands."""
 
+from functools import lru_cache
 from typing import Any
 
-import boto3
+# boto3 is imported inside each helper so `ccwb <command> --help` and local-only commands don't load it
 from botocore.exceptions import ClientError, NoCredentialsError
 
 
+@lru_cache(maxsize=1)
 def get_current_region() -> str | None:
-    """Get the current AWS region from configuration."""
+    """Get the current AWS region from configuration.
+
+    The configured region doesn't change while a command runs, so it is resolved once per process.
+    """
+    import boto3
+
     try:
         session = boto3.Session()
         return session.region_name or "us-east-1"
@@ -20,6 +27,8 @@ def get_current_region() -> str | None:
 
 def check_bedrock_access(region: str) -> bool:
     """Check if Bedrock is accessible in the given region."""
+    import boto3
+
     try:
         client = boto3.client("bedrock", region_name=region)
         # Try to list foundation models
@@ -43,6 +52,8 @@ def check_bedrock_access(region: str) -> bool:
 
 def get_bedrock_models(region: str) -> list[dict[str, Any]]:
     """Get available Bedrock models in a region."""
+    import boto3
+
     try:
         client = boto3.client("bedrock", region_name=region)
         response = client.list_foundation_models()
@@ -65,6 +76,8 @@ def get_bedrock_models(region: str) -> list[dict[str, Any]]:
 
 def check_stack_exists(stack_name: str, region: str) -> bool:
     """Check if a CloudFormation stack exists."""
+    import boto3
+
     try:
         client = boto3.client("cloudformation", region_name=region)
         response = client.describe_stacks(StackName=stack_name)
@@ -88,6 +101,8 @@ def check_stack_exists(stack_name: str, region: str) -> bool:
 
 def get_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
     """Get outputs from a CloudFormation stack."""
+    import boto3
+
     try:
         client = boto3.client("cloudformation", region_name=region)
         response = client.describe_stacks(StackName=stack_name)
@@ -106,6 +121,8 @@ def get_stack_outputs(stack_name: str, region: str) -> dict[str, str]:
 
 def get_account_id() -> str | None:
     """Get the current AWS account ID."""
+    import boto3
+
     try:
         client = boto3.client("sts")
         response = client.get_caller_identity()
@@ -116,6 +133,8 @@ def get_account_id() -> str | None:
 
 def validate_iam_permissions() -> dict[str, bool]:
     """Validate required IAM permissions."""
+    import boto3
+
     permissions = {}
 
     # Check CloudFormation permissions
@@ -145,14 +164,22 @@ def validate_iam_permissions() -> dict[str, bool]:
     return permissions
 
 
-def get_vpcs(region: str) -> list[dict[str, Any]]:
-    """Get list of VPCs in a region."""
+def get_vpcs(region: str, client: Any = None) -> list[dict[str, Any]]:
+    """Get list of VPCs in a region.
+
+    Args:
+        region: AWS region to list VPCs in
+        client: Existing EC2 client for the region; one is created if not given
+    """
+    import boto3
+
     try:
-        client = boto3.client("ec2", region_name=region)
-        response = client.describe_vpcs()
+        if client is None:
+            client = boto3.client("ec2", region_name=region)
 
         vpcs = []
-        for vpc in response.get("Vpcs", []):
+        # Paginate so accounts with more VPCs than one page holds still see all of them
+        for vpc in client.get_paginator("describe_vpcs").paginate().search("Vpcs[]"):
             vpc_info = {
                 "id": vpc["VpcId"],
                 "cidr": vpc["CidrBlock"],
@@ -179,12 +206,14 @@ def get_vpcs(region: str) -> list[dict[str, Any]]:
 
 def get_subnets(region: str, vpc_id: str) -> list[dict[str, Any]]:
     """Get list of subnets in a VPC."""
+    import boto3
+
     try:
         client = boto3.client("ec2", region_name=region)
-        response = client.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
+        pages = client.get_paginator("describe_subnets").paginate(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
 
         subnets = []
-        for subnet in response.get("Subnets", []):
+        for subnet in pages.search("Subnets[]"):
             subnet_info = {
                 "id": subnet["SubnetId"],
                 "cidr": subnet["CidrBlock"],
@@ -218,6 +247,8 @@ def detect_cognito_stack(region: str) -> dict[str, Any] | None:
     Searches for CloudFormation stacks matching common Cognito naming patterns
     and validates they have distribution support (DistributionWebClientId output).
     """
+    import boto3
+
     try:
         client = boto3.client("cloudformation", region_name=region)
 
@@ -252,7 +283,9 @@ def detect_cognito_stack(region: str) -> dict[str, Any] | None:
         return None
 
 
-def validate_cognito_stack_for_distribution(stack_name: str, region: str) -> tuple[bool, str]:
+def validate_cognito_stack_for_distribution(
+    stack_name: str, region: str, outputs: dict[str, str] | None = None
+) -> tuple[bool, str]:
     """
     Validate that Cognito stack has required resources for distribution.
     Returns (is_valid, message).
@@ -262,9 +295,13 @@ def validate_cognito_stack_for_distribution(stack_name: str, region: str) -> tup
     - DistributionWebClientId
     - UserPoolDomain
     - DistributionWebClientSecretArn
+
+    Pass the outputs if they have already been fetched (e.g. by detect_cognito_stack)
+    to avoid describing the stack again.
     """
     try:
-        outputs = get_stack_outputs(stack_name, region)
+        if outputs is None:
+            outputs = get_stack_outputs(stack_name, region)
 
         required_outputs = [
             "UserPoolId",
@@ -297,6 +334,8 @@ def detect_all_cognito_stacks(region: str) -> list[dict[str, Any]]:
 
     Useful when multiple Cognito stacks exist and user needs to choose.
     """
+    import boto3
+
     try:
         client = boto3.client("cloudformation", region_name=region)
 
@@ -3,14 +3,18 @@
 
 """CloudFormation manager for boto3-based stack operations."""
 
+import hashlib
+import io
+import os
 import time
+import zipfile
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import boto3
-import cfn_flip
-from botocore.exceptions import ClientError, WaiterError
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
 
 from .cf_exceptions import (
     CloudFormationError,
@@ -20,6 +24,22 @@ from .cf_exceptions import (
     TemplateValidationError,
 )
 
+# Concurrent zip + upload workers when packaging local Lambda code; kept below the S3 connection pool size
+PACKAGE_UPLOAD_WORKERS = 8
+S3_MAX_POOL_CONNECTIONS = 16
+PACKAGE_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+# zlib level 1: Lambda source compresses to nearly the same size as the default level, several times faster
+PACKAGE_ZIP_LEVEL = 1
+# CloudFormation calls can run from several threads at once (e.g. destroy's failed-resource lookups);
+# adaptive retries absorb throttling bursts
+CF_MAX_ATTEMPTS = 10
+CF_MAX_POOL_CONNECTIONS = 16
+# Batch delete polling backs off from the initial to the maximum interval (seconds)
+DELETE_POLL_INITIAL = 5
+DELETE_POLL_MAX = 30
+# Seconds a get_stack_status result is reused before DescribeStacks is called again
+STACK_STATUS_TTL = 2.0
+
 
 class StackDeploymentResult:
     """Result of a stack deployment operation."""
@@ -53,25 +73,36 @@ class CloudFormationManager:
             region: AWS region
             profile: Optional AWS profile name
         """
+        # Imported here rather than at module scope so `ccwb deploy --help` doesn't load boto3
+        import boto3
+
         self.region = region
         self.session = (
             boto3.Session(region_name=region, profile_name=profile) if profile else boto3.Session(region_name=region)
         )
         self._cf_client = None
         self._s3_client = None
+        # stack name -> (status, time fetched); entries are dropped when this manager changes the stack
+        self._stack_status_cache: dict[str, tuple[str | None, float]] = {}
 
     @property
     def cf_client(self):
-        """Lazy-loaded CloudFormation client with connection pooling."""
+        """Lazy-loaded CloudFormation client with connection pooling and throttling-aware retries."""
         if not self._cf_client:
-            self._cf_client = self.session.client("cloudformation")
+            self._cf_client = self.session.client(
+                "cloudformation",
+                config=Config(
+                    retries={"max_attempts": CF_MAX_ATTEMPTS, "mode": "adaptive"},
+                    max_pool_connections=CF_MAX_POOL_CONNECTIONS,
+                ),
+            )
         return self._cf_client
 
     @property
     def s3_client(self):
-        """Lazy-loaded S3 client for template packaging."""
+        """Lazy-loaded S3 client for template packaging, sized for concurrent uploads."""
         if not self._s3_client:
-            self._s3_client = self.session.client("s3")
+            self._s3_client = self.session.client("s3", config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS))
         return self._s3_client
 
     def deploy_stack(
@@ -139,6 +170,7 @@ class CloudFormationManager:
                 if on_event:
                     on_event({"message": f"Creating stack {stack_name}..."})
                 response = self.cf_client.create_stack(**params)
+                self._invalidate_stack_status(stack_name)
                 stack_id = response["StackId"]
                 wait_status = "stack_create_complete"
             else:
@@ -149,6 +181,7 @@ class CloudFormationManager:
                     update_params = params.copy()
                     update_params.pop("DisableRollback", None)  # Not valid for updates
                     response = self.cf_client.update_stack(**update_params)
+                    self._invalidate_stack_status(stack_name)
                     stack_id = response["StackId"]
                     wait_status = "stack_update_complete"
                 except ClientError as e:
@@ -236,6 +269,7 @@ class CloudFormationManager:
                 on_event({"message": f"Deleting stack {stack_name}..."})
 
             self.cf_client.delete_stack(**params)
+            self._invalidate_stack_status(stack_name)
 
             # Wait for deletion
             success = self._wait_for_stack(stack_name, "stack_delete_complete", timeout, on_event)
@@ -249,6 +283,80 @@ class CloudFormationManager:
         except Exception as e:
             return StackDeletionResult(success=False, error=str(e))
 
+    def initiate_delete(self, stack_name: str, retain_resources: list[str] = None) -> StackDeletionResult:
+        """
+        Request deletion of a stack without waiting for it to finish.
+
+        Args:
+            stack_name: Name of the stack to delete
+            retain_resources: Resources to retain after deletion
+
+        Returns:
+            StackDeletionResult indicating whether the delete request was accepted
+        """
+        params = {"StackName": stack_name}
+        if retain_resources:
+            params["RetainResources"] = retain_resources
+
+        try:
+            self.cf_client.delete_stack(**params)
+            self._invalidate_stack_status(stack_name)
+            return StackDeletionResult(success=True)
+        except ClientError as e:
+            return StackDeletionResult(success=False, error=e.response["Error"]["Message"])
+
+    def wait_for_deletes(
+        self,
+        stack_names: list[str],
+        on_status: Callable[[str, str], None] = None,
+        timeout: int = 600,
+    ) -> dict[str, str | None]:
+        """
+        Wait for several stack deletions using one DescribeStacks listing per poll.
+
+        A stack that no longer appears in the listing has been deleted.
+
+        Args:
+            stack_names: Stacks whose deletion has been initiated
+            on_status: Callback invoked with (stack_name, status) whenever a stack's status changes
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            Mapping of stack name to DELETE_COMPLETE, DELETE_FAILED, or the last seen status (None if the
+            stack was never seen) when the timeout passes or polling keeps failing
+        """
+        pending = set(stack_names)
+        results: dict[str, str | None] = dict.fromkeys(stack_names)
+        deadline = time.monotonic() + timeout
+        delay = DELETE_POLL_INITIAL
+
+        while pending:
+            try:
+                statuses = self.list_stack_statuses()
+            except (ClientError, BotoCoreError):
+                # A throttled or dropped poll isn't a failed delete; keep the last statuses and try again
+                pass
+            else:
+                for stack_name in [name for name in stack_names if name in pending]:
+                    status = statuses.get(stack_name, "DELETE_COMPLETE")
+                    self._stack_status_cache[stack_name] = (
+                        None if status == "DELETE_COMPLETE" else status,
+                        time.monotonic(),
+                    )
+                    if status != results[stack_name] and on_status:
+                        on_status(stack_name, status)
+                    results[stack_name] = status
+                    if status in ("DELETE_COMPLETE", "DELETE_FAILED"):
+                        pending.discard(stack_name)
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, DELETE_POLL_MAX)
+
+        return results
+
     def get_failed_resources(self, stack_name: str) -> list[dict[str, str]]:
         """
         Get list of resources that failed to delete from a DELETE_FAILED stack.
@@ -260,18 +368,19 @@ class CloudFormationManager:
             List of dicts with: logical_id, physical_id, resource_type, status_reason
         """
         try:
-            response = self.cf_client.describe_stack_resources(StackName=stack_name)
+            # ListStackResources pages through every resource; DescribeStackResources stops at 100
             failed = []
-            for resource in response.get("StackResources", []):
-                if resource["ResourceStatus"] == "DELETE_FAILED":
-                    failed.append(
-                        {
-                            "logical_id": resource["LogicalResourceId"],
-                            "physical_id": resource.get("PhysicalResourceId", "N/A"),
-                            "resource_type": resource["ResourceType"],
-                            "status_reason": resource.get("ResourceStatusReason", "Unknown"),
-                        }
-                    )
+            for page in self.cf_client.get_paginator("list_stack_resources").paginate(StackName=stack_name):
+                for resource in page.get("StackResourceSummaries", []):
+                    if resource["ResourceStatus"] == "DELETE_FAILED":
+                        failed.append(
+                            {
+                                "logical_id": resource["LogicalResourceId"],
+                                "physical_id": resource.get("PhysicalResourceId", "N/A"),
+                                "resource_type": resource["ResourceType"],
+                                "status_reason": resource.get("ResourceStatusReason", "Unknown"),
+                            }
+                        )
             return failed
         except ClientError:
             return []
@@ -296,6 +405,8 @@ class CloudFormationManager:
         Returns:
             Packaged template as string
         """
+        import cfn_flip
+
         template_path = Path(template_path)
 
         # Read template
@@ -310,6 +421,9 @@ class CloudFormationManager:
 
         # Process resources for packaging
         if "Resources" in template:
+            # Local Lambda code is collected first and then zipped/uploaded concurrently
+            lambda_assets = []
+
             for resource_name, resource in template["Resources"].items():
                 # Ensure resource is a dict (cfn_flip might return special types)
                 if not isinstance(resource, dict):
@@ -319,7 +433,12 @@ class CloudFormationManager:
                 # Handle Lambda functions
                 if resource_type == "AWS::Lambda::Function":
                     code = resource.get("Properties", {}).get("Code", {})
-                    if "ZipFile" not in code and code.get("S3Bucket") != s3_bucket:
+                    if isinstance(code, str):
+                        # Local directory or archive path, as accepted by `aws cloudformation package`
+                        local_path = template_path.parent / code
+                        if local_path.exists():
+                            lambda_assets.append((resource["Properties"], "Code", local_path))
+                    elif "ZipFile" not in code and code.get("S3Bucket") != s3_bucket:
                         # Need to package local code
                         local_path = template_path.parent / code.get("S3Key", "")
                         if local_path.exists():
@@ -338,6 +457,14 @@ class CloudFormationManager:
                             # Update template
                             resource["Properties"]["Code"] = {"S3Bucket": s3_bucket, "S3Key": s3_key}
 
+                # Handle Lambda layers
+                elif resource_type == "AWS::Lambda::LayerVersion":
+                    content = resource.get("Properties", {}).get("Content")
+                    if isinstance(content, str):
+                        local_path = template_path.parent / content
+                        if local_path.exists():
+                            lambda_assets.append((resource["Properties"], "Content", local_path))
+
                 # Handle nested stacks
                 elif resource_type == "AWS::CloudFormation::Stack":
                     template_url = resource.get("Properties", {}).get("TemplateURL", "")
@@ -386,9 +513,75 @@ class CloudFormationManager:
                                     "TemplateURL"
                                 ] = f"https://s3.{self.region}.amazonaws.com/{s3_bucket}/{s3_key}"
 
+            if lambda_assets:
+                # Create the client before fanning out; boto3 clients are thread-safe once built
+                _ = self.s3_client
+                with ThreadPoolExecutor(max_workers=PACKAGE_UPLOAD_WORKERS) as executor:
+                    s3_keys = list(
+                        executor.map(
+                            lambda asset: self._zip_and_upload(asset[2], s3_bucket, s3_prefix, on_event),
+                            lambda_assets,
+                        )
+                    )
+                for (properties, property_name, _local_path), s3_key in zip(lambda_assets, s3_keys, strict=True):
+                    properties[property_name] = {"S3Bucket": s3_bucket, "S3Key": s3_key}
+
         # Return packaged template as YAML with CloudFormation intrinsic functions preserved
         return cfn_flip.dump_yaml(template)
 
+    def _zip_and_upload(
+        self, local_path: Path, s3_bucket: str, s3_prefix: str = None, on_event: Callable = None
+    ) -> str:
+        """
+        Zip local Lambda code and upload it to S3 under a content-addressed key.
+
+        Like `aws cloudformation package`, the key is the MD5 of the archive, so code that
+        is already in the bucket is detected with a HEAD request and not uploaded again.
+
+        Args:
+            local_path: Code directory, or an existing archive to upload as-is
+            s3_bucket: S3 bucket for artifacts
+            s3_prefix: Optional S3 key prefix
+            on_event: Callback for progress
+
+        Returns:
+            S3 key of the uploaded archive
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        buffer = io.BytesIO()
+        if local_path.is_dir():
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=PACKAGE_ZIP_LEVEL) as zf:
+                for root, dirs, files in os.walk(local_path):
+                    dirs.sort()
+                    for name in sorted(files):
+                        # ZipFile.write streams each file through the compressor in chunks
+                        file_path = os.path.join(root, name)
+                        zf.write(file_path, arcname=os.path.relpath(file_path, local_path))
+        else:
+            buffer.write(local_path.read_bytes())
+
+        digest = hashlib.md5(buffer.getbuffer(), usedforsecurity=False).hexdigest()
+        s3_key = f"{s3_prefix}/{digest}" if s3_prefix else digest
+
+        try:
+            self.s3_client.head_object(Bucket=s3_bucket, Key=s3_key)
+            if on_event:
+                on_event({"message": f"{local_path.name} unchanged, skipping upload"})
+            return s3_key
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+                raise
+
+        if on_event:
+            on_event({"message": f"Uploading {local_path.name} to s3://{s3_bucket}/{s3_key}"})
+
+        buffer.seek(0)
+        self.s3_client.upload_fileobj(
+            buffer, s3_bucket, s3_key, Config=TransferConfig(multipart_threshold=PACKAGE_MULTIPART_THRESHOLD)
+        )
+        return s3_key
+
     def get_stack_status(self, stack_name: str) -> str | None:
         """
         Get the current status of a stack.
@@ -399,15 +592,38 @@ class CloudFormationManager:
         Returns:
             Stack status or None if not found
         """
+        cached = self._stack_status_cache.get(stack_name)
+        if cached and time.monotonic() - cached[1] < STACK_STATUS_TTL:
+            return cached[0]
+
         try:
             response = self.cf_client.describe_stacks(StackName=stack_name)
-            if response["Stacks"]:
-                return response["Stacks"][0]["StackStatus"]
-            return None
+            status = response["Stacks"][0]["StackStatus"] if response["Stacks"] else None
         except ClientError as e:
-            if e.response["Error"]["Code"] == "ValidationError":
-                return None
-            raise
+            if e.response["Error"]["Code"] != "ValidationError":
+                raise
+            status = None
+
+        self._stack_status_cache[stack_name] = (status, time.monotonic())
+        return status
+
+    def _invalidate_stack_status(self, stack_name: str) -> None:
+        """Drop any cached status for a stack whose state this manager just changed."""
+        self._stack_status_cache.pop(stack_name, None)
+
+    def list_stack_statuses(self) -> dict[str, str]:
+        """
+        Get the status of every stack in the region with one paginated DescribeStacks listing.
+
+        Returns:
+            Mapping of stack name to status, excluding deleted stacks
+        """
+        statuses = {}
+        for page in self.cf_client.get_paginator("describe_stacks").paginate():
+            for stack in page.get("Stacks", []):
+                if stack["StackStatus"] != "DELETE_COMPLETE":
+                    statuses[stack["StackName"]] = stack["StackStatus"]
+        return statuses
 
     def get_stack_outputs(self, stack_name: str) -> dict[str, str]:
         """
@@ -494,6 +710,7 @@ class CloudFormationManager:
             return True
         except WaiterError:
             # Check if it's a timeout or actual failure
+            self._invalidate_stack_status(stack_name)
             final_status = self.get_stack_status(stack_name)
             if final_status and "FAILED" in final_status:
                 return False
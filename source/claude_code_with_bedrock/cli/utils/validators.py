@@ -4,6 +4,7 @@
 """Input validators for CLI commands."""
 
 import re
+from functools import lru_cache
 
 
 def validate_okta_domain(domain: str) -> bool:
@@ -26,6 +27,8 @@ def validate_okta_domain(domain: str) -> bool:
     return bool(re.match(pattern, domain))
 
 
+# Runs on every keystroke of the provider domain prompt; the result depends only on the text
+@lru_cache(maxsize=256)
 def validate_oidc_provider_domain(domain: str) -> bool:
     """Validate generic OIDC provider domain format.
 
@@ -562,6 +562,13 @@ CLAUDE_MODELS = {
     },
 }
 
+# Reverse lookup from any profile's model ID to its key in CLAUDE_MODELS
+MODEL_ID_TO_KEY = {
+    profile_config["model_id"]: model_key
+    for model_key, model_config in CLAUDE_MODELS.items()
+    for profile_config in model_config["profiles"].values()
+}
+
 
 def get_available_profiles_for_model(model_key: str) -> list[str]:
     """Get list of available cross-region profiles for a given model."""
@@ -1,8 +1,18 @@
 # ABOUTME: Provides secure URL validation for authentication providers
 # ABOUTME: Prevents URL injection attacks by using proper hostname parsing
 
+import re
 from urllib.parse import urlparse
 
+_has_url_scheme = re.compile(r"^https?://", re.IGNORECASE).match
+
+
+def ensure_url_scheme(url: str) -> str:
+    """Prefix ``https://`` to a bare hostname, leaving URLs with an http(s) scheme unchanged."""
+    if url and not _has_url_scheme(url):
+        return f"https://{url}"
+    return url
+
 
 def detect_provider_type_secure(domain: str) -> str:
     """
@@ -23,8 +33,7 @@ def detect_provider_type_secure(domain: str) -> str:
         return "oidc"
 
     # Handle both full URLs and domain-only inputs
-    if not domain.startswith(("http://", "https://")):
-        domain = f"https://{domain}"
+    domain = ensure_url_scheme(domain)
 
     try:
         parsed = urlparse(domain)
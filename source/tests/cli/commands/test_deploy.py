@@ -0,0 +1,245 @@
+# ABOUTME: Tests for deploy command helpers
+# ABOUTME: Covers per-account prerequisite caching and parameter handling
+
+"""Tests for deploy command helpers."""
+
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from cleo.testers.command_tester import CommandTester
+
+from claude_code_with_bedrock.cli.commands.deploy import DeployCommand, _load_deploy_cache
+from claude_code_with_bedrock.config import Config
+
+
+class TestEcsServiceLinkedRoleCache:
+    """Test that the ECS service-linked role check is cached per account."""
+
+    def test_verified_account_skips_iam(self):
+        """A second deploy for the same account should not call IAM."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Config, "CONFIG_DIR", Path(tmpdir)):
+                command = DeployCommand()
+                command.__dict__["_account_id"] = "123456789012"
+                console = Mock()
+
+                iam_client = MagicMock()
+                with patch("boto3.client", return_value=iam_client) as mock_client:
+                    command._ensure_ecs_service_linked_role(console)
+                    assert iam_client.get_role.call_count == 1
+                    assert _load_deploy_cache() == {"123456789012": {"ecs_slr": True}}
+
+                    command._ensure_ecs_service_linked_role(console)
+                    assert iam_client.get_role.call_count == 1
+                    assert mock_client.call_count == 1
+
+    def test_failed_check_is_not_cached(self):
+        """Errors verifying the role must not mark the account as verified."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Config, "CONFIG_DIR", Path(tmpdir)):
+                command = DeployCommand()
+                command.__dict__["_account_id"] = "123456789012"
+
+                with patch("boto3.client", side_effect=Exception("no credentials")):
+                    command._ensure_ecs_service_linked_role(Mock())
+
+                assert _load_deploy_cache() == {}
+
+
+class TestPackageAndDeploy:
+    """Test the shared package-then-deploy path used by dashboard and quota stacks."""
+
+    def _profile(self):
+        profile = Mock()
+        profile.aws_region = "us-east-1"
+        profile.identity_pool_name = "test-pool"
+        profile.stack_names = {}
+        return profile
+
+    def test_dashboard_packages_then_deploys(self):
+        """The packaged template is deployed and the temp file removed afterwards."""
+        command = DeployCommand()
+        cf_manager = Mock()
+        cf_manager.package_template.return_value = "Resources: {}\n"
+        cf_manager.deploy_stack.return_value = Mock(success=True)
+
+        with patch(
+            "claude_code_with_bedrock.cli.commands.deploy.get_stack_outputs",
+            return_value={"CfnArtifactsBucket": "artifacts-bucket"},
+        ):
+            result = command._deploy_stack("dashboard", self._profile(), Mock(), cf_manager, Mock(), 0)
+
+        assert result == 0
+        _template, bucket, prefix = cf_manager.package_template.call_args[0]
+        assert (bucket, prefix) == ("artifacts-bucket", "claude-code/dashboard")
+        packaged_path = cf_manager.deploy_stack.call_args.kwargs["template_path"]
+        assert not Path(packaged_path).exists()
+
+    def test_package_failure_skips_deploy(self):
+        """A packaging failure returns an error without deploying."""
+        command = DeployCommand()
+        cf_manager = Mock()
+        cf_manager.package_template.side_effect = Exception("boom")
+
+        with patch(
+            "claude_code_with_bedrock.cli.commands.deploy.get_stack_outputs",
+            return_value={"CfnArtifactsBucket": "artifacts-bucket"},
+        ):
+            result = command._deploy_stack("dashboard", self._profile(), Mock(), cf_manager, Mock(), 0)
+
+        assert result == 1
+        cf_manager.deploy_stack.assert_not_called()
+
+
+class TestQuotaParameters:
+    """Test quota stack parameter generation."""
+
+    def test_quota_params_use_integer_thresholds(self):
+        """Missing thresholds default to integer fractions of the monthly limit."""
+        command = DeployCommand()
+        cf_manager = Mock()
+        cf_manager.package_template.return_value = "Resources: {}\n"
+        cf_manager.deploy_stack.return_value = Mock(success=False, error="stop")
+
+        profile = Mock()
+        profile.aws_region = "us-east-1"
+        profile.identity_pool_name = "test-pool"
+        profile.stack_names = {}
+        profile.monthly_token_limit = 500_000_001
+        profile.warning_threshold_80 = None
+        profile.warning_threshold_90 = None
+        profile.daily_token_limit = None
+        profile.daily_enforcement_mode = "alert"
+        profile.monthly_enforcement_mode = "block"
+        profile.provider_domain = "company.okta.com"
+        profile.provider_type = "okta"
+        profile.client_id = "client-123"
+
+        outputs = {"MetricsTableArn": "arn:table", "CfnArtifactsBucket": "artifacts-bucket"}
+        with patch("claude_code_with_bedrock.cli.commands.deploy.get_stack_outputs", return_value=outputs):
+            command._deploy_stack("quota", profile, Mock(), cf_manager, Mock(), 0)
+
+        params = {
+            p["ParameterKey"]: p["ParameterValue"] for p in cf_manager.deploy_stack.call_args.kwargs["parameters"]
+        }
+        assert params["MonthlyTokenLimit"] == "500000001"
+        assert params["WarningThreshold80"] == "400000000"
+        assert params["WarningThreshold90"] == "450000000"
+        assert params["DailyTokenLimit"] == "0"
+        assert params["OidcIssuerUrl"] == "https://company.okta.com"
+
+    def test_explicit_zero_thresholds_are_kept(self):
+        """A threshold configured as 0 is passed through rather than replaced by a default."""
+        command = DeployCommand()
+        cf_manager = Mock()
+        cf_manager.package_template.return_value = "Resources: {}\n"
+        cf_manager.deploy_stack.return_value = Mock(success=False, error="stop")
+
+        profile = Mock()
+        profile.aws_region = "us-east-1"
+        profile.identity_pool_name = "test-pool"
+        profile.stack_names = {}
+        profile.monthly_token_limit = 1_000_000
+        profile.warning_threshold_80 = 0
+        profile.warning_threshold_90 = 0
+        profile.daily_token_limit = None
+        profile.daily_enforcement_mode = "alert"
+        profile.monthly_enforcement_mode = "block"
+        profile.provider_domain = "company.okta.com"
+        profile.provider_type = "okta"
+        profile.client_id = "client-123"
+
+        outputs = {"MetricsTableArn": "arn:table", "CfnArtifactsBucket": "artifacts-bucket"}
+        with patch("claude_code_with_bedrock.cli.commands.deploy.get_stack_outputs", return_value=outputs):
+            command._deploy_stack("quota", profile, Mock(), cf_manager, Mock(), 0)
+
+        params = {
+            p["ParameterKey"]: p["ParameterValue"] for p in cf_manager.deploy_stack.call_args.kwargs["parameters"]
+        }
+        assert params["WarningThreshold80"] == "0"
+        assert params["WarningThreshold90"] == "0"
+
+
+class TestPostDeploySteps:
+    """Test background execution of best-effort post-deploy steps."""
+
+    def test_runs_inline_without_pool(self):
+        """Outside handle() the step runs synchronously."""
+        command = DeployCommand()
+        step = Mock()
+
+        command._run_post_deploy(step, "a", "b")
+
+        step.assert_called_once_with("a", "b")
+
+    def test_background_steps_are_awaited(self):
+        """Steps submitted to the pool complete before the pool is released."""
+        command = DeployCommand()
+        command._post_deploy_pool = ThreadPoolExecutor(max_workers=2)
+        command._post_deploy_futures = []
+        step = Mock()
+
+        command._run_post_deploy(step, "profile")
+        command._wait_for_post_deploy(Mock())
+
+        step.assert_called_once_with("profile")
+        assert command._post_deploy_pool is None
+
+    def test_pool_released_when_a_deployment_raises(self):
+        """The post-deploy pool is shut down even if deploying a stack raises."""
+        command = DeployCommand()
+        profile = Mock(aws_region="us-east-1", identity_pool_name="test-pool", stack_names={})
+        config = Mock(active_profile="test", **{"get_profile.return_value": profile})
+        pools = []
+
+        def failing_deploy(*_args):
+            pools.append(command._post_deploy_pool)
+            raise RuntimeError("boom")
+
+        with (
+            patch("claude_code_with_bedrock.cli.commands.deploy.Config.load", return_value=config),
+            patch("claude_code_with_bedrock.cli.commands.deploy.CloudFormationManager"),
+            patch.object(command, "_deploy_stack", side_effect=failing_deploy),
+            pytest.raises(RuntimeError),
+        ):
+            CommandTester(command).execute("auth")
+
+        assert pools[0]._shutdown
+        assert command._post_deploy_pool is None
+        assert command._post_deploy_futures is None
+
+    def test_aggregator_client_created_before_handing_off(self):
+        """Stack outputs and the Lambda client come from the calling thread; only the update is backgrounded."""
+        command = DeployCommand()
+        command._post_deploy_pool = ThreadPoolExecutor(max_workers=2)
+        command._post_deploy_futures = []
+        profile = Mock(aws_region="us-east-1", metrics_log_group="/aws/claude-code/metrics")
+        lambda_client = MagicMock()
+        threads = {}
+
+        def make_client(*_args, **_kwargs):
+            threads["client"] = threading.current_thread()
+            return lambda_client
+
+        lambda_client.update_function_configuration.side_effect = lambda **_kwargs: threads.setdefault(
+            "update", threading.current_thread()
+        )
+
+        with (
+            patch(
+                "claude_code_with_bedrock.cli.commands.deploy.get_stack_outputs",
+                return_value={"QuotaTableName": "quota-table"},
+            ),
+            patch("boto3.client", side_effect=make_client),
+        ):
+            command._update_metrics_aggregator_env(profile, "test-pool-quota", Mock())
+            command._wait_for_post_deploy(Mock())
+
+        assert threads["client"] is threading.main_thread()
+        assert threads["update"] is not threading.main_thread()
+        env = lambda_client.update_function_configuration.call_args.kwargs["Environment"]["Variables"]
+        assert env["QUOTA_TABLE"] == "quota-table"
@@ -0,0 +1,274 @@
+# ABOUTME: Tests for destroy command stack ordering and cleanup reporting
+# ABOUTME: Covers dependency-ordered batched deletion and failed-resource collection
+
+"""Tests for destroy command."""
+
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+from cleo.testers.command_tester import CommandTester
+from rich.console import Console
+
+from claude_code_with_bedrock.cli.commands.destroy import STACK_DELETE_DEPENDENCIES, DestroyCommand, _ProgressUpdater
+from claude_code_with_bedrock.cli.utils.cloudformation import StackDeletionResult
+
+
+@pytest.fixture
+def profile():
+    """Profile with monitoring enabled so every stack is destroyed."""
+    profile = Mock()
+    profile.aws_region = "us-east-1"
+    profile.identity_pool_name = "test-pool"
+    profile.stack_names = {}
+    profile.monitoring_enabled = True
+    return profile
+
+
+@pytest.fixture
+def cf_manager():
+    """CloudFormation manager where every stack exists and deletes cleanly."""
+    manager = Mock()
+    manager.list_stack_statuses.return_value = {
+        f"test-pool-{stack}": "CREATE_COMPLETE" for stack in STACK_DELETE_DEPENDENCIES
+    }
+    manager.initiate_delete.return_value = StackDeletionResult(success=True)
+    manager.wait_for_deletes.side_effect = lambda names, **_kwargs: dict.fromkeys(names, "DELETE_COMPLETE")
+    return manager
+
+
+def _run(command, profile, cf_manager, args="--force"):
+    config = Mock()
+    config.active_profile = "test"
+    config.get_profile.return_value = profile
+    with (
+        patch("claude_code_with_bedrock.cli.commands.destroy.Config.load", return_value=config),
+        patch("claude_code_with_bedrock.cli.utils.cloudformation.CloudFormationManager", return_value=cf_manager),
+    ):
+        return CommandTester(command).execute(args)
+
+
+class TestDestroyOrdering:
+    """Test that stacks are deleted in batches that respect dependencies."""
+
+    def test_dependencies_finish_before_dependents_start(self, profile, cf_manager):
+        exit_code = _run(DestroyCommand(), profile, cf_manager)
+
+        assert exit_code == 0
+        waves = [
+            [name.removeprefix("test-pool-") for name in c.args[0]] for c in cf_manager.wait_for_deletes.call_args_list
+        ]
+        assert {stack for wave in waves for stack in wave} == set(STACK_DELETE_DEPENDENCIES)
+        wave_of = {stack: i for i, wave in enumerate(waves) for stack in wave}
+        for stack, deps in STACK_DELETE_DEPENDENCIES.items():
+            for dep in deps:
+                assert wave_of[dep] < wave_of[stack], f"{stack} started before {dep} finished"
+        # Independent stacks are polled together rather than one waiter per stack
+        assert len(waves) == 3
+
+    def test_failed_stack_resources_are_collected(self, profile, cf_manager, capsys):
+        command = DestroyCommand()
+        failed = [
+            {
+                "logical_id": "Bucket",
+                "physical_id": "my-bucket",
+                "resource_type": "AWS::S3::Bucket",
+                "status_reason": "not empty",
+            }
+        ]
+        cf_manager.wait_for_deletes.side_effect = lambda names, **_kwargs: {
+            name: "DELETE_FAILED" if name.endswith("-s3bucket") else "DELETE_COMPLETE" for name in names
+        }
+
+        with patch.object(command, "_get_failed_resources", return_value=failed) as get_failed:
+            exit_code = _run(command, profile, cf_manager)
+
+        assert exit_code == 0
+        get_failed.assert_called_once_with("test-pool-s3bucket", cf_manager)
+        output = capsys.readouterr().out
+        assert "aws s3 rm s3://my-bucket --recursive" in output
+        assert "test-pool-s3bucket" in output
+
+    def test_stack_existence_comes_from_one_listing(self, profile, cf_manager, capsys):
+        del cf_manager.list_stack_statuses.return_value["test-pool-dashboard"]
+
+        exit_code = _run(DestroyCommand(), profile, cf_manager)
+
+        assert exit_code == 0
+        cf_manager.list_stack_statuses.assert_called_once_with()
+        cf_manager.get_stack_status.assert_not_called()
+        deleted = {c.args[0] for c in cf_manager.initiate_delete.call_args_list}
+        assert "test-pool-dashboard" not in deleted
+        assert len(deleted) == len(STACK_DELETE_DEPENDENCIES) - 1
+        # Stacks that don't exist are left out of the preview entirely
+        assert "test-pool-dashboard" not in capsys.readouterr().out
+
+    def test_nothing_to_destroy_skips_confirmation(self, profile, cf_manager, capsys):
+        cf_manager.list_stack_statuses.return_value = {"unrelated-stack": "CREATE_COMPLETE"}
+
+        with patch("rich.prompt.Confirm.ask") as ask:
+            exit_code = _run(DestroyCommand(), profile, cf_manager, args="")
+
+        assert exit_code == 0
+        ask.assert_not_called()
+        cf_manager.initiate_delete.assert_not_called()
+        assert "Nothing to destroy" in capsys.readouterr().out
+
+    def test_failed_resources_fetched_for_every_failed_stack(self, profile, cf_manager):
+        command = DestroyCommand()
+        cf_manager.wait_for_deletes.side_effect = lambda names, **_kwargs: dict.fromkeys(names, "DELETE_FAILED")
+
+        def fake_failed(stack_name, _cf_manager):
+            if stack_name.endswith("-auth"):
+                return []
+            return [
+                {
+                    "logical_id": "Group",
+                    "physical_id": f"/logs/{stack_name}",
+                    "resource_type": "AWS::Logs::LogGroup",
+                    "status_reason": "in use",
+                }
+            ]
+
+        with (
+            patch.object(command, "_get_failed_resources", side_effect=fake_failed) as get_failed,
+            patch.object(command, "_show_cleanup_summary") as summary,
+        ):
+            exit_code = _run(command, profile, cf_manager)
+
+        assert exit_code == 0
+        assert get_failed.call_count == len(STACK_DELETE_DEPENDENCIES)
+        failed_resources, stacks = summary.call_args.args[:2]
+        assert len(failed_resources) == len(STACK_DELETE_DEPENDENCIES) - 1
+        # Stacks are reported in deletion order, not lookup completion order
+        assert stacks == [
+            f"test-pool-{stack}" for stack in ("analytics", "dashboard", "monitoring", "s3bucket", "networking")
+        ]
+
+    def test_one_manager_serves_the_whole_run(self, profile, cf_manager):
+        cf_manager.wait_for_deletes.side_effect = lambda names, **_kwargs: dict.fromkeys(names, "DELETE_FAILED")
+        cf_manager.get_failed_resources.return_value = []
+        config = Mock()
+        config.get_profile.return_value = profile
+
+        with (
+            patch("claude_code_with_bedrock.cli.commands.destroy.Config.load", return_value=config),
+            patch(
+                "claude_code_with_bedrock.cli.utils.cloudformation.CloudFormationManager", return_value=cf_manager
+            ) as manager_cls,
+        ):
+            CommandTester(DestroyCommand()).execute("--force")
+
+        manager_cls.assert_called_once_with(region="us-east-1")
+        assert cf_manager.get_failed_resources.call_count == len(STACK_DELETE_DEPENDENCIES)
+
+    def test_monitoring_stacks_skipped_when_monitoring_disabled(self, profile, cf_manager):
+        profile.monitoring_enabled = False
+
+        exit_code = _run(DestroyCommand(), profile, cf_manager)
+
+        assert exit_code == 0
+        deleted = [c.args[0] for c in cf_manager.initiate_delete.call_args_list]
+        assert deleted == ["test-pool-auth"]
+
+    def test_failed_resources_only_looked_up_when_unknown(self, profile, cf_manager):
+        command = DestroyCommand()
+        cf_manager.list_stack_statuses.return_value["test-pool-auth"] = "DELETE_FAILED"
+        cf_manager.initiate_delete.side_effect = lambda name: (
+            StackDeletionResult(success=False, error="denied")
+            if name.endswith("-dashboard")
+            else StackDeletionResult(success=True)
+        )
+        cf_manager.wait_for_deletes.side_effect = lambda names, **_kwargs: {
+            name: "DELETE_FAILED" if name.endswith("-networking") else "DELETE_COMPLETE" for name in names
+        }
+
+        with patch.object(command, "_get_failed_resources", return_value=[]) as get_failed:
+            exit_code = _run(command, profile, cf_manager)
+
+        assert exit_code == 0
+        # auth was already DELETE_FAILED and networking ended there; the rejected dashboard delete needs no lookup
+        assert sorted(c.args[0] for c in get_failed.call_args_list) == ["test-pool-auth", "test-pool-networking"]
+
+
+def _resource(rtype, physical_id):
+    return {"logical_id": "Res", "physical_id": physical_id, "resource_type": rtype, "status_reason": "in use"}
+
+
+class TestCleanupSummary:
+    """Test the manual cleanup instructions printed after failures."""
+
+    def _summary(self, profile, failed_resources, stacks):
+        console = Console(file=io.StringIO(), width=200)
+        DestroyCommand()._show_cleanup_summary(failed_resources, stacks, profile, console)
+        return console.file.getvalue()
+
+    def test_resources_grouped_by_type(self, profile):
+        output = self._summary(
+            profile,
+            [
+                _resource("AWS::SQS::Queue", "queue-1"),
+                _resource("AWS::S3::Bucket", "bucket-1"),
+                _resource("AWS::SNS::Topic", "topic-1"),
+                _resource("AWS::S3::Bucket", "bucket-2"),
+            ],
+            ["test-pool-s3bucket"],
+        )
+
+        assert output.index("aws s3 rb s3://bucket-1") < output.index("aws s3 rb s3://bucket-2")
+        # Unrecognised types keep the order they were first seen in
+        assert output.index("Other Resources:") < output.index("queue-1") < output.index("topic-1")
+        assert "aws cloudformation delete-stack --stack-name test-pool-s3bucket --region us-east-1" in output
+
+    def test_success_message_when_nothing_failed(self, profile):
+        assert "All stacks destroyed successfully" in self._summary(profile, [], [])
+
+    def test_summary_printed_in_one_call(self, profile):
+        console = Mock()
+        failed = [_resource("AWS::S3::Bucket", f"bucket-{i}") for i in range(20)]
+
+        DestroyCommand()._show_cleanup_summary(failed, ["test-pool-s3bucket"], profile, console)
+
+        console.print.assert_called_once()
+        assert "aws s3 rb s3://bucket-19" in console.print.call_args.args[0]
+
+
+class TestProgressUpdater:
+    """Test the per-wave status callback."""
+
+    def test_updates_the_stacks_task(self):
+        progress = Mock()
+        updater = _ProgressUpdater(progress, {"test-pool-auth": 7})
+
+        updater("test-pool-auth", "DELETE_IN_PROGRESS")
+
+        progress.update.assert_called_once_with(7, description="Deleting stack test-pool-auth (DELETE_IN_PROGRESS)...")
+
+
+class TestConfirmation:
+    """Test the destruction confirmation prompt."""
+
+    def test_non_interactive_without_force_fails_fast(self, profile, cf_manager, capsys):
+        with (
+            patch("claude_code_with_bedrock.cli.commands.destroy.sys.stdin") as stdin,
+            patch("rich.prompt.Confirm.ask") as ask,
+        ):
+            stdin.isatty.return_value = False
+            exit_code = _run(DestroyCommand(), profile, cf_manager, args="")
+
+        assert exit_code == 1
+        ask.assert_not_called()
+        cf_manager.initiate_delete.assert_not_called()
+        assert "--force" in capsys.readouterr().out
+
+    def test_interactive_prompt_can_cancel(self, profile, cf_manager):
+        with (
+            patch("claude_code_with_bedrock.cli.commands.destroy.sys.stdin") as stdin,
+            patch("rich.prompt.Confirm.ask", return_value=False) as ask,
+        ):
+            stdin.isatty.return_value = True
+            exit_code = _run(DestroyCommand(), profile, cf_manager, args="")
+
+        assert exit_code == 0
+        ask.assert_called_once()
+        cf_manager.initiate_delete.assert_not_called()
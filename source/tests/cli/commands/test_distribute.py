@@ -0,0 +1,858 @@
+# ABOUTME: Tests for distribute command landing-page package uploads
+# ABOUTME: Covers per-platform ZIP creation, concurrent S3 uploads, and the latest.json manifest
+
+"""Tests for the distribute command."""
+
+import hashlib
+import io
+import json
+import re
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from rich.console import Console
+
+from claude_code_with_bedrock.cli.commands.distribute import (
+    S3_CLIENT_SETTINGS,
+    S3_TRANSFER_SETTINGS,
+    DistributeCommand,
+    S3UploadProgress,
+    ZipSourceCache,
+    _manifest_body,
+    _windows_build_action,
+)
+
+
+@pytest.fixture
+def package_path(tmp_path):
+    """Build directory with Windows and Linux binaries."""
+    build = tmp_path / "dist" / "test-profile" / "2025-11-11-144312"
+    build.mkdir(parents=True)
+    for name in ("credential-process-windows.exe", "credential-process-linux-x64", "install.sh", "config.json"):
+        (build / name).write_bytes(name.encode() * 100)
+    (build / "claude-settings").mkdir()
+    (build / "claude-settings" / "settings.json").write_text("{}")
+    return build
+
+
+@pytest.fixture
+def profile():
+    profile = Mock()
+    profile.aws_region = "us-east-1"
+    profile.identity_pool_name = "test-pool"
+    profile.stack_names = {}
+    return profile
+
+
+def _upload(package_path, profile, s3):
+    """Run the landing-page upload with S3 and stack outputs mocked; return exit code and uploaded ZIPs."""
+    uploaded = {}
+
+    def fake_upload(fileobj, bucket, key, **kwargs):
+        with zipfile.ZipFile(fileobj) as zf:
+            uploaded[key] = sorted(zf.namelist())
+
+    s3.upload_fileobj.side_effect = s3.upload_fileobj.side_effect or fake_upload
+    s3.list_objects_v2.return_value = {}
+    outputs = {"DistributionBucket": "dist-bucket", "DistributionURL": "https://example.com"}
+
+    with (
+        patch("claude_code_with_bedrock.cli.commands.distribute.get_stack_outputs", return_value=outputs),
+        patch("boto3.Session") as session,
+    ):
+        session.return_value.client.return_value = s3
+        code = DistributeCommand()._upload_landing_page_packages(profile, Console(quiet=True), package_path)
+    return code, uploaded
+
+
+class TestOldFlatStructure:
+    """Test detection of the pre-profile flat dist/ layout."""
+
+    def test_flat_binaries_detected(self, tmp_path):
+        (tmp_path / "credential-process-linux-x64").write_bytes(b"x")
+
+        assert DistributeCommand()._check_old_flat_structure(tmp_path) is True
+
+    def test_organized_layout_not_flagged(self, package_path):
+        assert DistributeCommand()._check_old_flat_structure(package_path.parent.parent) is False
+        assert DistributeCommand()._check_old_flat_structure(package_path / "missing") is False
+
+
+class TestLandingPageUpload:
+    """Test building and uploading the per-platform landing page packages."""
+
+    def test_each_available_platform_is_zipped_and_uploaded(self, package_path, profile):
+        s3 = MagicMock()
+
+        code, uploaded = _upload(package_path, profile, s3)
+
+        assert code == 0
+        platforms = {key.split("/")[1] for key in uploaded}
+        assert platforms == {"windows", "linux", "all-platforms"}
+        linux_key = next(key for key in uploaded if key.startswith("packages/linux/"))
+        assert uploaded[linux_key] == [
+            "claude-code-package/claude-settings/settings.json",
+            "claude-code-package/config.json",
+            "claude-code-package/credential-process-linux-x64",
+            "claude-code-package/install.sh",
+        ]
+        manifest = json.loads(s3.put_object.call_args.kwargs["Body"])
+        assert set(manifest["binaries"]) == {"linux-x64", "linux-arm64", "windows"}
+
+    def test_failed_platform_upload_does_not_stop_others(self, package_path, profile):
+        s3 = MagicMock()
+
+        def fake_upload(fileobj, bucket, key, **kwargs):
+            if "/windows/" in key:
+                raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "PutObject")
+
+        s3.upload_fileobj.side_effect = fake_upload
+
+        code, _uploaded = _upload(package_path, profile, s3)
+
+        assert code == 0
+        assert s3.upload_fileobj.call_count == 3
+
+    def test_old_packages_removed_in_one_batch(self, package_path, profile):
+        s3 = MagicMock()
+        s3.list_objects_v2.side_effect = lambda Bucket, Prefix: (
+            {"Contents": [{"Key": f"{Prefix}0.9.0-linux.zip"}]} if "/linux/" in Prefix else {}
+        )
+
+        _upload(package_path, profile, s3)
+
+        s3.delete_object.assert_not_called()
+        s3.delete_objects.assert_called_once()
+        keys = [obj["Key"] for obj in s3.delete_objects.call_args.kwargs["Delete"]["Objects"]]
+        assert "packages/linux/claude-code-bedrock-0.9.0-linux.zip" in keys
+        assert "packages/all-platforms/latest.zip" in keys
+        assert len(keys) == 5
+
+    def test_current_packages_are_not_uploaded_again(self, package_path, profile):
+        s3 = MagicMock()
+        _upload(package_path, profile, s3)
+        stored = {c.args[2]: c.kwargs["ExtraArgs"]["Metadata"] for c in s3.upload_fileobj.call_args_list}
+        linux_key = next(key for key in stored if "/linux/" in key)
+        s3 = MagicMock()
+        s3.head_object.side_effect = lambda Bucket, Key: {"Metadata": stored[Key] if Key == linux_key else {}}
+        s3.list_objects_v2.side_effect = lambda Bucket, Prefix: (
+            {"Contents": [{"Key": linux_key}]} if "/linux/" in Prefix else {}
+        )
+
+        code, uploaded = _upload(package_path, profile, s3)
+
+        assert code == 0
+        assert linux_key not in uploaded
+        assert len(uploaded) == 2
+        deleted = [obj["Key"] for obj in s3.delete_objects.call_args.kwargs["Delete"]["Objects"]]
+        assert linux_key not in deleted
+        manifest = json.loads(s3.put_object.call_args.kwargs["Body"])
+        assert manifest["binaries"]["linux-x64"]["sha256"] == stored[linux_key]["sha256"]
+
+    def test_changed_build_is_uploaded_again(self, package_path, profile):
+        s3 = MagicMock()
+        s3.head_object.return_value = {"Metadata": {"timestamp": package_path.name, "sha256": "stale"}}
+
+        _code, uploaded = _upload(package_path, profile, s3)
+
+        assert len(uploaded) == 3
+
+    def test_uploads_use_shared_multipart_config(self, package_path, profile):
+        s3 = MagicMock()
+
+        _upload(package_path, profile, s3)
+
+        configs = {id(call.kwargs["Config"]): call.kwargs["Config"] for call in s3.upload_fileobj.call_args_list}
+        assert len(configs) == 1
+        (config,) = configs.values()
+        assert config.multipart_threshold == 8 * 1024 * 1024
+        assert S3_CLIENT_SETTINGS["max_pool_connections"] >= config.max_request_concurrency
+
+    def test_crt_transfer_client_used_when_available(self):
+        with patch("boto3.s3.transfer.has_minimum_crt_version", return_value=True):
+            config = DistributeCommand()._transfer_config
+
+        assert config.preferred_transfer_client == "crt"
+        assert config.multipart_chunksize == S3_TRANSFER_SETTINGS["multipart_chunksize"]
+
+    def test_part_size_scales_with_large_files(self):
+        command = DistributeCommand()
+        chunksize = S3_TRANSFER_SETTINGS["multipart_chunksize"]
+
+        assert command._transfer_config_for(50 * 1024 * 1024) is command._transfer_config
+        large = command._transfer_config_for(2 * 1024**3)
+        assert large.multipart_chunksize == 2 * 1024**3 // 32
+        assert large.max_request_concurrency == command._transfer_config.max_request_concurrency
+        assert command._transfer_config.multipart_chunksize == chunksize
+
+    def test_classic_transfer_client_without_awscrt(self):
+        with patch("boto3.s3.transfer.has_minimum_crt_version", return_value=False):
+            config = DistributeCommand()._transfer_config
+
+        assert config.preferred_transfer_client != "crt"
+        assert config.multipart_threshold == S3_TRANSFER_SETTINGS["multipart_threshold"]
+
+    @pytest.mark.parametrize(("status", "downloads"), [("SUCCEEDED", 1), ("IN_PROGRESS", 0), (None, 0)])
+    def test_missing_windows_binaries_use_the_build_probe(self, package_path, profile, status, downloads):
+        (package_path / "credential-process-windows.exe").unlink()
+        build_time = datetime(2025, 11, 11, tzinfo=timezone.utc) if status == "SUCCEEDED" else None
+
+        with (
+            patch.object(DistributeCommand, "_probe_windows_build", return_value=(status, build_time)) as probe,
+            patch.object(DistributeCommand, "_download_windows_artifacts", return_value=True) as download,
+        ):
+            _upload(package_path, profile, MagicMock())
+
+        probe.assert_called_once_with(profile)
+        assert download.call_count == downloads
+
+    def test_windows_build_not_probed_when_binaries_present(self, package_path, profile):
+        with patch.object(DistributeCommand, "_probe_windows_build") as probe:
+            _upload(package_path, profile, MagicMock())
+
+        probe.assert_not_called()
+
+
+class TestDistributionOutputs:
+    """Test that distribution stack outputs are looked up once per run."""
+
+    def test_outputs_fetched_once(self):
+        command = DistributeCommand()
+        outputs = {"DistributionBucket": "dist-bucket"}
+
+        with patch(
+            "claude_code_with_bedrock.cli.commands.distribute.get_stack_outputs", return_value=outputs
+        ) as get_outputs:
+            assert command._distribution_outputs("stack", "us-east-1") == outputs
+            assert command._distribution_outputs("stack", "us-east-1") == outputs
+
+        get_outputs.assert_called_once_with("stack", "us-east-1")
+
+    def test_failed_lookup_is_not_cached(self):
+        command = DistributeCommand()
+
+        with patch("claude_code_with_bedrock.cli.commands.distribute.get_stack_outputs", side_effect=[{}, {"a": "b"}]):
+            assert command._distribution_outputs("stack", "us-east-1") == {}
+            assert command._distribution_outputs("stack", "us-east-1") == {"a": "b"}
+
+
+class TestClients:
+    """Test that AWS clients come from one session per command."""
+
+    def test_clients_share_one_session_and_are_reused(self):
+        command = DistributeCommand()
+
+        with patch("boto3.Session") as session_cls:
+            s3 = command._client("s3", "us-east-1")
+            assert command._client("s3", "us-east-1") is s3
+            command._client("ssm", "us-east-1")
+            command._frozen_credentials  # noqa: B018
+
+        session_cls.assert_called_once_with()
+        session = session_cls.return_value
+        assert session.client.call_count == 2
+        s3_call, ssm_call = session.client.call_args_list
+        assert s3_call.kwargs["config"].tcp_keepalive is True
+        assert s3_call.kwargs["config"].max_pool_connections == S3_CLIENT_SETTINGS["max_pool_connections"]
+        assert ssm_call.kwargs["config"].retries == {"max_attempts": 10, "mode": "adaptive"}
+        assert ssm_call.kwargs["config"].tcp_keepalive is True
+
+    def test_concurrent_callers_get_one_client(self):
+        command = DistributeCommand()
+        start = threading.Barrier(4)
+
+        def get_client():
+            start.wait()
+            return command._client("ssm", "us-east-1")
+
+        with patch("boto3.Session") as session_cls:
+            session_cls.return_value.client.side_effect = lambda *args, **kwargs: Mock()
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                clients = list(pool.map(lambda _: get_client(), range(4)))
+
+        assert session_cls.return_value.client.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+
+class TestProbeWindowsBuild:
+    """Test the single CodeBuild lookup used for Windows binaries."""
+
+    def _probe(self, profile, builds):
+        codebuild = Mock()
+        codebuild.list_builds_for_project.return_value = {"ids": [b["id"] for b in builds]}
+        codebuild.batch_get_builds.return_value = {"builds": builds}
+        command = DistributeCommand()
+        with patch.object(command, "_client", return_value=codebuild):
+            return command._probe_windows_build(profile), codebuild
+
+    def test_newest_success_reported(self, profile):
+        finished = datetime(2025, 11, 11, tzinfo=timezone.utc)
+        builds = [
+            {"id": "b3", "buildStatus": "FAILED"},
+            {"id": "b2", "buildStatus": "SUCCEEDED", "endTime": finished},
+            {"id": "b1", "buildStatus": "SUCCEEDED", "endTime": finished - timedelta(days=1)},
+        ]
+
+        (status, build_time), codebuild = self._probe(profile, builds)
+
+        assert (status, build_time) == ("SUCCEEDED", finished)
+        codebuild.list_builds_for_project.assert_called_once()
+        codebuild.batch_get_builds.assert_called_once_with(ids=["b3", "b2", "b1"])
+
+    def test_running_build_ahead_of_success(self, profile):
+        finished = datetime(2025, 11, 11, tzinfo=timezone.utc)
+        builds = [
+            {"id": "b2", "buildStatus": "IN_PROGRESS"},
+            {"id": "b1", "buildStatus": "SUCCEEDED", "endTime": finished},
+        ]
+
+        (status, build_time), _codebuild = self._probe(profile, builds)
+
+        assert (status, build_time) == ("IN_PROGRESS", finished)
+
+    def test_no_builds(self, profile):
+        (status, build_time), codebuild = self._probe(profile, [])
+
+        assert (status, build_time) == (None, None)
+        codebuild.batch_get_builds.assert_not_called()
+
+
+BUILD_TIME = datetime(2025, 11, 11, tzinfo=timezone.utc)
+
+
+class TestWindowsBuildAction:
+    """Test the shared decision on what to do with a Windows build probe result."""
+
+    @pytest.mark.parametrize(
+        ("status", "build_time", "local_time", "action"),
+        [
+            ("SUCCEEDED", BUILD_TIME, None, "download"),
+            ("IN_PROGRESS", BUILD_TIME, None, "wait"),
+            ("IN_PROGRESS", None, None, "wait"),
+            (None, None, None, None),
+            ("SUCCEEDED", BUILD_TIME, BUILD_TIME - timedelta(hours=1), "download"),
+            ("IN_PROGRESS", BUILD_TIME, BUILD_TIME - timedelta(hours=1), "download"),
+            ("SUCCEEDED", BUILD_TIME, BUILD_TIME, None),
+            ("IN_PROGRESS", None, BUILD_TIME, None),
+        ],
+    )
+    def test_action(self, status, build_time, local_time, action):
+        assert _windows_build_action(status, build_time, local_time) == action
+
+
+class TestLatestUrl:
+    """Test reading the latest presigned URL back from Parameter Store."""
+
+    def _latest(self, profile, expires):
+        ssm = Mock()
+        value = {"url": "https://example.com/p.zip", "expires": expires.isoformat(), "filename": "p.zip"}
+        ssm.get_parameter.return_value = {"Parameter": {"Value": json.dumps(value)}}
+        command = DistributeCommand()
+        command.__dict__["_session"] = Mock(**{"client.return_value": ssm})
+        with (
+            patch.object(command, "option", return_value=False),
+            patch.object(command, "_show_download_stats"),
+        ):
+            return command._get_latest_url(profile, Console(quiet=True))
+
+    def test_expired_url_is_rejected(self, profile):
+        assert self._latest(profile, datetime.now(timezone.utc) - timedelta(minutes=5)) == 1
+
+    def test_valid_url_is_shown(self, profile):
+        assert self._latest(profile, datetime.now(timezone.utc) + timedelta(hours=1)) == 0
+
+    def test_legacy_naive_local_expiry_still_compares(self, profile):
+        assert self._latest(profile, datetime.now() + timedelta(minutes=5)) == 0
+        assert self._latest(profile, datetime.now() - timedelta(minutes=5)) == 1
+
+
+class TestCreateDistribution:
+    """Test the presigned-URL distribution reusing an unchanged package."""
+
+    def _distribute(
+        self, profile, package_path, published, stored_checksum="abc123", console=None, ssm=None, enabled=True
+    ):
+        s3 = Mock()
+        s3.head_object.return_value = {"Metadata": {"checksum": stored_checksum}}
+        ssm = ssm or Mock()
+        ssm.get_parameter.return_value = {"Parameter": {"Value": json.dumps(published)}}
+        options = {"expires-hours": "48", "allowed-ips": None, "show-qr": False}
+        profile.enable_distribution = enabled
+        profile.name = "test"
+        command = DistributeCommand()
+        archive_path = package_path.parent / "claude-code-package.zip"
+        archive_path.write_bytes(b"zip")
+
+        with (
+            patch.object(command, "option", side_effect=options.get),
+            patch.object(command, "_probe_windows_build", return_value=(None, None)),
+            patch.object(command, "_distribution_outputs", return_value={"DistributionBucket": "dist-bucket"}),
+            patch.object(command, "_client", side_effect=lambda service, _region: {"s3": s3, "ssm": ssm}[service]),
+            patch.object(command, "_cached_archive", return_value=(archive_path, "abc123")),
+            patch.object(command, "_presign", return_value="https://example.com/signed"),
+        ):
+            exit_code = command._create_distribution(profile, console or Console(quiet=True), package_path)
+
+        assert exit_code == 0
+        if not enabled:
+            return s3, None
+        stored = json.loads(ssm.put_parameter.call_args.kwargs["Value"])
+        return s3, stored
+
+    def test_unchanged_package_is_not_uploaded_again(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        published = {"checksum": "abc123", "package_key": "packages/old/p.zip", "filename": "p.zip"}
+
+        s3, stored = self._distribute(profile, package_path, published)
+
+        s3.upload_file.assert_not_called()
+        s3.head_object.assert_called_once_with(Bucket="dist-bucket", Key="packages/old/p.zip")
+        assert stored["package_key"] == "packages/old/p.zip"
+        assert stored["filename"] == "p.zip"
+        assert stored["url"] == "https://example.com/signed"
+
+    def test_changed_package_is_uploaded(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        published = {"checksum": "old", "package_key": "packages/old/p.zip", "filename": "p.zip"}
+
+        s3, stored = self._distribute(profile, package_path, published)
+
+        s3.head_object.assert_not_called()
+        s3.upload_file.assert_called_once()
+        assert stored["package_key"] == s3.upload_file.call_args.args[2] != "packages/old/p.zip"
+
+    def test_package_contents_come_from_one_listing(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        console = Console(file=io.StringIO(), width=200)
+
+        with patch("pathlib.Path.stat", autospec=True, side_effect=Path.stat) as stat:
+            self._distribute(profile, package_path, {}, console=console)
+
+        # No per-file stat of the build directory's contents
+        assert not [c for c in stat.call_args_list if c.args[0].parent == package_path]
+        output = console.file.getvalue()
+        assert "Windows executable" in output
+        assert "Linux x64 executable" in output
+        assert "Unix installer script" in output
+        assert "Configuration file" in output
+        assert "macOS ARM64" not in output
+
+    def test_s3_connection_warmed_before_upload(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+
+        s3, _ = self._distribute(profile, package_path, {})
+
+        s3.head_bucket.assert_called_once_with(Bucket="dist-bucket")
+        s3.upload_file.assert_called_once()
+
+    def test_missing_bucket_fails_before_archive_is_built(self, profile, package_path):
+        profile.enable_distribution = True
+        command = DistributeCommand()
+
+        with (
+            patch.object(command, "option", side_effect={"expires-hours": "48"}.get),
+            patch.object(command, "_probe_windows_build", return_value=(None, None)),
+            patch.object(command, "_distribution_outputs", return_value={}),
+            patch.object(command, "_cached_archive") as cached_archive,
+        ):
+            exit_code = command._create_distribution(profile, Console(quiet=True), package_path)
+
+        assert exit_code == 1
+        cached_archive.assert_not_called()
+
+    def test_expiry_shown_in_local_time_like_get_latest(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        # A zone away from UTC, so a missing conversion shows up as a different wall-clock time
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            console = Console(file=io.StringIO(), width=200)
+            _, stored = self._distribute(profile, package_path, {}, console=console)
+            created_expiry = re.search(r"Expires: (.+)", console.file.getvalue()).group(1).strip()
+
+            ssm = Mock()
+            ssm.get_parameter.return_value = {"Parameter": {"Value": json.dumps(stored)}}
+            command = DistributeCommand()
+            command.__dict__["_session"] = Mock(**{"client.return_value": ssm})
+            latest_console = Console(file=io.StringIO(), width=200)
+            with (
+                patch.object(command, "option", return_value=False),
+                patch.object(command, "_show_download_stats"),
+            ):
+                assert command._get_latest_url(profile, latest_console) == 0
+            latest_expiry = re.search(r"Expires: (.+)", latest_console.file.getvalue()).group(1).strip()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert created_expiry == latest_expiry
+        # The stored expiry is UTC; showing its wall-clock time unconverted would differ in New York
+        assert created_expiry != datetime.fromisoformat(stored["expires"]).strftime("%Y-%m-%d %H:%M:%S")
+
+    def test_parameter_store_failure_reported_after_url(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        ssm = Mock()
+        ssm.put_parameter.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "denied"}}, "PutParameter"
+        )
+        console = Console(file=io.StringIO(), width=200)
+
+        self._distribute(profile, package_path, {}, console=console, ssm=ssm)
+
+        output = console.file.getvalue()
+        assert output.index("https://example.com/signed") < output.index("Failed to store in Parameter Store")
+
+    def test_distribution_disabled_saves_locally(self, profile, package_path, monkeypatch, tmp_path):
+        (tmp_path / "cwd").mkdir()
+        monkeypatch.chdir(tmp_path / "cwd")
+
+        s3, _ = self._distribute(profile, package_path, {}, enabled=False)
+
+        s3.upload_file.assert_not_called()
+        (saved,) = (tmp_path / "cwd" / "dist").iterdir()
+        assert saved.suffix == ".zip"
+        # Same filesystem as the archive, so it's a hard link rather than a second copy
+        assert saved.samefile(package_path.parent / "claude-code-package.zip")
+
+    def test_local_save_copies_across_filesystems(self, profile, package_path, monkeypatch, tmp_path):
+        (tmp_path / "cwd").mkdir()
+        monkeypatch.chdir(tmp_path / "cwd")
+
+        with patch("claude_code_with_bedrock.cli.commands.distribute.os.link", side_effect=OSError(18, "EXDEV")):
+            self._distribute(profile, package_path, {}, enabled=False)
+
+        (saved,) = (tmp_path / "cwd" / "dist").iterdir()
+        assert saved.read_bytes() == b"zip"
+        assert not saved.samefile(package_path.parent / "claude-code-package.zip")
+
+    def test_distribution_enabled_leaves_no_local_copy(self, profile, package_path, monkeypatch, tmp_path):
+        (tmp_path / "cwd").mkdir()
+        monkeypatch.chdir(tmp_path / "cwd")
+
+        self._distribute(profile, package_path, {})
+
+        assert not (tmp_path / "cwd" / "dist").exists()
+
+    def test_missing_object_is_uploaded_again(self, profile, package_path, monkeypatch, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        published = {"checksum": "abc123", "package_key": "packages/old/p.zip", "filename": "p.zip"}
+
+        s3, _ = self._distribute(profile, package_path, published, stored_checksum="other")
+
+        s3.upload_file.assert_called_once()
+
+
+class TestDownloadWindowsArtifacts:
+    """Test fetching Windows binaries from the CodeBuild bucket."""
+
+    def test_artifact_extracted_from_memory(self, profile, tmp_path):
+        artifact = io.BytesIO()
+        with zipfile.ZipFile(artifact, "w") as zf:
+            zf.writestr("credential-process-windows.exe", b"exe")
+            zf.writestr("otel-helper-windows.exe", b"otel")
+        s3 = Mock()
+        s3.download_fileobj.side_effect = lambda _bucket, _key, fileobj, **_kwargs: fileobj.write(artifact.getvalue())
+        profile.enable_codebuild = True
+        outputs = {"BuildBucket": "build-bucket", "ProjectName": "windows-build"}
+        command = DistributeCommand()
+
+        with (
+            patch("claude_code_with_bedrock.cli.utils.aws.get_stack_outputs", return_value=outputs),
+            patch.object(command, "_client", return_value=s3),
+        ):
+            assert command._download_windows_artifacts(profile, tmp_path, Console(quiet=True))
+
+        assert s3.download_fileobj.call_args.args[:2] == ("build-bucket", "windows-binaries.zip")
+        assert (tmp_path / "credential-process-windows.exe").read_bytes() == b"exe"
+        # Nothing but the extracted binaries lands in the build directory
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "credential-process-windows.exe",
+            "otel-helper-windows.exe",
+        ]
+
+
+class TestZipSourceCache:
+    """Test sharing source files between platform ZIPs."""
+
+    def test_shared_files_are_read_once(self, package_path):
+        sources = ZipSourceCache(package_path)
+        command = DistributeCommand()
+        files = [("config.json", "config.json"), ("credential-process-linux-x64", "credential-process-linux-x64")]
+        (package_path / "credential-process-linux-x64").chmod(0o755)
+
+        with patch("pathlib.Path.read_bytes", autospec=True, side_effect=lambda p: open(p, "rb").read()) as read:
+            first, _, _ = command._build_platform_zip("linux", files, package_path, sources)
+            second, _, _ = command._build_platform_zip("all-platforms", files, package_path, sources)
+
+        assert read.call_count == len(files) + 1  # plus claude-settings/settings.json
+        for buffer in (first, second):
+            with zipfile.ZipFile(buffer) as zf:
+                info = zf.getinfo("claude-code-package/credential-process-linux-x64")
+                assert info.external_attr >> 16 & 0o777 == 0o755
+                assert zf.read(info) == (package_path / "credential-process-linux-x64").read_bytes()
+
+    def test_build_directory_listed_once(self, package_path):
+        sources = ZipSourceCache(package_path)
+        files = [("README.md", "README.md"), ("install.sh", "install.sh")]
+
+        with patch("pathlib.Path.exists") as exists:
+            buffer, _, _ = DistributeCommand()._build_platform_zip("linux", files, package_path, sources)
+
+        exists.assert_not_called()
+        assert "claude-settings" not in sources.present
+        with zipfile.ZipFile(buffer) as zf:
+            # README.md isn't in this build, so only the files that are present are packaged
+            assert sorted(zf.namelist()) == [
+                "claude-code-package/claude-settings/settings.json",
+                "claude-code-package/install.sh",
+            ]
+
+    def test_only_text_files_are_deflated(self, package_path):
+        files = [("config.json", "config.json"), ("credential-process-linux-x64", "credential-process-linux-x64")]
+
+        buffer, _, _ = DistributeCommand()._build_platform_zip("linux", files, package_path)
+
+        with zipfile.ZipFile(buffer) as zf:
+            assert zf.getinfo("claude-code-package/config.json").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("claude-code-package/credential-process-linux-x64").compress_type == zipfile.ZIP_STORED
+
+
+class TestCreateArchive:
+    """Test the single-package archive used for presigned URL distribution."""
+
+    def test_archive_built_from_build_directory(self, package_path):
+        archive_path, checksum = DistributeCommand()._create_archive(package_path)
+
+        assert checksum == hashlib.sha256(archive_path.read_bytes()).hexdigest()
+        with zipfile.ZipFile(archive_path) as zf:
+            assert zf.testzip() is None
+            assert sorted(zf.namelist()) == [
+                "claude-code-package/claude-settings/settings.json",
+                "claude-code-package/config.json",
+                "claude-code-package/credential-process-linux-x64",
+                "claude-code-package/credential-process-windows.exe",
+                "claude-code-package/install.sh",
+            ]
+            assert zf.getinfo("claude-code-package/config.json").compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("claude-code-package/credential-process-windows.exe").compress_type == zipfile.ZIP_STORED
+        # Nothing but the archive is left in the temp directory
+        assert [p.name for p in archive_path.parent.iterdir()] == ["claude-code-package.zip"]
+
+
+class TestCachedArchive:
+    """Test reusing the archive across runs on an unchanged build."""
+
+    def test_unchanged_build_reuses_archive(self, package_path, tmp_path):
+        command = DistributeCommand()
+
+        with patch("pathlib.Path.home", return_value=tmp_path / "home"):
+            first = command._cached_archive(package_path)
+            with patch.object(command, "_create_archive") as create:
+                second = command._cached_archive(package_path)
+
+        create.assert_not_called()
+        assert second == first
+        assert first[0].parent == tmp_path / "home" / ".claude-code" / "dist-cache"
+        assert first[1] == hashlib.sha256(first[0].read_bytes()).hexdigest()
+
+    def test_changed_file_rebuilds_and_drops_old_archive(self, package_path, tmp_path):
+        command = DistributeCommand()
+
+        with patch("pathlib.Path.home", return_value=tmp_path / "home"):
+            old_archive, old_checksum = command._cached_archive(package_path)
+            (package_path / "claude-settings" / "settings.json").write_text('{"env": {}}')
+            new_archive, new_checksum = command._cached_archive(package_path)
+
+        assert new_checksum != old_checksum
+        assert new_archive.is_file()
+        assert not old_archive.exists()
+
+    def test_unreadable_cache_is_rebuilt(self, package_path, tmp_path):
+        cache_dir = tmp_path / "home" / ".claude-code"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "distcache.json").write_text("not json")
+
+        with patch("pathlib.Path.home", return_value=tmp_path / "home"):
+            archive_path, _ = DistributeCommand()._cached_archive(package_path)
+
+        assert archive_path.is_file()
+        assert json.loads((cache_dir / "distcache.json").read_text())
+
+
+class TestManifestBody:
+    """Test serialising latest.json with the optional orjson fast path."""
+
+    MANIFEST = {"version": "2025-11-11-144312", "binaries": {"linux-x64": {"sha256": "abc", "size_bytes": 10}}}
+
+    def test_uses_orjson_when_installed(self):
+        orjson = Mock(OPT_INDENT_2=2)
+        orjson.dumps.return_value = b"{}"
+
+        with patch.dict(sys.modules, {"orjson": orjson}):
+            assert _manifest_body(self.MANIFEST) == b"{}"
+
+        orjson.dumps.assert_called_once_with(self.MANIFEST, option=2)
+
+    def test_falls_back_to_stdlib_json(self):
+        with patch.dict(sys.modules, {"orjson": None}):
+            body = _manifest_body(self.MANIFEST)
+
+        assert body == json.dumps(self.MANIFEST, indent=2).encode("utf-8")
+
+
+class TestPresign:
+    """Test presigned URL generation with the optional libpresign fast path."""
+
+    def _command(self, token=None):
+        command = DistributeCommand()
+        command.__dict__["_frozen_credentials"] = Mock(access_key="AKID", secret_key="SECRET", token=token)
+        return command
+
+    def _s3(self):
+        s3 = Mock()
+        s3.meta.region_name = "us-west-2"
+        s3.generate_presigned_url.return_value = "https://boto3-url"
+        return s3
+
+    def test_uses_libpresign_for_long_term_credentials(self):
+        libpresign = Mock()
+        libpresign.get.return_value = "https://fast-url"
+        s3 = self._s3()
+
+        with patch.dict(sys.modules, {"libpresign": libpresign}):
+            url = self._command()._presign(s3, "bucket", "packages/a.zip", 3600)
+
+        assert url == "https://fast-url"
+        libpresign.get.assert_called_once_with(
+            access_key_id="AKID",
+            secret_access_key="SECRET",
+            region="us-west-2",
+            bucket="bucket",
+            key="packages/a.zip",
+            expires=3600,
+        )
+        s3.generate_presigned_url.assert_not_called()
+
+    def test_temporary_credentials_use_boto3(self):
+        libpresign = Mock()
+        s3 = self._s3()
+
+        with patch.dict(sys.modules, {"libpresign": libpresign}):
+            url = self._command(token="session-token")._presign(s3, "bucket", "packages/a.zip", 3600)
+
+        assert url == "https://boto3-url"
+        libpresign.get.assert_not_called()
+
+    def test_falls_back_to_boto3_without_libpresign(self):
+        s3 = self._s3()
+
+        with patch.dict(sys.modules, {"libpresign": None}):
+            url = self._command()._presign(s3, "bucket", "packages/a.zip", 3600)
+
+        assert url == "https://boto3-url"
+        s3.generate_presigned_url.assert_called_once_with(
+            "get_object", Params={"Bucket": "bucket", "Key": "packages/a.zip"}, ExpiresIn=3600
+        )
+
+
+class TestChecksum:
+    """Test SHA256 checksums of package archives."""
+
+    def test_manifest_checksums_match_uploaded_zips(self, package_path, profile):
+        s3 = MagicMock()
+        digests = {}
+
+        def fake_upload(fileobj, bucket, key, **kwargs):
+            digests[key] = hashlib.sha256(fileobj.read()).hexdigest()
+
+        s3.upload_fileobj.side_effect = fake_upload
+
+        _upload(package_path, profile, s3)
+
+        manifest = json.loads(s3.put_object.call_args.kwargs["Body"])
+        for binary in manifest["binaries"].values():
+            assert binary["sha256"] == digests[binary["s3_key"]]
+
+    def test_zip_is_built_in_memory_with_digest(self, package_path):
+        files = [("credential-process-linux-x64", "credential-process"), ("install.sh", "install.sh")]
+
+        buffer, size_bytes, digest = DistributeCommand()._build_platform_zip("linux", files, package_path)
+
+        assert buffer.tell() == 0
+        data = buffer.getvalue()
+        assert size_bytes == len(data)
+        assert digest == hashlib.sha256(data).hexdigest()
+        with zipfile.ZipFile(buffer) as zf:
+            assert zf.testzip() is None
+            assert "claude-code-package/claude-settings/settings.json" in zf.namelist()
+
+    def test_failed_platform_is_left_out_of_manifest(self, package_path, profile):
+        s3 = MagicMock()
+
+        def fake_upload(fileobj, bucket, key, **kwargs):
+            if "windows" in key:
+                raise ClientError({"Error": {"Code": "AccessDenied", "Message": "denied"}}, "PutObject")
+
+        s3.upload_fileobj.side_effect = fake_upload
+
+        _upload(package_path, profile, s3)
+
+        manifest = json.loads(s3.put_object.call_args.kwargs["Body"])
+        assert set(manifest["binaries"]) == {"linux-x64", "linux-arm64"}
+
+
+class TestUploadProgress:
+    """Test the byte-level upload progress callback."""
+
+    def test_updates_are_batched_until_threshold_or_completion(self):
+        bar = Mock()
+        size = 1024 * 1024 + 100
+        callback = S3UploadProgress("package.zip", size, bar)
+        callback.set_task_id(1)
+
+        for _ in range(size // 8192):
+            callback(8192)
+        callback(size % 8192)
+
+        completed = [c.kwargs["completed"] for c in bar.update.call_args_list]
+        assert len(completed) == 5
+        assert completed == sorted(completed)
+        assert completed[-1] == size
+
+
+class TestScanDistributions:
+    """Test discovery of packaged builds under dist/."""
+
+    def test_builds_are_listed_newest_first_with_sizes(self, package_path):
+        dist_dir = package_path.parent.parent
+        older = package_path.parent / "2025-01-01-000000"
+        older.mkdir()
+        (older / "credential-process-linux-x64").write_bytes(b"x" * 10)
+        (package_path.parent / "notes.txt").write_text("ignored")
+
+        builds = DistributeCommand()._scan_distributions(dist_dir)
+
+        profile_builds = builds["test-profile"]
+        assert [b["timestamp"] for b in profile_builds] == ["2025-11-11-144312", "2025-01-01-000000"]
+        expected = sum(f.stat().st_size for f in package_path.rglob("*") if f.is_file())
+        assert profile_builds[0]["size"] == expected
+        assert profile_builds[1]["size"] == 10
+
+    def test_platforms_come_from_top_level_binaries_only(self, package_path):
+        nested = package_path.parent / "2025-01-01-000000" / "windows-binaries"
+        nested.mkdir(parents=True)
+        (nested / "credential-process-windows.exe").write_bytes(b"x")
+
+        builds = DistributeCommand()._scan_distributions(package_path.parent.parent)
+
+        # The build with only a nested binary is not a distributable build
+        assert [b["timestamp"] for b in builds["test-profile"]] == ["2025-11-11-144312"]
+        assert builds["test-profile"][0]["platforms"] == ["linux-x64", "windows"]
@@ -13,7 +13,16 @@ import pytest
 # ruff: noqa: E402
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from claude_code_with_bedrock.cli.commands.init import validate_cognito_user_pool_id, validate_identity_pool_name
+from claude_code_with_bedrock.cli.commands.init import (
+    detect_provider_type,
+    parse_provider_domain,
+    validate_client_id,
+    validate_cognito_user_pool_id,
+    validate_custom_domain,
+    validate_identity_pool_name,
+    validate_monthly_limit,
+    validate_provider_domain,
+)
 
 
 class TestNamedValidationFunctions:
@@ -53,6 +62,22 @@ class TestNamedValidationFunctions:
             result = validate_cognito_user_pool_id(pool_id)
             assert result == "Invalid User Pool ID format", f"Expected '{pool_id}' to be invalid, but got: {result}"
 
+    def test_wizard_field_validators(self):
+        """Test the provider domain, client ID, custom domain and monthly limit validators."""
+        assert validate_provider_domain("company.okta.com") is True
+        assert validate_provider_domain("not a domain") == "Invalid provider domain format (e.g., company.okta.com)"
+
+        assert validate_client_id("0oa1b2c3d4e5") is True
+        assert validate_client_id("short") == "Client ID must be at least 10 characters"
+
+        assert validate_custom_domain("telemetry.company.com") is True
+        for domain in ("", "localhost"):
+            assert isinstance(validate_custom_domain(domain), str)
+
+        assert validate_monthly_limit("225") is True
+        for limit in ("", "0", "-5", "1.5"):
+            assert isinstance(validate_monthly_limit(limit), str)
+
 
 class TestInitCommandValidation:
     """Test validation functions in the init command (lambda compatibility)."""
@@ -276,6 +301,61 @@ class TestCognitoRegionDetection:
         assert region_match is not None, "Fallback region detection failed"
         assert region_match.group(1) == "us-west-2", f"Wrong region extracted: {region_match.group(1)}"
 
+    def test_module_patterns_detect_fips_and_govcloud_regions(self):
+        """Test the precompiled patterns init.py uses for Cognito region detection."""
+        from claude_code_with_bedrock.cli.commands.init import _AWS_REGION_RE, _COGNITO_REGION_RE
+
+        test_cases = [
+            ("myapp.auth.us-east-1.amazoncognito.com", "us-east-1"),
+            ("myapp.auth-fips.us-gov-west-1.amazoncognito.com", "us-gov-west-1"),
+            ("login.us-gov-east-1.example.com", "us-gov-east-1"),
+        ]
+
+        for domain, expected_region in test_cases:
+            region_match = _COGNITO_REGION_RE.search(domain) or _AWS_REGION_RE.search(domain)
+            assert region_match is not None, f"Failed to match region in {domain}"
+            assert region_match.group(1) == expected_region
+
+
+class TestProviderDetection:
+    """Test OIDC provider type detection from the hostname."""
+
+    def test_known_providers_and_subdomains(self):
+        """Test that exact domains and their subdomains map to a provider."""
+        test_cases = [
+            ("company.okta.com", "okta"),
+            ("okta.com", "okta"),
+            ("oauth.id.jumpcloud.com", "jumpcloud"),
+            ("company.auth0.com", "auth0"),
+            ("login.microsoftonline.com", "azure"),
+            ("sts.windows.net", "azure"),
+            ("my-app.auth.us-east-1.amazoncognito.com", "cognito"),
+            ("cognito-idp.us-gov-west-1.amazonaws.com", "cognito"),
+        ]
+
+        for hostname, expected in test_cases:
+            assert detect_provider_type(hostname) == expected, f"Wrong provider for {hostname}"
+
+    def test_lookalike_and_unknown_domains(self):
+        """Test that look-alike and unknown hostnames are not matched."""
+        for hostname in ["evilokta.com", "okta.com.attacker.net", "auth.example.com", "amazonaws.com"]:
+            assert detect_provider_type(hostname) is None, f"Unexpected match for {hostname}"
+
+    def test_parse_provider_domain(self):
+        """Test that the scheme and trailing slash are dropped and the path is kept."""
+        test_cases = [
+            ("company.okta.com", ("company.okta.com", "company.okta.com")),
+            ("https://Company.Okta.com/", ("Company.Okta.com", "company.okta.com")),
+            ("http://auth.example.com:8443", ("auth.example.com:8443", "auth.example.com")),
+            (
+                "https://login.microsoftonline.com/Tenant-ID/v2.0/",
+                ("login.microsoftonline.com/Tenant-ID/v2.0", "login.microsoftonline.com"),
+            ),
+        ]
+
+        for value, expected in test_cases:
+            assert parse_provider_domain(value) == expected, f"Wrong split for {value}"
+
 
 class TestInitCommandRegression:
     """Regression tests to prevent the lambda scoping issue from recurring."""
@@ -4,6 +4,7 @@
 """End-to-end tests for init command."""
 
 import sys
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -121,6 +122,260 @@ class TestInitCommandE2E:
         # and doesn't cause any import or scoping issues
         assert mock_progress("init") is not None
 
+    def test_update_success_printed_in_one_call(self):
+        """Test that the update confirmation and next steps are a single print."""
+        console = MagicMock()
+
+        InitCommand()._print_update_success(console, "acme-prod")
+
+        console.print.assert_called_once()
+        output = console.print.call_args.args[0]
+        assert "Profile 'acme-prod' updated successfully" in output
+        assert output.index("Next steps:") < output.index("poetry run ccwb test")
+
+    def test_update_flow_saves_once_after_review(self):
+        """Test that an update gathers, reviews and then saves the profile once."""
+        command = InitCommand()
+        config = {"okta": {"domain": "company.okta.com"}}
+
+        with (
+            patch.object(command, "_gather_configuration", return_value=config) as gather,
+            patch.object(command, "_review_configuration", return_value=True),
+            patch.object(command, "_save_configuration") as save,
+        ):
+            exit_code = command._run_update_flow(MagicMock(), {"existing": True}, "acme-prod", MagicMock())
+
+        assert exit_code == 0
+        assert gather.call_args.args[1] == {"existing": True}
+        save.assert_called_once_with(config, "acme-prod")
+
+    def test_cancelled_update_flow_does_not_save(self):
+        """Test that cancelling the wizard during an update leaves the profile alone."""
+        command = InitCommand()
+
+        with (
+            patch.object(command, "_gather_configuration", return_value=None),
+            patch.object(command, "_save_configuration") as save,
+        ):
+            exit_code = command._run_update_flow(MagicMock(), {}, "acme-prod", MagicMock())
+
+        assert exit_code == 1
+        save.assert_not_called()
+
+    def test_save_writes_global_config_once(self, tmp_path):
+        """Test that saving a profile writes it and the global config one time each."""
+        from claude_code_with_bedrock.config import Config
+
+        config_data = {
+            "okta": {"domain": "company.okta.com", "client_id": "0oa1234567890abcde"},
+            "aws": {
+                "region": "us-east-1",
+                "identity_pool_name": "claude-code-auth",
+                "stacks": {"auth": "claude-code-auth-stack"},
+                "allowed_bedrock_regions": ["us-east-1"],
+            },
+            "monitoring": {"enabled": False},
+        }
+
+        with (
+            patch.object(Config, "CONFIG_DIR", tmp_path),
+            patch.object(Config, "CONFIG_FILE", tmp_path / "config.json"),
+            patch.object(Config, "LEGACY_CONFIG_FILE", tmp_path / "legacy.json"),
+            patch.object(Config, "PROFILES_DIR", tmp_path / "profiles"),
+            patch.object(Config, "save", autospec=True, side_effect=Config.save) as save,
+        ):
+            InitCommand()._save_configuration(config_data, "acme-prod")
+            loaded = Config.load()
+
+        save.assert_called_once()
+        assert loaded.active_profile == "acme-prod"
+        assert (tmp_path / "profiles" / "acme-prod.json").exists()
+
+
+class TestPrerequisites:
+    """Test the prerequisites check."""
+
+    def _check(self, command, bedrock_access=True):
+        with (
+            patch("claude_code_with_bedrock.cli.utils.aws.get_current_region", return_value="us-east-1"),
+            patch("claude_code_with_bedrock.cli.utils.aws.check_bedrock_access", return_value=bedrock_access),
+            patch("rich.console.Console") as console_cls,
+        ):
+            passed = command._check_prerequisites()
+        return passed, " ".join(c.args[0] for c in console_cls.return_value.print.call_args_list)
+
+    def test_aws_cli_check_overlaps_credential_check(self):
+        """Test that the AWS CLI subprocess runs while the boto3 checks run."""
+        command = InitCommand()
+        credentials_checked = threading.Event()
+
+        def credentials():
+            credentials_checked.set()
+            return True
+
+        with (
+            patch.object(command, "_check_aws_cli", side_effect=lambda: credentials_checked.wait(5)),
+            patch.object(command, "_check_aws_credentials", side_effect=credentials),
+        ):
+            passed, output = self._check(command)
+
+        assert passed is True
+        assert output.index("AWS CLI installed") < output.index("AWS credentials configured")
+        assert "Bedrock access enabled in us-east-1" in output
+
+    def test_failed_required_check_fails_prerequisites(self):
+        """Test that a failed required check fails while missing Bedrock access only warns."""
+        command = InitCommand()
+
+        with (
+            patch.object(command, "_check_aws_cli", return_value=False),
+            patch.object(command, "_check_aws_credentials", return_value=True),
+        ):
+            passed, output = self._check(command, bedrock_access=False)
+
+        assert passed is False
+        assert "[red]✗[/red] AWS CLI installed" in output
+        assert "Bedrock access not verified" in output
+
+
+class TestAwsLookupCaching:
+    """Test that AWS lookups are made once per wizard run."""
+
+    def test_hosted_zones_listed_once(self):
+        """Test that the HTTPS and landing page steps share one Route53 listing."""
+        command = InitCommand()
+        client = MagicMock()
+        client.list_hosted_zones.return_value = {"HostedZones": [{"Id": "/hostedzone/Z1", "Name": "example.com."}]}
+
+        with patch("boto3.client", return_value=client):
+            first = command._get_hosted_zones()
+            second = command._list_hosted_zones()
+
+        assert first == second == [{"Id": "/hostedzone/Z1", "Name": "example.com."}]
+        client.list_hosted_zones.assert_called_once_with()
+
+    def test_failed_hosted_zone_listing_is_retried(self):
+        """Test that a failed listing returns no zones and isn't cached."""
+        command = InitCommand()
+        client = MagicMock()
+        client.list_hosted_zones.side_effect = [Exception("throttled"), {"HostedZones": []}]
+
+        with patch("boto3.client", return_value=client):
+            assert command._get_hosted_zones() == []
+            assert command._get_hosted_zones() == []
+
+        assert client.list_hosted_zones.call_count == 2
+
+    def test_subnets_listed_once_per_vpc(self):
+        """Test that subnets are fetched once for each (region, VPC) pair."""
+        command = InitCommand()
+        subnet = {"id": "subnet-1", "availability_zone": "us-east-1a"}
+
+        with patch("claude_code_with_bedrock.cli.utils.aws.get_subnets", return_value=[subnet]) as get_subnets:
+            assert command._get_subnets("us-east-1", "vpc-1") == [subnet]
+            assert command._get_subnets("us-east-1", "vpc-1") == [subnet]
+            command._get_subnets("us-east-1", "vpc-2")
+
+        assert [c.args for c in get_subnets.call_args_list] == [("us-east-1", "vpc-1"), ("us-east-1", "vpc-2")]
+
+    def test_vpc_listing_reads_every_page(self):
+        """Test that get_vpcs follows pagination instead of stopping at the first page."""
+        from claude_code_with_bedrock.cli.utils.aws import get_vpcs
+
+        client = MagicMock()
+        client.get_paginator.return_value.paginate.return_value.search.return_value = iter(
+            [
+                {"VpcId": "vpc-2", "CidrBlock": "10.1.0.0/16", "State": "available"},
+                {"VpcId": "vpc-1", "CidrBlock": "10.0.0.0/16", "State": "available", "IsDefault": True},
+            ]
+        )
+
+        with patch("boto3.client", return_value=client):
+            vpcs = get_vpcs("us-east-1")
+
+        client.get_paginator.assert_called_once_with("describe_vpcs")
+        assert [vpc["id"] for vpc in vpcs] == ["vpc-1", "vpc-2"]
+
+    def test_prefetched_lookups_are_reused(self):
+        """Test that the monitoring prefetch fills the VPC and hosted zone lookups."""
+        command = InitCommand()
+        client = MagicMock()
+        client.list_hosted_zones.return_value = {"HostedZones": [{"Id": "/hostedzone/Z1", "Name": "example.com."}]}
+        vpc = {"id": "vpc-1", "cidr": "10.0.0.0/16", "is_default": True, "name": "", "state": "available"}
+
+        with (
+            patch("boto3.client", return_value=client) as make_client,
+            patch("claude_code_with_bedrock.cli.utils.aws.get_vpcs", return_value=[vpc]) as get_vpcs,
+        ):
+            command._prefetch_monitoring_lookups("us-east-1")
+            assert command._get_vpcs("us-east-1") == [vpc]
+            assert command._get_hosted_zones() == [{"Id": "/hostedzone/Z1", "Name": "example.com."}]
+
+        # Clients come from the calling thread; only the API calls run in the background
+        assert make_client.call_count == 2
+        get_vpcs.assert_called_once_with("us-east-1", client)
+        client.list_hosted_zones.assert_called_once_with()
+        assert command._prefetches == {}
+
+    def test_landing_page_prefetch_supplies_account_and_zones(self):
+        """Test that the landing page prefetch serves the account ID and hosted zones."""
+        command = InitCommand()
+        client = MagicMock()
+        client.get_caller_identity.return_value = {"Account": "123456789012"}
+        client.list_hosted_zones.return_value = {"HostedZones": []}
+
+        with patch("boto3.client", return_value=client) as make_client:
+            command._prefetch_landing_page_lookups()
+            assert command._get_account_id() == "123456789012"
+            assert command._list_hosted_zones() == []
+            assert command._get_account_id() == "123456789012"
+
+        assert make_client.call_count == 2
+        client.get_caller_identity.assert_called_once_with()
+        client.list_hosted_zones.assert_called_once_with()
+
+    def test_account_id_from_credentials_check_is_reused(self):
+        """Test that the prerequisites check's STS call serves the rest of the wizard."""
+        command = InitCommand()
+        client = MagicMock()
+        client.get_caller_identity.return_value = {"Account": "123456789012"}
+
+        with patch("boto3.client", return_value=client):
+            assert command._check_aws_credentials()
+            command._prefetch_landing_page_lookups()
+            assert command._get_account_id() == "123456789012"
+
+        client.get_caller_identity.assert_called_once_with()
+        assert "caller_identity" not in command._prefetches
+
+    def test_cognito_validation_reuses_detected_outputs(self):
+        """Test that validating a detected Cognito stack doesn't describe it again."""
+        from claude_code_with_bedrock.cli.utils.aws import validate_cognito_stack_for_distribution
+
+        outputs = dict.fromkeys(
+            ["UserPoolId", "DistributionWebClientId", "UserPoolDomain", "DistributionWebClientSecretArn"], "x"
+        )
+
+        with patch("claude_code_with_bedrock.cli.utils.aws.get_stack_outputs") as get_outputs:
+            is_valid, _message = validate_cognito_stack_for_distribution("cognito-stack", "us-east-1", outputs)
+
+        assert is_valid
+        get_outputs.assert_not_called()
+
+    def test_executor_shut_down_when_command_finishes(self):
+        """Test that handle() releases the prefetch workers however the wizard ends."""
+        command = InitCommand()
+        executor = command._executor
+
+        with (
+            patch("claude_code_with_bedrock.cli.commands.init.WizardProgress"),
+            patch.object(command, "_handle_with_progress", side_effect=RuntimeError("boom")),
+        ):
+            assert command.handle() == 1
+
+        assert executor._shutdown
+        assert "_executor" not in command.__dict__
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,234 @@
+# ABOUTME: Tests for batched CloudFormation stack deletion polling
+# ABOUTME: Covers one DescribeStacks listing per poll, completion detection, and status caching
+
+"""Tests for CloudFormationManager deletion helpers and stack status caching."""
+
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
+
+
+def _manager(pages_per_poll):
+    manager = CloudFormationManager(region="us-east-1")
+    manager._cf_client = MagicMock()
+    manager._cf_client.get_paginator.return_value.paginate.side_effect = pages_per_poll
+    return manager
+
+
+def _stack(name, status):
+    return {"StackName": name, "StackStatus": status}
+
+
+class TestWaitForDeletes:
+    """Test polling several deletions together."""
+
+    def test_missing_stacks_are_deleted_and_failures_reported(self):
+        manager = _manager(
+            [
+                [{"Stacks": [_stack("a", "DELETE_IN_PROGRESS")]}, {"Stacks": [_stack("b", "DELETE_IN_PROGRESS")]}],
+                [{"Stacks": [_stack("b", "DELETE_FAILED"), _stack("other", "CREATE_COMPLETE")]}],
+            ]
+        )
+        seen = []
+
+        with patch("claude_code_with_bedrock.cli.utils.cloudformation.time.sleep") as sleep:
+            results = manager.wait_for_deletes(["a", "b"], on_status=lambda name, status: seen.append((name, status)))
+
+        assert results == {"a": "DELETE_COMPLETE", "b": "DELETE_FAILED"}
+        assert seen == [
+            ("a", "DELETE_IN_PROGRESS"),
+            ("b", "DELETE_IN_PROGRESS"),
+            ("a", "DELETE_COMPLETE"),
+            ("b", "DELETE_FAILED"),
+        ]
+        # One listing per poll regardless of how many stacks are pending
+        assert manager._cf_client.get_paginator.call_count == 2
+        sleep.assert_called_once_with(5)
+
+    def test_poll_interval_backs_off_to_cap(self):
+        in_progress = [{"Stacks": [_stack("a", "DELETE_IN_PROGRESS")]}]
+        manager = _manager([in_progress] * 5 + [[{"Stacks": []}]])
+
+        with patch("claude_code_with_bedrock.cli.utils.cloudformation.time.sleep") as sleep:
+            results = manager.wait_for_deletes(["a"], timeout=3600)
+
+        assert results == {"a": "DELETE_COMPLETE"}
+        assert [c.args[0] for c in sleep.call_args_list] == [5, 10, 20, 30, 30]
+
+    def test_timeout_returns_last_seen_status(self):
+        manager = _manager([[{"Stacks": [_stack("a", "DELETE_IN_PROGRESS")]}]])
+
+        with patch("claude_code_with_bedrock.cli.utils.cloudformation.time.sleep") as sleep:
+            results = manager.wait_for_deletes(["a"], timeout=0)
+
+        assert results == {"a": "DELETE_IN_PROGRESS"}
+        sleep.assert_not_called()
+
+    def test_failed_poll_is_retried(self):
+        throttled = ClientError({"Error": {"Code": "Throttling", "Message": "Rate exceeded"}}, "DescribeStacks")
+        manager = _manager(
+            [[{"Stacks": [_stack("a", "DELETE_IN_PROGRESS")]}], throttled, [{"Stacks": []}]],
+        )
+
+        with patch("claude_code_with_bedrock.cli.utils.cloudformation.time.sleep") as sleep:
+            results = manager.wait_for_deletes(["a"])
+
+        assert results == {"a": "DELETE_COMPLETE"}
+        # The failed poll still backs off before the next attempt
+        assert [c.args[0] for c in sleep.call_args_list] == [5, 10]
+
+    def test_polling_that_keeps_failing_returns_last_seen_status(self):
+        first_poll = [[{"Stacks": [_stack("a", "DELETE_IN_PROGRESS")]}]]
+
+        def paginate():
+            if first_poll:
+                return first_poll.pop()
+            raise EndpointConnectionError(endpoint_url="https://cloudformation.us-east-1.amazonaws.com")
+
+        manager = _manager(None)
+        manager._cf_client.get_paginator.return_value.paginate.side_effect = paginate
+        clock = iter(range(0, 1000, 10))
+
+        with (
+            patch("claude_code_with_bedrock.cli.utils.cloudformation.time.sleep"),
+            patch("claude_code_with_bedrock.cli.utils.cloudformation.time.monotonic", side_effect=lambda: next(clock)),
+        ):
+            results = manager.wait_for_deletes(["a"], timeout=100)
+
+        assert results == {"a": "DELETE_IN_PROGRESS"}
+        assert manager._cf_client.get_paginator.return_value.paginate.call_count > 2
+
+class TestListStackStatuses:
+    """Test the bulk status listing."""
+
+    def test_pages_are_merged_and_deleted_stacks_skipped(self):
+        manager = _manager(
+            [[{"Stacks": [_stack("a", "CREATE_COMPLETE")]}, {"Stacks": [_stack("b", "DELETE_COMPLETE")]}]]
+        )
+
+        assert manager.list_stack_statuses() == {"a": "CREATE_COMPLETE"}
+
+
+class TestGetFailedResources:
+    """Test collecting resources left behind by a failed delete."""
+
+    def test_failed_resources_collected_across_pages(self):
+        manager = _manager(
+            [
+                [
+                    {
+                        "StackResourceSummaries": [
+                            {
+                                "LogicalResourceId": "Bucket",
+                                "PhysicalResourceId": "my-bucket",
+                                "ResourceType": "AWS::S3::Bucket",
+                                "ResourceStatus": "DELETE_FAILED",
+                                "ResourceStatusReason": "not empty",
+                            },
+                            {
+                                "LogicalResourceId": "Role",
+                                "ResourceType": "AWS::IAM::Role",
+                                "ResourceStatus": "DELETE_COMPLETE",
+                            },
+                        ]
+                    },
+                    {
+                        "StackResourceSummaries": [
+                            {
+                                "LogicalResourceId": "Logs",
+                                "ResourceType": "AWS::Logs::LogGroup",
+                                "ResourceStatus": "DELETE_FAILED",
+                            }
+                        ]
+                    },
+                ]
+            ]
+        )
+
+        failed = manager.get_failed_resources("a")
+
+        manager._cf_client.get_paginator.assert_called_once_with("list_stack_resources")
+        assert failed == [
+            {
+                "logical_id": "Bucket",
+                "physical_id": "my-bucket",
+                "resource_type": "AWS::S3::Bucket",
+                "status_reason": "not empty",
+            },
+            {
+                "logical_id": "Logs",
+                "physical_id": "N/A",
+                "resource_type": "AWS::Logs::LogGroup",
+                "status_reason": "Unknown",
+            },
+        ]
+
+
+class TestInitiateDelete:
+    """Test issuing a delete without waiting."""
+
+    def test_returns_error_when_request_rejected(self):
+        manager = _manager([])
+        manager._cf_client.delete_stack.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied", "Message": "not allowed"}}, "DeleteStack"
+        )
+
+        result = manager.initiate_delete("a")
+
+        assert not result.success
+        assert result.error == "not allowed"
+
+
+class TestStackStatusCache:
+    """Test that repeated status lookups reuse a recent DescribeStacks result."""
+
+    def test_status_is_reused_until_stack_is_deleted(self):
+        manager = _manager([])
+        manager._cf_client.describe_stacks.return_value = {"Stacks": [_stack("a", "CREATE_COMPLETE")]}
+
+        assert manager.get_stack_status("a") == "CREATE_COMPLETE"
+        assert manager.get_stack_status("a") == "CREATE_COMPLETE"
+        assert manager._cf_client.describe_stacks.call_count == 1
+
+        manager.initiate_delete("a")
+        manager._cf_client.describe_stacks.return_value = {"Stacks": [_stack("a", "DELETE_IN_PROGRESS")]}
+
+        assert manager.get_stack_status("a") == "DELETE_IN_PROGRESS"
+        assert manager._cf_client.describe_stacks.call_count == 2
+
+    def test_status_expires_after_ttl(self):
+        manager = _manager([])
+        manager._cf_client.describe_stacks.return_value = {"Stacks": [_stack("a", "CREATE_COMPLETE")]}
+
+        with patch(
+            "claude_code_with_bedrock.cli.utils.cloudformation.time.monotonic", side_effect=[100.0, 101.0, 103.0, 103.0]
+        ):
+            manager.get_stack_status("a")
+            manager.get_stack_status("a")
+            manager.get_stack_status("a")
+
+        assert manager._cf_client.describe_stacks.call_count == 2
+
+    def test_missing_stack_is_cached_as_none(self):
+        manager = _manager([])
+        manager._cf_client.describe_stacks.side_effect = ClientError(
+            {"Error": {"Code": "ValidationError", "Message": "Stack with id a does not exist"}}, "DescribeStacks"
+        )
+
+        assert manager.get_stack_status("a") is None
+        assert manager.get_stack_status("a") is None
+        assert manager._cf_client.describe_stacks.call_count == 1
+
+
+class TestClientConfig:
+    """Test the CloudFormation client is tuned for concurrent, throttled use."""
+
+    def test_adaptive_retries_and_pool_size(self):
+        client = CloudFormationManager(region="us-east-1").cf_client
+
+        assert client.meta.config.retries["mode"] == "adaptive"
+        # max_attempts counts retries, so the initial call plus 10 retries
+        assert client.meta.config.retries["total_max_attempts"] == 11
+        assert client.meta.config.max_pool_connections == 16
@@ -0,0 +1,89 @@
+# ABOUTME: Tests for in-process CloudFormation template packaging
+# ABOUTME: Covers zipping local Lambda code, content-addressed keys, and upload skipping
+
+"""Tests for CloudFormationManager.package_template."""
+
+import zipfile
+from unittest.mock import MagicMock
+
+import cfn_flip
+from botocore.exceptions import ClientError
+
+from claude_code_with_bedrock.cli.utils.cloudformation import CloudFormationManager
+
+TEMPLATE = """
+Resources:
+  FirstFunction:
+    Type: AWS::Lambda::Function
+    Properties:
+      Handler: index.handler
+      Code: ./lambda-functions/first/
+  SecondFunction:
+    Type: AWS::Lambda::Function
+    Properties:
+      Handler: index.handler
+      Role: !GetAtt FunctionRole.Arn
+      Code: ./lambda-functions/second/
+  SharedLayer:
+    Type: AWS::Lambda::LayerVersion
+    Properties:
+      Content: ./lambda-functions/layer/
+"""
+
+
+def _write_template(tmp_path):
+    for name, body in (("first", "A = 1\n"), ("second", "B = 2\n")):
+        (tmp_path / "lambda-functions" / name).mkdir(parents=True)
+        (tmp_path / "lambda-functions" / name / "index.py").write_text(body)
+    (tmp_path / "lambda-functions" / "layer" / "python").mkdir(parents=True)
+    (tmp_path / "lambda-functions" / "layer" / "python" / "utils.py").write_text("C = 3\n")
+    template_path = tmp_path / "template.yaml"
+    template_path.write_text(TEMPLATE)
+    return template_path
+
+
+def _manager(s3_client):
+    manager = CloudFormationManager(region="us-east-1")
+    manager._s3_client = s3_client
+    return manager
+
+
+def _missing(*_args, **_kwargs):
+    raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+
+
+class TestPackageTemplate:
+    """Test packaging of local Lambda code directories."""
+
+    def test_local_code_is_zipped_and_uploaded(self, tmp_path):
+        """Every local Code/Content path is uploaded and rewritten to an S3 location."""
+        s3_client = MagicMock()
+        s3_client.head_object.side_effect = _missing
+        uploads = {}
+
+        def upload_fileobj(fileobj, bucket, key, Config=None):
+            uploads[key] = zipfile.ZipFile(fileobj).namelist()
+
+        s3_client.upload_fileobj.side_effect = upload_fileobj
+
+        packaged = _manager(s3_client).package_template(_write_template(tmp_path), "bucket", "claude-code/test")
+        resources = cfn_flip.load_yaml(packaged)["Resources"]
+
+        first = resources["FirstFunction"]["Properties"]["Code"]
+        layer = resources["SharedLayer"]["Properties"]["Content"]
+        assert first["S3Bucket"] == "bucket"
+        assert first["S3Key"].startswith("claude-code/test/")
+        assert uploads[first["S3Key"]] == ["index.py"]
+        assert uploads[layer["S3Key"]] == ["python/utils.py"]
+        assert len(uploads) == 3
+        # Intrinsic functions survive the round trip
+        assert "!GetAtt" in packaged
+
+    def test_existing_artifacts_are_not_reuploaded(self, tmp_path):
+        """Content-addressed keys already in the bucket are skipped."""
+        s3_client = MagicMock()
+
+        _manager(s3_client).package_template(_write_template(tmp_path), "bucket", "prefix")
+
+        assert s3_client.head_object.call_count == 3
+        s3_client.upload_fileobj.assert_not_called()
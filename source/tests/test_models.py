@@ -8,6 +8,7 @@ import pytest
 from claude_code_with_bedrock.models import (
     CLAUDE_MODELS,
     DEFAULT_REGIONS,
+    MODEL_ID_TO_KEY,
     get_all_model_display_names,
     get_available_profiles_for_model,
     get_default_region_for_profile,
@@ -196,6 +197,14 @@ class TestModelConfiguration:
         assert display_names["eu.anthropic.claude-sonnet-4-20250514-v1:0"] == "Claude Sonnet 4 (EUROPE)"
         assert display_names["apac.anthropic.claude-3-7-sonnet-20250219-v1:0"] == "Claude 3.7 Sonnet (APAC)"
 
+    def test_model_id_to_key(self):
+        """Test that every profile's model ID maps back to its model key."""
+        for model_key, model_config in CLAUDE_MODELS.items():
+            for profile_config in model_config["profiles"].values():
+                assert MODEL_ID_TO_KEY[profile_config["model_id"]] == model_key
+
+        assert MODEL_ID_TO_KEY.get("unknown-model-id") is None
+
     def test_get_profile_description(self):
         """Test getting profile descriptions."""
         # Test valid combinations
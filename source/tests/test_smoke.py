@@ -4,6 +4,7 @@
 """Comprehensive smoke tests to catch errors before commit."""
 
 import importlib
+import subprocess
 import sys
 from pathlib import Path
 
@@ -241,6 +242,32 @@ class TestCommandImports:
         except Exception as e:
             pytest.fail(f"Failed to import main CLI module: {e}")
 
+    def test_registered_commands_resolve(self):
+        """Test that every lazily registered command name resolves to a command with that name."""
+        from claude_code_with_bedrock.cli import COMMANDS, create_application
+
+        app = create_application()
+        for name in COMMANDS:
+            assert app.find(name).name == name
+
+    def test_running_one_command_imports_only_its_module(self):
+        """Test that command modules (and boto3) are imported only when their command is run."""
+        code = (
+            "import sys\n"
+            "from cleo.io.buffered_io import BufferedIO\n"
+            "from cleo.io.inputs.argv_input import ArgvInput\n"
+            "from claude_code_with_bedrock.cli import create_application\n"
+            "app = create_application()\n"
+            "app.auto_exits(False)\n"
+            "io = BufferedIO()\n"
+            "app.run(ArgvInput(['ccwb', 'init', '--help']), io.output, io.error_output)\n"
+            "prefix = 'claude_code_with_bedrock.cli.commands.'\n"
+            "print(sorted(m for m in sys.modules if m == 'boto3' or m.startswith(prefix)))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "['claude_code_with_bedrock.cli.commands.init']"
+
     def test_all_quota_commands_registered(self):
         """Test that all quota commands are properly defined.
 
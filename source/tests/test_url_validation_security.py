@@ -3,6 +3,8 @@
 
 from urllib.parse import urlparse
 
+from claude_code_with_bedrock.utils.url_validation import ensure_url_scheme
+
 
 def detect_provider_type_insecure(domain: str) -> str:
     """Current INSECURE implementation - vulnerable to bypass"""
@@ -247,3 +249,19 @@ class TestCredentialSanitization:
         required_fields = ["Version", "AccessKeyId", "SecretAccessKey", "SessionToken", "Expiration"]
         for field in required_fields:
             assert field in original, f"Missing required field: {field}"
+
+
+class TestEnsureUrlScheme:
+    """Test the shared scheme normalization helper."""
+
+    def test_bare_hostname_gets_https(self):
+        assert ensure_url_scheme("company.okta.com") == "https://company.okta.com"
+
+    def test_existing_scheme_preserved(self):
+        assert ensure_url_scheme("https://company.okta.com") == "https://company.okta.com"
+        assert ensure_url_scheme("http://localhost:8080") == "http://localhost:8080"
+        assert ensure_url_scheme("HTTPS://Company.okta.com") == "HTTPS://Company.okta.com"
+
+    def test_empty_values_unchanged(self):
+        assert ensure_url_scheme("") == ""
+        assert ensure_url_scheme(None) is None